@@ -0,0 +1,127 @@
+# api/async_views.py
+from asgiref.sync import markcoroutinefunction, sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from rest_framework import exceptions
+from rest_framework.response import Response
+
+# DRF view'ları için async okuma yolu (ASGI, ASYNC_READ_VIEWS).
+#
+# DRF'in dispatch'i senkron; bu mixin view'ı Django'ya async view olarak
+# tanıtır ve async_actions içindeki action'ları (viewset'lerde 'list',
+# 'retrieve'; APIView'larda HTTP method'u, örn. 'get') event loop'ta
+# çalıştırır. Handler'lar `a<action>` adıyla tanımlanır (alist, aget, ...).
+#
+# Async yol DRF'in dispatch / initial adımlarının aynısıdır: content
+# negotiation, authentication, permission ve throttle kontrolleri,
+# handle_exception ve finalize_response aynen çalışır; sadece veritabanı
+# okumaları async ORM ile yapılır. Authenticator'ın aauthenticate'i varsa
+# o kullanılır, yoksa authenticate thread'de çalışır.
+#
+# Permission sınıfları ve get_queryset senkron kalır; ihtiyaç duydukları veri
+# (örn. üyelik) aprefetch() içinde önceden yüklenmelidir. Async yolda
+# senkron bir sorgu çalışırsa Django SynchronousOnlyOperation fırlatır.
+#
+# Diğer action'lar (yazmalar, özel action'lar) normal DRF dispatch'iyle
+# thread'de çalışır; davranışları değişmez.
+#
+# WSGI altında async view her istekte ayrı bir event loop açar; bu yüzden
+# sadece ASGI sunucusunda kullanılmalıdır (bkz. api/serving.py).
+
+
+class AsyncAPIViewMixin:
+
+    async_actions = ()
+
+    @classmethod
+    def as_view(cls, *args, **initkwargs):
+        # ViewSet / APIView as_view'ı senkron bir fonksiyon döndürür; dispatch
+        # coroutine döndürdüğü için Django'ya async view olarak işaretlenir
+        return markcoroutinefunction(super().as_view(*args, **initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        name = getattr(self, 'action', None) or request.method.lower()
+        if name not in self.async_actions:
+            return await sync_to_async(super().dispatch)(request, *args, **kwargs)
+
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+            response = await getattr(self, f'a{name}')(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def ainitial(self, request, *args, **kwargs):
+        """APIView.initial ile aynı sıra; authentication async."""
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await self.aperform_authentication(request)
+        await self.aprefetch(request)
+        self.check_permissions(request)
+        self.check_throttles(request)
+
+    async def aperform_authentication(self, request):
+        # Request._authenticate'in async hali
+        for authenticator in request.authenticators:
+            if hasattr(authenticator, 'aauthenticate'):
+                authenticate = authenticator.aauthenticate
+            else:
+                authenticate = sync_to_async(authenticator.authenticate)
+            try:
+                user_auth_tuple = await authenticate(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        request._not_authenticated()
+
+    async def aprefetch(self, request):
+        """Permission'ların ve get_queryset'in senkron okuyacağı veriyi yükler."""
+
+    async def aget_object(self):
+        """GenericAPIView.get_object'in async hali."""
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+
+        try:
+            obj = await queryset.aget(**filter_kwargs)
+        except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+            raise Http404
+
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    async def apaginate_queryset(self, queryset):
+        if self.paginator is None:
+            return None
+        return await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+
+    async def alist_response(self, queryset):
+        """ListModelMixin.list'in sayfalama + serializer kısmı."""
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer([obj async for obj in queryset], many=True)
+        return Response(serializer.data)
@@ -0,0 +1,84 @@
+# api/encoders.py
+import json
+from functools import lru_cache
+
+from django.utils.module_loading import import_string
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # opsiyonel bağımlılık
+    orjson = None
+
+# CustomJSONRenderer'ın kullandığı JSON encoder'lar.
+#
+# Hepsi DRF JSONRenderer'ın varsayılan (compact, UNICODE_JSON, STRICT_JSON)
+# çıktısıyla byte-byte aynı sonucu üretir; settings.JSON_ENCODER ile seçilir:
+#   'auto'   : orjson kuruluysa OrjsonEncoder, değilse StdlibEncoder
+#   'stdlib' / 'orjson' ya da bir sınıfın import yolu
+
+
+class StdlibEncoder:
+
+    name = 'stdlib'
+
+    def encode(self, data):
+        ret = json.dumps(
+            data,
+            cls=JSONEncoder,
+            ensure_ascii=not api_settings.UNICODE_JSON,
+            allow_nan=not api_settings.STRICT_JSON,
+            separators=(',', ':') if api_settings.COMPACT_JSON else (', ', ': '),
+        )
+        # DRF ile aynı: JavaScript'te geçersiz olan satır ayırıcılar escape edilir
+        ret = ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029')
+        return ret.encode()
+
+
+class OrjsonEncoder:
+
+    """
+    Datetime/date/time tipleri orjson'un kendi formatı yerine DRF encoder'ına
+    bırakılır ("...Z" gösterimi). orjson'un yazamadığı değerlerde (64 bitten
+    büyük int vb.) StdlibEncoder'a düşülür.
+
+    Tek fark: NaN/Infinity float'ları DRF'teki gibi hata vermez, null yazılır
+    (modellerde float alan yok).
+    """
+
+    name = 'orjson'
+    options = (
+        (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+    )
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('OrjsonEncoder için orjson paketi kurulmalı.')
+        self.default = JSONEncoder().default
+        self.fallback = StdlibEncoder()
+
+    def encode(self, data):
+        if not (api_settings.UNICODE_JSON and api_settings.COMPACT_JSON):
+            return self.fallback.encode(data)
+        try:
+            ret = orjson.dumps(data, default=self.default, option=self.options)
+        except (orjson.JSONEncodeError, TypeError):
+            return self.fallback.encode(data)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+BACKENDS = {
+    StdlibEncoder.name: StdlibEncoder,
+    OrjsonEncoder.name: OrjsonEncoder,
+}
+
+
+@lru_cache(maxsize=None)
+def get_encoder(name='auto'):
+    if name == 'auto':
+        name = OrjsonEncoder.name if orjson is not None else StdlibEncoder.name
+    encoder_class = BACKENDS.get(name) or import_string(name)
+    return encoder_class()
@@ -0,0 +1,254 @@
+# api/log.py
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+
+from . import metrics
+
+# LOG_MODE=queue için logging bileşenleri (bkz. settings.LOGGING).
+#
+# İstek thread'i sadece kaydı sınırlı bir kuyruğa koyar; biçimlendirme
+# (JSON) ve dosyaya yazma arka plandaki listener thread'inde (toplu yazım) yapılır.
+# Kuyruk doluysa kayıt beklenmeden atılır ve sayılır (GET /api/metrics/
+# içinde "logging"). Yüksek hacimli INFO kayıtları LOG_INFO_SAMPLE_RATE
+# ile örneklenebilir; WARNING ve üstü her zaman yazılır.
+
+# LogRecord'un kendi alanları; bunların dışındakiler extra={} ile gelmiştir
+RESERVED_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {
+    'message', 'asctime', 'taskName',
+}
+
+
+class JSONFormatter(logging.Formatter):
+
+    """Her kaydı tek satır JSON olarak yazar; extra alanlar da eklenir."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry['stack_info'] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class InfoSamplingFilter(logging.Filter):
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno != logging.INFO or self.rate >= 1 or random.random() < self.rate
+
+
+class LogStats:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.dropped = 0
+        self.sampled_out = 0
+
+    def add(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self):
+        return {
+            'queued': self.queued,
+            'dropped': self.dropped,
+            'sampled_out': self.sampled_out,
+        }
+
+
+stats = LogStats()
+metrics.register('logging', stats.snapshot)
+
+
+class BatchWriteMixin:
+
+    """
+    Listener kuyruktaki kayıtları toplu alır; hepsi tek write + flush ile
+    yazılır ve rotasyon kontrolü batch başına bir kez yapılır (stdlib
+    RotatingFileHandler her kayıtta seek + tekrar format yapıyordu).
+    """
+
+    terminator = '\n'
+
+    def emit_batch(self, records):
+        lines = []
+        for record in records:
+            # Biçimlendirilemeyen kayıt batch'in geri kalanını engellemesin
+            try:
+                lines.append(self.format(record) + self.terminator)
+            except Exception:
+                self.handleError(record)
+        if not lines:
+            return
+
+        text = ''.join(lines)
+        try:
+            self.acquire()
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                if self.needs_rollover(records[-1], text):
+                    self.doRollover()
+                    if self.stream is None:
+                        self.stream = self._open()
+                self.stream.write(text)
+                self.stream.flush()
+            finally:
+                self.release()
+        except Exception:
+            self.handleError(records[-1])
+
+
+class RotatingJSONFileHandler(BatchWriteMixin, logging.handlers.RotatingFileHandler):
+
+    def needs_rollover(self, record, text):
+        if self.maxBytes <= 0:
+            return False
+        self.stream.seek(0, 2)
+        position = self.stream.tell()
+        return position > 0 and position + len(text.encode('utf-8')) >= self.maxBytes
+
+
+class TimedRotatingJSONFileHandler(BatchWriteMixin, logging.handlers.TimedRotatingFileHandler):
+
+    def needs_rollover(self, record, text):
+        return self.shouldRollover(record)
+
+
+class StreamJSONHandler(BatchWriteMixin, logging.StreamHandler):
+
+    """stdout'a yazar; dosya ve rotasyon container'ın log sürücüsündedir."""
+
+    def needs_rollover(self, record, text):
+        return False
+
+
+def build_file_handler(filename, max_bytes=0, backup_count=5, when=None):
+    # filename verilmezse stdout (LOG_TARGET=stdout)
+    if filename is None:
+        handler = StreamJSONHandler(sys.stdout)
+    # when verilirse zaman bazlı (örn. 'midnight'), yoksa boyut bazlı rotasyon
+    elif when:
+        handler = TimedRotatingJSONFileHandler(
+            filename, when=when, backupCount=backup_count, encoding='utf-8', delay=True,
+        )
+    else:
+        handler = RotatingJSONFileHandler(
+            filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True,
+        )
+    handler.setFormatter(JSONFormatter())
+    return handler
+
+
+class BatchQueueListener:
+
+    """Kuyruğu arka plan thread'inde boşaltıp target.emit_batch() çağırır."""
+
+    sentinel = None
+    batch_size = 500
+
+    def __init__(self, queue_, target):
+        self.queue = queue_
+        self.target = target
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._monitor, name='log-listener', daemon=True)
+        self._thread.start()
+
+    def _monitor(self):
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [record for record in batch if record is not self.sentinel]
+            if records:
+                self.target.emit_batch(records)
+            if len(records) != len(batch):
+                return
+
+    def stop(self):
+        if self._thread is None:
+            return
+        # Kuyruk doluysa boşalmasını bekler; kalan kayıtlar yazılır
+        self.queue.put(self.sentinel)
+        self._thread.join()
+        self._thread = None
+
+
+class QueueHandler(logging.Handler):
+
+    """
+    settings.LOGGING içinde kullanılan handler. Kuyruğu, hedef dosya
+    handler'ını ve listener thread'ini kendisi kurar:
+
+        'class': 'api.log.QueueHandler',
+        'filename': ..., 'max_bytes': ..., 'when': None, 'queue_size': 10000
+
+    logging.handlers.QueueHandler'dan türemez: Python 3.12+ dictConfig o
+    sınıfın alt sınıflarını kendi queue / listener ayarlarıyla kurmaya çalışır
+    ve bu parametrelerle hata verir.
+
+    Her process kendi listener'ını çalıştırır; aynı dosyayı birden fazla
+    process döndürürse satırlar kaybolur. Bu yüzden gunicorn birden fazla
+    worker ile çalışırken filename=None ile stdout'a yazılır (LOG_TARGET).
+    """
+
+    def __init__(self, filename, max_bytes=0, backup_count=5, when=None,
+                 queue_size=10000, sample_rate=1.0, target=None):
+        super().__init__()
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.sampler = InfoSamplingFilter(sample_rate)
+        self.target = target or build_file_handler(filename, max_bytes, backup_count, when)
+        self.listener = BatchQueueListener(self.queue, self.target)
+        self.listener.start()
+        atexit.register(self.stop)
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            stats.add('dropped')
+        else:
+            stats.add('queued')
+
+    def emit(self, record):
+        if not self.sampler.filter(record):
+            stats.add('sampled_out')
+            return
+        # Biçimlendirme listener thread'inde yapılır
+        self.enqueue(record)
+
+    def stop(self):
+        # Kuyrukta kalan kayıtlar yazılır (shutdown sırasında)
+        self.listener.stop()
+        self.target.close()
+
+    def close(self):
+        self.stop()
+        super().close()
@@ -0,0 +1,45 @@
+# api/metrics.py
+import threading
+
+# Cache katmanları vb. kendi sayaçlarını buraya kaydeder;
+# GET /api/metrics/ (api/views.py) hepsini tek yanıtta döner.
+# Sayaçlar process bazlıdır. Bu modül DRF'e bağımlı değildir; authentication
+# sınıfları da sayaç kaydedebilir (import döngüsü olmadan).
+_collectors = {}
+
+
+def register(name, collector):
+    _collectors[name] = collector
+
+
+def collect():
+    return {name: collector() for name, collector in sorted(_collectors.items())}
+
+
+class HitMissCounter:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def snapshot(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / total, 4) if total else None,
+        }
@@ -0,0 +1,134 @@
+# api/pagination.py
+from django.conf import settings
+from rest_framework import pagination
+from rest_framework.pagination import _reverse_ordering
+
+
+class CursorPagination(pagination.CursorPagination):
+
+    """
+    Liste endpoint'leri için keyset (cursor) sayfalama.
+
+    OFFSET yerine son görülen satırın sıralama değerinden devam eder; böylece
+    sayfa numarası büyüdükçe sorgu yavaşlamaz. Varsayılan sıralama
+    modellerdeki "-created_at" sıralamasıdır, eşitlikleri "id" bozar.
+
+    View üzerinde `ordering` tanımlıysa veya istemci ?ordering= gönderirse
+    (OrderingFilter) o sıralama kullanılır. Sayfa boyutu ?page_size= ile
+    seçilebilir, settings.API_MAX_PAGE_SIZE ile sınırlandırılır.
+
+    paginate_queryset DRF'teki ile aynıdır; sadece sayfa sorgusunu kuran ve
+    sonuçtan next/previous konumlarını hesaplayan iki parçaya bölünmüştür.
+    Böylece async view'lar (api/async_views.py) aynı sayfayı async ORM ile
+    okuyabilir (apaginate_queryset).
+
+    Yanıt CustomJSONRenderer zarfının içine girer:
+    {
+      "success": true,
+      "message": "İşlem başarılı.",
+      "data": {"next": ..., "previous": ..., "results": [...]}
+    }
+    """
+
+    ordering = ('-created_at', '-id')
+    page_size_query_param = 'page_size'
+
+    @property
+    def max_page_size(self):
+        return settings.API_MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+
+        # Aynı değere sahip satırlar arasında sıranın her sayfada aynı
+        # kalması için benzersiz bir alanla (id) sıralamayı tamamlıyoruz.
+        if not any(field.lstrip('-') in ('id', 'pk') for field in ordering):
+            tie_breaker = '-id' if ordering[0].startswith('-') else 'id'
+            ordering = (*ordering, tie_breaker)
+
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+        return self.set_page([obj async for obj in queryset])
+
+    def get_page_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+        self._page_state = (offset, reverse, current_position)
+
+        # Cursor sayfalamada sıralama her zaman uygulanır
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        # Cursor bir konum taşıyorsa o konumdan devam edilir
+        if current_position is not None:
+            order = self.ordering[0]
+            is_reversed = order.startswith('-')
+            order_attr = order.lstrip('-')
+
+            if self.cursor.reverse != is_reversed:
+                kwargs = {order_attr + '__lt': current_position}
+            else:
+                kwargs = {order_attr + '__gt': current_position}
+
+            queryset = queryset.filter(**kwargs)
+
+        # Sonraki sayfa var mı diye bir satır fazla okunur
+        return queryset[offset:offset + self.page_size + 1]
+
+    def set_page(self, results):
+        offset, reverse, current_position = self._page_state
+        self.page = list(results[:self.page_size])
+
+        # Sayfadan sonraki ilk satırın konumu
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            # Ters sorgunun sonucu istemciye doğru sırayla döner
+            self.page = list(reversed(self.page))
+
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
@@ -1,5 +1,12 @@
 # api/renderers.py
+from django.conf import settings
 from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+from .encoders import get_encoder
+from .timing import phase
+
+DEFAULT_MESSAGE = 'İşlem başarılı.'
 
 
 class CustomJSONRenderer(JSONRenderer):
@@ -15,9 +22,19 @@ class CustomJSONRenderer(JSONRenderer):
     Hatalar (exception=True) global exception handler'dan zaten
     {"success": false, "message": ..., "errors": ...} formatında geliyor,
     onları aynen bıraktık.
+
+    Başarılı yanıtlarda zarf dict olarak kurulmaz: message ve data ayrı ayrı
+    settings.JSON_ENCODER ile encode edilip byte olarak birleştirilir
+    (bkz. api/encoders.py). Payload değiştirilmez; "message" anahtarı varsa
+    sadece üst seviye anahtarlardan yeni bir dict oluşturulur.
     """
 
     def render(self, data, accepted_media_type=None, renderer_context=None):
+        # SERVER_TIMING_ENABLED açıksa süre "render" fazına yazılır
+        with phase('render'):
+            return self.render_envelope(data, accepted_media_type, renderer_context)
+
+    def render_envelope(self, data, accepted_media_type=None, renderer_context=None):
         renderer_context = renderer_context or {}
         response = renderer_context.get('response')
 
@@ -31,14 +48,22 @@ class CustomJSONRenderer(JSONRenderer):
 
        
         message = None
-        if isinstance(data, dict):
-
-            message = data.pop('message', None)
+        if isinstance(data, dict) and 'message' in data:
+            message = data['message']
+            data = {key: value for key, value in data.items() if key != 'message'}
+        message = message or DEFAULT_MESSAGE
 
-        envelope = {
-            'success': True,
-            'message': message or 'İşlem başarılı.',
-            'data': data,
-        }
+        # ?indent / browsable API gibi compact olmayan çıktılar eski yoldan
+        if (not api_settings.COMPACT_JSON
+                or self.get_indent(accepted_media_type, renderer_context) is not None):
+            envelope = {'success': True, 'message': message, 'data': data}
+            return super().render(envelope, accepted_media_type, renderer_context)
 
-        return super().render(envelope, accepted_media_type, renderer_context)
+        encoder = get_encoder(settings.JSON_ENCODER)
+        return b''.join((
+            b'{"success":true,"message":',
+            encoder.encode(message),
+            b',"data":',
+            encoder.encode(data),
+            b'}',
+        ))
@@ -0,0 +1,263 @@
+# api/routing.py
+import base64
+import contextvars
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Read replica yönlendirmesi (DATABASE_REPLICAS, DATABASE_ROUTERS).
+#
+# ReplicaRoutingMiddleware her istek için karar verir:
+#   - GET/HEAD/OPTIONS istekleri okumalarını bir replica'dan yapar; istek
+#     boyunca aynı replica kullanılır.
+#   - Yazma istekleri (POST/PUT/PATCH/DELETE) tamamen primary'de çalışır ve
+#     isteği yapanı REPLICA_STICKY_SECONDS boyunca primary'ye sabitler:
+#     kullanıcı kendi değişikliğini eski (replica) veriyle görmez.
+#     İstek sahibi JWT'deki user_id'den (imza doğrulaması DRF'te yapılır;
+#     burada sadece yönlendirme için okunur) ya da session cookie'sinden
+#     belirlenir. Anahtar cache'te tutulur; birden fazla worker varsa
+#     cache paylaşımlı olmalıdır (Redis vb.).
+#   - Gecikmesi REPLICA_MAX_LAG_SECONDS'ı aşan ya da bağlanılamayan
+#     replica'lar rotasyondan çıkar; durum REPLICA_LAG_CHECK_INTERVAL
+#     saniyede bir yeniden ölçülür. Hiç replica kalmazsa primary kullanılır.
+#
+# İstek dışındaki kod (management komutları, WebSocket consumer'ları) her
+# zaman primary'den okur; istek içinde use_primary() ile zorlanabilir.
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Primary'de replay edilecek WAL yoksa gecikme 0; aksi halde son replay'den
+# bu yana geçen süre
+POSTGRES_LAG_SQL = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+class RoutingState:
+
+    __slots__ = ('primary', 'alias')
+
+    def __init__(self, primary):
+        self.primary = primary
+        self.alias = None
+
+
+_state = contextvars.ContextVar('db_routing', default=None)
+
+
+@contextmanager
+def use_primary():
+    """Blok içindeki okumalar (istek içinde olsa da) primary'den yapılır."""
+    token = _state.set(RoutingState(primary=True))
+    try:
+        yield
+    finally:
+        _state.reset(token)
+
+
+class RoutingStats:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = {'primary': 0, 'replica': 0, 'sticky': 0}
+
+    def add(self, name):
+        with self._lock:
+            self.counts[name] += 1
+
+    def reset(self):
+        with self._lock:
+            self.counts = dict.fromkeys(self.counts, 0)
+
+
+class ReplicaPool:
+
+    """Replica'ların gecikmesini ölçer; sağlıklı olanları döndürür."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.lag = {}
+        self.checked_at = {}
+
+    def measure_lag(self, alias):
+        connection = connections[alias]
+        if connection.vendor != 'postgresql':
+            return 0.0
+        with connection.cursor() as cursor:
+            cursor.execute(POSTGRES_LAG_SQL)
+            return float(cursor.fetchone()[0])
+
+    def check(self, alias):
+        try:
+            lag = self.measure_lag(alias)
+        except DatabaseError:
+            logger.exception('Replica %s is unreachable', alias)
+            lag = None
+
+        # İlk ölçümde sadece sağlıksızsa, sonra durum değiştikçe loglanır
+        was_healthy = self.is_healthy(alias) if alias in self.checked_at else True
+        self.lag[alias] = lag
+        self.checked_at[alias] = time.monotonic()
+        healthy = self.is_healthy(alias)
+        if was_healthy != healthy:
+            logger.warning(
+                'Replica %s %s rotation (lag=%s)',
+                alias, 'back in' if healthy else 'taken out of', lag,
+            )
+
+    def is_healthy(self, alias):
+        lag = self.lag.get(alias)
+        return lag is not None and lag <= settings.REPLICA_MAX_LAG_SECONDS
+
+    def healthy(self, aliases):
+        now = time.monotonic()
+        interval = settings.REPLICA_LAG_CHECK_INTERVAL
+        stale = [
+            alias for alias in aliases
+            if now - self.checked_at.get(alias, float('-inf')) >= interval
+        ]
+        # Aynı anda tek thread ölçer; diğerleri son bilinen durumu kullanır
+        if stale and self._lock.acquire(blocking=False):
+            try:
+                for alias in stale:
+                    self.check(alias)
+            finally:
+                self._lock.release()
+        return [alias for alias in aliases if self.is_healthy(alias)]
+
+    def reset(self):
+        self.lag.clear()
+        self.checked_at.clear()
+
+    def snapshot(self):
+        return {
+            alias: {'lag': self.lag.get(alias), 'healthy': self.is_healthy(alias)}
+            for alias in settings.DATABASE_REPLICAS
+        }
+
+
+stats = RoutingStats()
+pool = ReplicaPool()
+metrics.register('db_routing', lambda: {**stats.counts, 'replicas': pool.snapshot()})
+
+
+class ReplicaRouter:
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or state.primary:
+            return DEFAULT_DB_ALIAS
+        if state.alias is None:
+            healthy = pool.healthy(settings.DATABASE_REPLICAS)
+            state.alias = random.choice(healthy) if healthy else DEFAULT_DB_ALIAS
+        return state.alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replica'lar primary'nin kopyası
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
+
+
+def _sticky_cache():
+    return caches[settings.REPLICA_STICKY_CACHE_ALIAS]
+
+
+def _sticky_key(identity):
+    return f'db:primary:{identity}'
+
+
+def request_identity(request):
+    header = request.META.get('HTTP_AUTHORIZATION', '')
+    if header.startswith('Bearer '):
+        user_id = _token_user_id(header[7:])
+        if user_id is not None:
+            return f'user:{user_id}'
+    session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    if session_key:
+        return f'session:{session_key}'
+    return None
+
+
+def _token_user_id(token):
+    from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get(jwt_settings.USER_ID_CLAIM)
+    except (IndexError, ValueError, AttributeError):
+        return None
+
+
+class ReplicaRoutingMiddleware:
+
+    # ASGI'da async view'ların önünde senkron bir adaptör oluşmasın
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.DATABASE_REPLICAS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        identity, write, token = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.finish(identity, write, response)
+
+    async def __acall__(self, request):
+        identity, write, token = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self.finish(identity, write, response)
+
+    def start(self, request):
+        identity = request_identity(request)
+        write = request.method not in SAFE_METHODS
+
+        if write:
+            primary = True
+        elif identity is not None and _sticky_cache().get(_sticky_key(identity)):
+            primary = True
+            stats.add('sticky')
+        else:
+            primary = False
+        stats.add('primary' if primary else 'replica')
+
+        return identity, write, _state.set(RoutingState(primary))
+
+    def finish(self, identity, write, response):
+        if write and identity is not None:
+            _sticky_cache().set(_sticky_key(identity), True, settings.REPLICA_STICKY_SECONDS)
+        return response
@@ -0,0 +1,190 @@
+# api/serving.py
+import logging
+import os
+
+# Production sunucu profili (gunicorn.conf.py bu modülü kullanır).
+#
+# SERVER_MODE=wsgi : gunicorn + gthread worker'ları (sadece HTTP API)
+# SERVER_MODE=asgi : gunicorn + uvicorn worker'ları (HTTP + WebSocket)
+#
+# Worker / thread sayıları WEB_CONCURRENCY / GUNICORN_THREADS ile verilmezse
+# CPU sayısından hesaplanır. Django ayarları yüklenmeden okunduğu için
+# sadece ortam değişkenlerine bakar; settings.py de aynı fonksiyonları
+# kullanarak veritabanı bağlantı ayarlarını moda göre seçer.
+#
+# Paylaşımlı cache (CACHE_BACKEND) verilmemişse WEB_CONCURRENCY'siz tek worker
+# başlar; WEB_CONCURRENCY > 1 ile LocMemCache başlangıçta hata verir.
+
+logger = logging.getLogger(__name__)
+
+MODE_WSGI = 'wsgi'
+MODE_ASGI = 'asgi'
+
+WORKER_CLASSES = {
+    MODE_WSGI: 'gthread',
+    MODE_ASGI: 'uvicorn_worker.UvicornWorker',
+}
+APPS = {
+    MODE_WSGI: 'api.wsgi:application',
+    MODE_ASGI: 'api.asgi:application',
+}
+
+
+def server_mode(environ=os.environ):
+    mode = environ.get('SERVER_MODE', MODE_WSGI).lower()
+    if mode not in APPS:
+        raise ValueError(f'SERVER_MODE must be one of {sorted(APPS)}, got {mode!r}')
+    return mode
+
+
+def _int(environ, name):
+    value = environ.get(name)
+    return int(value) if value else None
+
+
+def cpu_count():
+    # Container'da CPU kısıtı varsa (sched_setaffinity) onu dikkate alır
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+LOCMEM_CACHE = 'django.core.cache.backends.locmem.LocMemCache'
+
+
+def process_local_cache(environ, name):
+    # settings.CACHES ile aynı varsayılan: LocMemCache her process'e ayrıdır
+    return 'locmem' in environ.get(name, LOCMEM_CACHE).lower()
+
+
+def needs_single_worker(environ=os.environ):
+    # Üyelik / kullanıcı cache'i ve replica sticky anahtarı 'default' cache'te;
+    # invalidation sadece yazan worker'ın cache'ini temizlerse diğerleri eski
+    # üyelikle yetki verir. Birden fazla worker paylaşımlı cache ister.
+    # ALLOW_PROCESS_LOCAL_CACHE=True: sadece okuma yapan ölçümler (benchmark_asgi)
+    if environ.get('ALLOW_PROCESS_LOCAL_CACHE', 'False') == 'True':
+        return False
+    return process_local_cache(environ, 'CACHE_BACKEND')
+
+
+def worker_count(mode, cpus, environ=os.environ):
+    configured = _int(environ, 'WEB_CONCURRENCY')
+    if configured:
+        return configured
+    if needs_single_worker(environ):
+        logger.warning(
+            'CACHE_BACKEND is a per-process LocMemCache; starting a single worker. '
+            'Set CACHE_BACKEND / CACHE_LOCATION to a shared cache (e.g. Redis) for more.'
+        )
+        return 1
+    # gthread: istek süresinin çoğu DB beklemesi, (2 x CPU) + 1 işlem.
+    # uvicorn: event loop CPU başına bir işlemle doyar.
+    if mode == MODE_ASGI:
+        return max(1, cpus)
+    return cpus * 2 + 1
+
+
+def thread_count(mode, environ=os.environ):
+    if mode == MODE_ASGI:
+        return 1
+    return _int(environ, 'GUNICORN_THREADS') or 4
+
+
+def check_shared_cache(workers, environ=os.environ):
+    # WEB_CONCURRENCY açıkça birden fazla verilmiş ama cache paylaşımlı değil
+    if workers > 1 and needs_single_worker(environ):
+        raise ValueError(
+            f'{workers} workers need a shared CACHE_BACKEND (e.g. '
+            'django.core.cache.backends.redis.RedisCache); LocMemCache is per process. '
+            'Set CACHE_BACKEND / CACHE_LOCATION or WEB_CONCURRENCY=1.'
+        )
+
+
+def response_cache_enabled(environ=os.environ):
+    # Yanıt cache'i process içi LocMemCache ise bir worker'daki nesil artışı
+    # diğerlerine ulaşmaz; birden fazla worker'da kapatılır (settings.py)
+    if environ.get('RESPONSE_CACHE_ENABLED', 'True') != 'True':
+        return False
+    workers = _int(environ, 'SERVER_WORKERS') or 1
+    return workers == 1 or not process_local_cache(environ, 'RESPONSE_CACHE_BACKEND')
+
+
+def worker_env(workers, environ=os.environ):
+    # Ayarlar fork'tan sonra her worker'da yüklenir (preload_app kapalı);
+    # worker sayısı response_cache_enabled için aktarılır
+    env = [f'SERVER_WORKERS={workers}']
+    # Her worker kendi log listener'ını çalıştırır; aynı dosyayı birden fazla
+    # worker döndürürse satırlar kaybolur. Worker'lar max_requests ile
+    # yenilendiğinden pid'li dosyalar da birikirdi; tek yazıcı stdout'tur.
+    if workers > 1:
+        env.append('LOG_TARGET=stdout')
+    return env
+
+
+def gunicorn_options(environ=os.environ, cpus=None):
+    mode = server_mode(environ)
+    cpus = cpus or cpu_count()
+    workers = worker_count(mode, cpus, environ)
+    check_shared_cache(workers, environ)
+    return {
+        'wsgi_app': APPS[mode],
+        'worker_class': WORKER_CLASSES[mode],
+        'workers': workers,
+        'raw_env': worker_env(workers, environ),
+        'threads': thread_count(mode, environ),
+        'bind': environ.get('GUNICORN_BIND', '0.0.0.0:8000'),
+        'timeout': _int(environ, 'GUNICORN_TIMEOUT') or 30,
+        'graceful_timeout': 30,
+        'keepalive': 5,
+        # Bellek sızıntılarına karşı worker'lar belirli istek sayısından
+        # sonra (hepsi aynı anda olmasın diye rastgele sapmayla) yenilenir
+        'max_requests': _int(environ, 'GUNICORN_MAX_REQUESTS') or 2000,
+        'max_requests_jitter': 200,
+        'accesslog': environ.get('GUNICORN_ACCESS_LOG') or None,
+        'errorlog': '-',
+        'worker_exit': worker_exit,
+    }
+
+
+def worker_exit(server, worker):
+    # Worker kapanırken kuyruktaki görev geçmişi yazılır (atexit'e ek olarak)
+    from apps.boards import history
+
+    history.writer.stop()
+
+
+def database_connection_options(environ=os.environ, debug=False):
+    """
+    DATABASES['default'] için bağlantı ayarları.
+
+    DB_POOL=True: psycopg 3 connection pool (psycopg[pool] gerekir); havuz
+    bağlantıyı istek sonunda geri alır, CONN_MAX_AGE 0 olmalıdır.
+    Aksi halde kalıcı bağlantı: DB_CONN_MAX_AGE saniye boyunca açık kalır,
+    CONN_HEALTH_CHECKS ile her istekte kullanmadan önce kontrol edilir.
+    ASGI'da ve runserver'da (DEBUG) her istek farklı thread'de
+    çalışabildiğinden kalıcı bağlantı varsayılan olarak kapalıdır; ASGI'da
+    havuz kullanılmalıdır.
+    """
+    if environ.get('DB_POOL', 'False') == 'True':
+        from psycopg_pool import ConnectionPool
+
+        pool_size = _int(environ, 'DB_POOL_MAX_SIZE') or (thread_count(MODE_WSGI, environ) + 2)
+        return {
+            'CONN_MAX_AGE': 0,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': _int(environ, 'DB_POOL_MIN_SIZE') or 2,
+                    'max_size': pool_size,
+                    'timeout': _int(environ, 'DB_POOL_TIMEOUT') or 10,
+                    # Havuzdan verilmeden önce bağlantı canlı mı kontrol edilir
+                    'check': ConnectionPool.check_connection,
+                },
+            },
+        }
+
+    default_age = '0' if debug or server_mode(environ) == MODE_ASGI else '60'
+    return {
+        'CONN_MAX_AGE': int(environ.get('DB_CONN_MAX_AGE', default_age)),
+        'CONN_HEALTH_CHECKS': True,
+    }
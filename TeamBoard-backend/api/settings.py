@@ -17,6 +17,10 @@ from pathlib import Path
 from django.core.management.utils import get_random_secret_key
 from dotenv import load_dotenv
 
+from api.serving import (
+    MODE_ASGI, database_connection_options, response_cache_enabled, server_mode,
+)
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -48,6 +52,8 @@ ALLOWED_HOSTS = ['*']
 # Application definition
 
 INSTALLED_APPS = [
+    # runserver'ı ASGI (HTTP + WebSocket) ile çalıştırır
+    'daphne',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -58,9 +64,12 @@ INSTALLED_APPS = [
     'rest_framework',
     'rest_framework.authtoken',
     'rest_framework_simplejwt',
+    # Logout'ta iptal edilen access / refresh token'lar (apps.accounts.authentication)
+    'rest_framework_simplejwt.token_blacklist',
     'django_filters',
     'drf_spectacular',
     'corsheaders',
+    'channels',
 
     #Local Apps
     'apps.accounts',
@@ -69,6 +78,10 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    # SERVER_TIMING_ENABLED değilse yüklenmez (api/timing.py)
+    'api.timing.ServerTimingMiddleware',
+    # DATABASE_REPLICAS boşsa yüklenmez (api/routing.py)
+    'api.routing.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -97,6 +110,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'api.wsgi.application'
+ASGI_APPLICATION = 'api.asgi.application'
 
 
 # Database
@@ -110,9 +124,111 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD', '#mypassword'),
         'HOST': os.getenv('POSTGRES_HOST', '#localhost'),
         'PORT': os.getenv('POSTGRES_PORT', '#5432'),
+        # Kalıcı bağlantı / havuz (bkz. api/serving.py, DB_CONN_MAX_AGE, DB_POOL)
+        **database_connection_options(debug=DEBUG),
+    }
+}
+
+# Read replica'lar (bkz. api/routing.py): DB_REPLICA_HOSTS=host1,host2
+# Testlerde replica'lar primary'nin test veritabanını kullanır (MIRROR).
+DATABASE_REPLICAS = []
+for index, host in enumerate(filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': host.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica_{index}')
+
+# Lokal testler için Postgres olmadan çalışabilmek adına (DB_ENGINE=sqlite)
+if os.getenv('DB_ENGINE', 'postgresql') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        },
+        # Aynı dosyaya ikinci bağlantı; yönlendirmeyi lokal denemek için
+        # DB_SQLITE_REPLICA=True (testler override_settings ile açar)
+        'replica': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'TEST': {'MIRROR': 'default'},
+        },
     }
+    DATABASE_REPLICAS = ['replica'] if os.getenv('DB_SQLITE_REPLICA', 'False') == 'True' else []
+
+DATABASE_ROUTERS = ['api.routing.ReplicaRouter']
+
+# Yazma isteğinden sonra kullanıcının okumaları bu süre boyunca primary'den
+REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', '10'))
+REPLICA_STICKY_CACHE_ALIAS = 'default'
+# Gecikmesi bunu aşan replica rotasyondan çıkar; ölçüm aralığı (sn)
+REPLICA_MAX_LAG_SECONDS = float(os.getenv('REPLICA_MAX_LAG_SECONDS', '5'))
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv('REPLICA_LAG_CHECK_INTERVAL', '10'))
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Varsayılan process içi LocMemCache; CACHE_BACKEND / CACHE_LOCATION ile
+# örn. FileBasedCache veya paylaşımlı bir cache seçilebilir.
+
+RESPONSE_CACHE_BACKEND = os.getenv(
+    'RESPONSE_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+)
+
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'teamboard'),
+    },
+    # Boards list/retrieve yanıtları (apps.boards.response_cache). Giriş sayısı
+    # sınırlı; dolunca eskiler atılır (Redis'te sınır maxmemory politikasıyla).
+    'responses': {
+        'BACKEND': RESPONSE_CACHE_BACKEND,
+        'LOCATION': os.getenv('RESPONSE_CACHE_LOCATION', 'teamboard-responses'),
+        'TIMEOUT': int(os.getenv('RESPONSE_CACHE_TIMEOUT', '300')),
+        'OPTIONS': {} if 'redis' in RESPONSE_CACHE_BACKEND.lower() else {
+            'MAX_ENTRIES': int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '5000')),
+        },
+    },
 }
 
+# Birden fazla gunicorn worker'ında RESPONSE_CACHE_BACKEND paylaşımlı değilse
+# (LocMemCache) kapalıdır
+RESPONSE_CACHE_ENABLED = response_cache_enabled()
+RESPONSE_CACHE_ALIAS = 'responses'
+# Bundan büyük yanıtlar saklanmaz (bellek kullanımı ~ MAX_ENTRIES x bu değer)
+RESPONSE_CACHE_MAX_ENTRY_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRY_BYTES', str(256 * 1024)))
+
+# Kullanıcı -> takım/rol cache'i (apps.boards.membership)
+MEMBERSHIP_CACHE_ALIAS = 'default'
+MEMBERSHIP_CACHE_TIMEOUT = int(os.getenv('MEMBERSHIP_CACHE_TIMEOUT', '300'))
+
+# JWT isteklerinde request.user cache'i (apps.accounts.authentication)
+AUTH_USER_CACHE_ALIAS = 'default'
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv('AUTH_USER_CACHE_TIMEOUT', '60'))
+# POST /api/auth/logout/ ile iptal edilen token'lar süreleri dolana kadar reddedilir
+AUTH_TOKEN_DENYLIST = os.getenv('AUTH_TOKEN_DENYLIST', 'True') == 'True'
+
+
+# WebSocket board olayları (apps.boards.realtime)
+# REDIS_URL verilirse olaylar Redis üzerinden tüm worker'lara dağıtılır;
+# verilmezse process içi InMemoryChannelLayer (tek worker / testler).
+
+if os.getenv('REDIS_URL'):
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {'hosts': [os.getenv('REDIS_URL')]},
+        }
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -157,7 +273,8 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # SimpleJWT + kısa süreli kullanıcı cache'i (apps.accounts.authentication)
+        'apps.accounts.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -165,7 +282,8 @@ REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
         'rest_framework.filters.OrderingFilter',
-        'rest_framework.filters.SearchFilter',        
+        # ?search=: görev/projelerde tam metin (apps.boards.search)
+        'apps.boards.search.FullTextSearchFilter',
     ],
 
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
@@ -175,12 +293,97 @@ REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': (
         'api.renderers.CustomJSONRenderer',
     ),
+
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.CursorPagination',
+    'PAGE_SIZE': int(os.getenv('API_PAGE_SIZE', '50')),
 }
 
+# CustomJSONRenderer encoder'ı: auto (orjson varsa), stdlib, orjson (bkz. api/encoders.py)
+JSON_ENCODER = os.getenv('JSON_ENCODER', 'auto')
+
+# Board / kullanıcı okuma endpoint'lerinin async sürümleri (api/async_views.py).
+# Sadece ASGI sunucusunda anlamlı; varsayılan olarak SERVER_MODE=asgi ise açık.
+ASYNC_READ_VIEWS = os.getenv(
+    'ASYNC_READ_VIEWS', str(server_mode() == MODE_ASGI)
+) == 'True'
+
+# Liste action'larını .values() satırlarından serileştir (api/values.py)
+VALUES_LIST_ENABLED = os.getenv('VALUES_LIST_ENABLED', 'True') == 'True'
+
+# İstemcinin ?page_size= ile isteyebileceği üst sınır
+API_MAX_PAGE_SIZE = int(os.getenv('API_MAX_PAGE_SIZE', '200'))
+
+# POST /api/tasks/bulk/ için tek istekteki en fazla işlem sayısı
+TASK_BULK_MAX_OPERATIONS = int(os.getenv('TASK_BULK_MAX_OPERATIONS', '200'))
+
+# Görev geçmişi (apps.boards.history): olaylar arka plan thread'inde toplu
+# yazılır. False ise commit sonrasında istek thread'inde yazılır.
+TASK_HISTORY_WRITE_BEHIND = os.getenv('TASK_HISTORY_WRITE_BEHIND', 'True') == 'True'
+TASK_HISTORY_BATCH_SIZE = int(os.getenv('TASK_HISTORY_BATCH_SIZE', '500'))
+# Kuyruktaki olay en geç bu kadar saniye sonra yazılır
+TASK_HISTORY_FLUSH_INTERVAL = float(os.getenv('TASK_HISTORY_FLUSH_INTERVAL', '1.0'))
+# Kuyruk doluysa olay atılır ve sayılır (/api/metrics/)
+TASK_HISTORY_QUEUE_SIZE = int(os.getenv('TASK_HISTORY_QUEUE_SIZE', '10000'))
+
+# GET /api/tasks/export/ için veritabanından tek seferde okunan satır sayısı
+TASK_EXPORT_CHUNK_SIZE = int(os.getenv('TASK_EXPORT_CHUNK_SIZE', '2000'))
+
+# GET /api/sync/ (apps.boards.sync)
+SYNC_PAGE_SIZE = int(os.getenv('SYNC_PAGE_SIZE', '500'))
+SYNC_MAX_PAGE_SIZE = int(os.getenv('SYNC_MAX_PAGE_SIZE', '2000'))
+# Commit gecikmesiyle kaçan satır olmasın diye pencereler bu kadar örtüşür
+SYNC_OVERLAP_SECONDS = int(os.getenv('SYNC_OVERLAP_SECONDS', '5'))
+# Bu süreden eski tombstone'lar silinebilir; daha eski token tam yükleme ister
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv('SYNC_TOMBSTONE_RETENTION_DAYS', '30'))
+
+# GET /api/search/ için varsayılan / en fazla sonuç sayısı (tür başına)
+SEARCH_RESULTS = int(os.getenv('SEARCH_RESULTS', '20'))
+SEARCH_MAX_RESULTS = int(os.getenv('SEARCH_MAX_RESULTS', '100'))
+
+# İstek bazında performans ölçümü (api/timing.py)
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'False') == 'True'
+# Ölçümleri Server-Timing header'ı olarak da döndür
+SERVER_TIMING_HEADER = os.getenv('SERVER_TIMING_HEADER', 'False') == 'True'
+# Bu eşikler aşılırsa çalışan SQL'ler warning olarak loglanır
+SERVER_TIMING_SLOW_MS = int(os.getenv('SERVER_TIMING_SLOW_MS', '500'))
+SERVER_TIMING_MAX_QUERIES = int(os.getenv('SERVER_TIMING_MAX_QUERIES', '30'))
+# İstek başına saklanan en fazla SQL sayısı
+SERVER_TIMING_CAPTURE_QUERIES = int(os.getenv('SERVER_TIMING_CAPTURE_QUERIES', '200'))
+
 # Logging configuration
 LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
+# LOG_MODE=queue (varsayılan): istek thread'i kaydı sadece kuyruğa koyar,
+# arka plan thread'i JSON satırı olarak yazar ve dosyayı döndürür (api/log.py).
+# LOG_MODE=sync: eski davranış, düz metin FileHandler.
+LOG_MODE = os.getenv('LOG_MODE', 'queue')
+# LOG_TARGET=stdout: JSON satırları stdout'a yazılır, rotasyonu container'ın
+# log sürücüsü yapar (production profili). gunicorn birden fazla worker ile
+# çalışırken api/serving.py bunu zorlar: dosyayı tek process döndürmelidir.
+LOG_TARGET = os.getenv('LOG_TARGET', 'file')
+LOG_FILE_NAME = None if LOG_TARGET == 'stdout' else LOG_DIR / "backend.log"
+
+if LOG_MODE == 'queue':
+    LOG_FILE_HANDLER = {
+        "class": "api.log.QueueHandler",
+        "filename": LOG_FILE_NAME,
+        # Boyut bazlı rotasyon; LOG_ROTATE_WHEN (örn. midnight) verilirse zaman bazlı
+        "max_bytes": int(os.getenv('LOG_MAX_BYTES', str(20 * 1024 * 1024))),
+        "backup_count": int(os.getenv('LOG_BACKUP_COUNT', '5')),
+        "when": os.getenv('LOG_ROTATE_WHEN') or None,
+        # Kuyruk doluysa kayıt atılır ve sayılır (/api/metrics/)
+        "queue_size": int(os.getenv('LOG_QUEUE_SIZE', '10000')),
+        # INFO kayıtlarının yazılacak oranı (1.0 = hepsi)
+        "sample_rate": float(os.getenv('LOG_INFO_SAMPLE_RATE', '1.0')),
+    }
+else:
+    LOG_FILE_HANDLER = {
+        "class": "logging.FileHandler",
+        "filename": LOG_DIR / "backend.log",
+        "formatter": "verbose",
+    }
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -199,11 +402,7 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "simple",
         },
-        "file": {
-            "class": "logging.FileHandler",
-            "filename": LOG_DIR / "backend.log",
-            "formatter": "verbose",
-        },
+        "file": LOG_FILE_HANDLER,
     },
     "loggers": {
         "django": {
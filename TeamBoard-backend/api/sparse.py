@@ -0,0 +1,132 @@
+# api/sparse.py
+from functools import cache
+
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+# ?fields= / ?expand= (sparse fieldsets) okuma yanıtları için.
+#
+#   ?fields=id,title,status,assignee   sadece bu alanlar döner
+#   ?expand=owner                      iç içe ilişkilerden sadece bunlar
+#
+# İç içe serializer'la gelen ilişkiler (expandable_fields, örn. görevde
+# assignee_detail, takımda owner / members) parametre yoksa eskisi gibi
+# döner; ?fields= verilmişse sadece ?expand= (ya da ?fields=) içinde adı
+# geçenler eklenir. Bilinmeyen alan adı 400 döner.
+#
+# Sadece sparse_fieldsets = True olan view'ların (SparseQuerysetMixin)
+# GET / HEAD yanıtlarında en üstteki serializer daraltılır; yazma istekleri,
+# birden fazla tür döndüren view'lar (sync, search) ve iç içe serializer'lar
+# (örn. owner içindeki UserSerializer) tüm alanlarıyla çalışır.
+#
+# SparseQuerysetMixin view tarafında aynı seçimi verir (sparse_fields);
+# view'lar bunu .only() kolonlarına ve select_related / prefetch kararlarına
+# çevirir, böylece istenmeyen alanlar veritabanından da okunmaz.
+
+FIELDS_PARAM = 'fields'
+EXPAND_PARAM = 'expand'
+
+
+def parse_names(request, name):
+    if request is None or name not in request.query_params:
+        return None
+    return {
+        item.strip()
+        for value in request.query_params.getlist(name)
+        for item in value.split(',')
+        if item.strip()
+    }
+
+
+@cache
+def readable_fields(serializer_class):
+    return tuple(
+        name for name, field in serializer_class().get_fields().items()
+        if not field.write_only
+    )
+
+
+def select_fields(serializer_class, request):
+    """Yanıtta kalacak alan adları; daraltma yoksa None (tüm alanlar)."""
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    fields = parse_names(request, FIELDS_PARAM)
+    expand = parse_names(request, EXPAND_PARAM)
+    if fields is None and expand is None:
+        return None
+
+    names = set(readable_fields(serializer_class))
+    expandable = set(serializer_class.expandable_fields)
+    errors = {}
+    if fields is not None and fields - names:
+        errors[FIELDS_PARAM] = [f'Bilinmeyen alan: {name}' for name in sorted(fields - names)]
+    if expand is not None and expand - expandable:
+        errors[EXPAND_PARAM] = [
+            f'Genişletilemeyen alan: {name}' for name in sorted(expand - expandable)
+        ]
+    if errors:
+        raise serializers.ValidationError(errors)
+
+    plain = names - expandable
+    selected = plain if fields is None else fields & plain
+    if expand is not None:
+        expanded = expand | ((fields or set()) & expandable)
+    elif fields is None:
+        expanded = expandable
+    else:
+        expanded = fields & expandable
+    return selected | expanded
+
+
+def columns_for(fields, field_columns, always=('id',)):
+    """
+    Seçili alanların ihtiyaç duyduğu model kolonları (.only() için).
+    field_columns'ta olmayan alan aynı adlı kolonu okur.
+    """
+    columns = list(always)
+    for name in sorted(fields):
+        columns.extend(field_columns.get(name, (name,)))
+    return list(dict.fromkeys(columns))
+
+
+class SparseFieldsetsMixin:
+
+    """Serializer: okuma isteğinde seçilmeyen alanları çıkarır."""
+
+    # Varsayılan olarak dahil olan, ?fields= ile birlikte ?expand= isteyen
+    # iç içe alanlar
+    expandable_fields = ()
+
+    def get_fields(self):
+        fields = super().get_fields()
+        view = self.context.get('view')
+        if not getattr(view, 'sparse_fieldsets', False) or not self.is_sparse_root():
+            return fields
+        selected = select_fields(type(self), self.context.get('request'))
+        if selected is None:
+            return fields
+        return {
+            name: field for name, field in fields.items()
+            if name in selected or field.write_only
+        }
+
+    def is_sparse_root(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+
+class SparseQuerysetMixin:
+
+    """View: isteğin seçtiği alanlar (get_serializer_class'a göre)."""
+
+    sparse_fieldsets = True
+
+    def sparse_fields(self):
+        """Seçili alan adları; daraltma yoksa serializer'ın tüm alanları."""
+        serializer_class = self.get_serializer_class()
+        selected = select_fields(serializer_class, self.request)
+        if selected is None:
+            return set(readable_fields(serializer_class))
+        return selected
@@ -0,0 +1,434 @@
+import io
+import json
+import logging
+import logging.config
+import tempfile
+import uuid
+from unittest import mock
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from apps.boards import membership, response_cache
+from apps.boards.models import Project, Task, Team
+
+from . import log, routing, serving, timing
+from .encoders import OrjsonEncoder, StdlibEncoder, get_encoder, orjson
+from .renderers import CustomJSONRenderer
+
+ENCODERS = ['stdlib'] + (['orjson'] if orjson is not None else [])
+
+
+def sample_payload():
+    task = ReturnDict({
+        'id': 7,
+        'title': 'Çeyrek raporu \u2028 ✓',
+        'status': 'done',
+        'due_date': date(2025, 1, 31),
+        'created_at': datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+        'estimate': Decimal('1.50'),
+        'uid': uuid.UUID(int=1),
+        'label': gettext_lazy('Done'),
+        'assignee_detail': None,
+        'tags': ('a', 'b'),
+        'ratio': 0.1,
+    }, serializer=None)
+    return {
+        'next': 'http://testserver/api/tasks/?cursor=abc',
+        'previous': None,
+        'results': ReturnList([task, task], serializer=None),
+        'by_status': {1: 2, 'todo': 0},
+    }
+
+
+class EncoderTests(SimpleTestCase):
+
+    def test_encoders_match_drf_json_renderer(self):
+        expected = JSONRenderer().render(sample_payload())
+        for name in ENCODERS:
+            with self.subTest(encoder=name):
+                self.assertEqual(get_encoder(name).encode(sample_payload()), expected)
+
+    def test_orjson_falls_back_for_unsupported_values(self):
+        if orjson is None:
+            self.skipTest('orjson kurulu değil')
+        data = {'big': 2 ** 70}
+        self.assertEqual(OrjsonEncoder().encode(data), StdlibEncoder().encode(data))
+
+
+class CustomJSONRendererTests(SimpleTestCase):
+
+    def legacy_render(self, data):
+        # Önceki implementasyon: zarf dict + JSONRenderer
+        message = data.pop('message', None) if isinstance(data, dict) else None
+        return JSONRenderer().render(
+            {'success': True, 'message': message or 'İşlem başarılı.', 'data': data}
+        )
+
+    def test_success_envelope_is_byte_identical_and_payload_untouched(self):
+        for name in ENCODERS:
+            for payload in (sample_payload(), {'message': 'Tamam.', 'count': 3}, [1, 2], None):
+                with self.subTest(encoder=name, payload=payload), \
+                        override_settings(JSON_ENCODER=name):
+                    rendered = CustomJSONRenderer().render(payload)
+                    if isinstance(payload, dict) and 'message' in payload:
+                        self.assertIn('message', payload)
+                        payload = dict(payload)
+                    self.assertEqual(rendered, self.legacy_render(payload))
+
+    def test_error_path_is_byte_identical(self):
+        errors = {
+            'success': False,
+            'message': 'Gönderdiğiniz veriler geçersiz.',
+            'errors': {'title': [ErrorDetail('Bu alan zorunludur.', code='required')]},
+        }
+        response = Response(errors, status=400)
+        response.exception = True
+        for name in ENCODERS:
+            with self.subTest(encoder=name), override_settings(JSON_ENCODER=name):
+                self.assertEqual(
+                    CustomJSONRenderer().render(errors, renderer_context={'response': response}),
+                    JSONRenderer().render(errors),
+                )
+
+    def test_indent_uses_standard_path(self):
+        rendered = CustomJSONRenderer().render(
+            {'a': 1}, accepted_media_type='application/json; indent=2'
+        )
+        self.assertIn(b'\n  "success": true', rendered)
+
+
+@override_settings(SERVER_TIMING_ENABLED=True, SERVER_TIMING_HEADER=True)
+class ServerTimingTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        caches['responses'].clear()
+        self.user = User.objects.create_user(username='owner')
+        Team.objects.create(name='Core', owner=self.user)
+        self.client.force_authenticate(self.user)
+
+    def test_header_and_log_line_per_request(self):
+        with self.assertLogs('api.timing', level='INFO') as logs:
+            response = self.client.get('/api/teams/')
+
+        header = response['Server-Timing']
+        for name in ('db', 'permission', 'serializer', 'render', 'total'):
+            self.assertIn(f'{name};dur=', header)
+
+        timing = logs.records[0].timing
+        self.assertEqual(timing['view'], 'TeamViewSet')
+        self.assertEqual(timing['action'], 'list')
+        self.assertEqual(timing['status'], 200)
+        self.assertGreater(timing['queries'], 0)
+        self.assertIn(f'desc="{timing["queries"]} queries"', header)
+        self.assertIn('TeamViewSet.list', logs.output[0])
+
+    @override_settings(SERVER_TIMING_MAX_QUERIES=1)
+    def test_query_threshold_logs_sql(self):
+        with self.assertLogs('api.timing', level='WARNING') as logs:
+            self.client.get('/api/teams/')
+
+        self.assertIn('High query count', logs.output[0])
+        self.assertIn('SELECT', logs.output[0])
+        self.assertTrue(logs.records[0].queries)
+
+    def test_queries_in_sync_to_async_threads_are_counted(self):
+        # Async view'ların ORM çağrıları ayrı thread'de, kendi bağlantısıyla çalışır
+        timing.install_query_timer()
+        timing.install_query_timer()
+        timer = timing.RequestTimer(10)
+
+        def query():
+            connection = connections['default']
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                return connection.execute_wrappers.count(timing.record_query)
+            finally:
+                connection.close()
+
+        token = timing._current.set(timer)
+        try:
+            wrappers = async_to_sync(sync_to_async(query, thread_sensitive=False))()
+        finally:
+            timing._current.reset(token)
+
+        self.assertEqual(wrappers, 1)
+        self.assertEqual(timer.query_count, 1)
+
+    @override_settings(SERVER_TIMING_ENABLED=False)
+    def test_disabled_adds_nothing(self):
+        response = self.client.get('/api/teams/')
+        self.assertNotIn('Server-Timing', response)
+
+
+class QueueLoggingTests(SimpleTestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / 'backend.log'
+
+    def make_record(self, level=logging.INFO, msg='istek %s', args=('ok',), **extra):
+        record = logging.LogRecord('api.test', level, __file__, 1, msg, args, None)
+        record.__dict__.update(extra)
+        return record
+
+    def read_lines(self):
+        return [json.loads(line) for line in self.path.read_text().splitlines()]
+
+    def test_records_written_as_json_lines_on_stop(self):
+        handler = log.QueueHandler(self.path)
+        handler.handle(self.make_record(timing={'queries': 3}))
+        handler.handle(self.make_record(logging.WARNING, 'yavaş', ()))
+        handler.close()
+
+        first, second = self.read_lines()
+        self.assertEqual(first['message'], 'istek ok')
+        self.assertEqual(first['level'], 'INFO')
+        self.assertEqual(first['logger'], 'api.test')
+        self.assertEqual(first['timing'], {'queries': 3})
+        self.assertEqual(second['level'], 'WARNING')
+
+    def test_full_queue_drops_without_blocking(self):
+        handler = log.QueueHandler(self.path, queue_size=1)
+        # Listener durdurulup kuyruk doldurulur
+        handler.listener.stop()
+        before = log.stats.snapshot()
+
+        handler.handle(self.make_record())
+        handler.handle(self.make_record())
+        handler.handle(self.make_record())
+
+        after = log.stats.snapshot()
+        self.assertEqual(after['queued'] - before['queued'], 1)
+        self.assertEqual(after['dropped'] - before['dropped'], 2)
+
+        handler.listener.start()
+        handler.close()
+        self.assertEqual(len(self.read_lines()), 1)
+
+    def test_sampling_skips_only_info(self):
+        handler = log.QueueHandler(self.path, sample_rate=0)
+        before = log.stats.snapshot()
+
+        handler.handle(self.make_record())
+        handler.handle(self.make_record(logging.ERROR, 'hata', ()))
+        handler.close()
+
+        self.assertEqual(log.stats.snapshot()['sampled_out'] - before['sampled_out'], 1)
+        self.assertEqual([line['level'] for line in self.read_lines()], ['ERROR'])
+
+    def test_size_rotation(self):
+        handler = log.QueueHandler(self.path, max_bytes=200, backup_count=2)
+        for _ in range(3):
+            handler.handle(self.make_record(msg='x' * 150, args=()))
+            # Her kayıt ayrı batch olarak yazılsın
+            handler.listener.stop()
+            handler.listener.start()
+        handler.close()
+
+        self.assertTrue(self.path.with_name('backend.log.1').exists())
+        self.assertEqual(len(self.read_lines()), 1)
+
+    def test_settings_logging_config(self):
+        # Django açılışındaki çağrı; Python 3.12+ dictConfig
+        # logging.handlers.QueueHandler alt sınıflarını kendi ayarlarıyla kurar
+        logging.config.dictConfig(settings.LOGGING)
+        handlers = logging.getLogger('api').handlers
+        self.assertEqual(len([h for h in handlers if isinstance(h, log.QueueHandler)]), 1)
+        self.assertNotIsInstance(handlers[-1], logging.handlers.QueueHandler)
+
+    def test_stdout_target(self):
+        stream = io.StringIO()
+        handler = log.QueueHandler(None)
+        handler.target.setStream(stream)
+        handler.handle(self.make_record())
+        handler.close()
+
+        self.assertEqual(json.loads(stream.getvalue())['message'], 'istek ok')
+
+
+class ServingProfileTests(SimpleTestCase):
+
+    shared_cache = {'CACHE_BACKEND': 'django.core.cache.backends.redis.RedisCache'}
+
+    def test_wsgi_workers_sized_from_cpu(self):
+        options = serving.gunicorn_options(self.shared_cache, cpus=4)
+        self.assertEqual(options['wsgi_app'], 'api.wsgi:application')
+        self.assertEqual(options['worker_class'], 'gthread')
+        self.assertEqual(options['workers'], 9)
+        self.assertEqual(options['threads'], 4)
+        # Birden fazla worker aynı log dosyasını döndürmez
+        self.assertEqual(options['raw_env'], ['SERVER_WORKERS=9', 'LOG_TARGET=stdout'])
+        self.assertEqual(
+            serving.gunicorn_options({'WEB_CONCURRENCY': '1'})['raw_env'], ['SERVER_WORKERS=1']
+        )
+
+    def test_multiple_workers_require_shared_cache(self):
+        # Varsayılan image: paylaşımlı cache yoksa tek worker ile başlar
+        with self.assertLogs('api.serving', level='WARNING'):
+            self.assertEqual(serving.gunicorn_options({}, cpus=4)['workers'], 1)
+        with self.assertRaisesMessage(ValueError, 'shared CACHE_BACKEND'):
+            serving.gunicorn_options({'WEB_CONCURRENCY': '2'})
+        self.assertEqual(serving.gunicorn_options({'WEB_CONCURRENCY': '1'})['workers'], 1)
+        self.assertEqual(
+            serving.gunicorn_options({'ALLOW_PROCESS_LOCAL_CACHE': 'True'}, cpus=4)['workers'], 9
+        )
+
+    def test_process_local_response_cache_disabled_for_multiple_workers(self):
+        # İki worker'ın ayrı LocMemCache'leri: birinde artan nesli diğeri
+        # görmez, eski anahtarla bayat yanıt dönerdi
+        worker_a = LocMemCache('worker-a', {})
+        worker_b = LocMemCache('worker-b', {})
+        self.addCleanup(worker_a.clear)
+        self.addCleanup(worker_b.clear)
+        with mock.patch.object(response_cache, '_cache', return_value=worker_b):
+            before = response_cache.get_generations([1])
+        with mock.patch.object(response_cache, '_cache', return_value=worker_a):
+            response_cache._bump([1])
+        with mock.patch.object(response_cache, '_cache', return_value=worker_b):
+            self.assertEqual(response_cache.get_generations([1]), before)
+
+        self.assertFalse(serving.response_cache_enabled({'SERVER_WORKERS': '2'}))
+        self.assertTrue(serving.response_cache_enabled({'SERVER_WORKERS': '1'}))
+        self.assertTrue(serving.response_cache_enabled({}))
+        self.assertTrue(serving.response_cache_enabled({
+            'SERVER_WORKERS': '2',
+            'RESPONSE_CACHE_BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        }))
+        self.assertFalse(serving.response_cache_enabled({'RESPONSE_CACHE_ENABLED': 'False'}))
+
+    def test_asgi_and_env_overrides(self):
+        options = serving.gunicorn_options(
+            {
+                **self.shared_cache,
+                'SERVER_MODE': 'asgi', 'WEB_CONCURRENCY': '3', 'GUNICORN_BIND': 'unix:/tmp/tb.sock',
+            },
+            cpus=8,
+        )
+        self.assertEqual(options['wsgi_app'], 'api.asgi:application')
+        self.assertEqual(options['worker_class'], 'uvicorn_worker.UvicornWorker')
+        self.assertEqual(options['workers'], 3)
+        self.assertEqual(options['threads'], 1)
+        self.assertEqual(options['bind'], 'unix:/tmp/tb.sock')
+
+        with self.assertRaises(ValueError):
+            serving.gunicorn_options({'SERVER_MODE': 'fcgi'})
+
+    def test_persistent_connections_only_for_wsgi_workers(self):
+        self.assertEqual(
+            serving.database_connection_options({}),
+            {'CONN_MAX_AGE': 60, 'CONN_HEALTH_CHECKS': True},
+        )
+        self.assertEqual(serving.database_connection_options({}, debug=True)['CONN_MAX_AGE'], 0)
+        self.assertEqual(
+            serving.database_connection_options({'SERVER_MODE': 'asgi'})['CONN_MAX_AGE'], 0
+        )
+        self.assertEqual(
+            serving.database_connection_options({'DB_CONN_MAX_AGE': '300'})['CONN_MAX_AGE'], 300
+        )
+
+
+@override_settings(
+    DATABASE_REPLICAS=['replica'], REPLICA_STICKY_SECONDS=30, RESPONSE_CACHE_ENABLED=False,
+)
+class ReplicaRoutingTests(APITestCase):
+    databases = {'default', 'replica'}
+
+    @classmethod
+    def setUpClass(cls):
+        # Test veritabanında iki bağlantı birbirinin transaction'ını göremez;
+        # replica aynı bağlantıyı kullanır, router'ın kararı ayrıca kaydedilir
+        cls.replica_connection = connections['replica']
+        connections['replica'] = connections['default']
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections['replica'] = cls.replica_connection
+
+    def setUp(self):
+        cache.clear()
+        caches['responses'].clear()
+        routing.pool.reset()
+        routing.stats.reset()
+        self.owner = User.objects.create_user(username='owner')
+        self.other = User.objects.create_user(username='other')
+        team = Team.objects.create(name='Core', owner=self.owner)
+        team.members.add(self.owner, self.other)
+        self.task = Task.objects.create(
+            title='Task', project=Project.objects.create(title='Board', team=team)
+        )
+
+    def login(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+        # Cache'te olmayan kullanıcı primary'den yüklenir (auth cache ısınsın)
+        self.assertEqual(self.read_aliases('get', '/api/auth/me/'), {'default'})
+        membership.get_memberships(user)
+
+    def read_aliases(self, method, path, data=None):
+        aliases = []
+        db_for_read = routing.ReplicaRouter.db_for_read
+
+        def spy(router, model, **hints):
+            aliases.append(db_for_read(router, model, **hints))
+            return aliases[-1]
+
+        with mock.patch.object(routing.ReplicaRouter, 'db_for_read', spy):
+            response = getattr(self.client, method)(path, data, format='json')
+        self.assertLess(response.status_code, 400)
+        return set(aliases)
+
+    def test_reads_go_to_replica(self):
+        self.login(self.owner)
+        self.assertEqual(self.read_aliases('get', '/api/tasks/'), {'replica'})
+
+    def test_writer_sticks_to_primary_others_do_not(self):
+        self.login(self.owner)
+        path = f'/api/tasks/{self.task.id}/'
+        self.assertEqual(self.read_aliases('patch', path, {'status': 'done'}), {'default'})
+
+        self.assertEqual(self.read_aliases('get', path), {'default'})
+        self.assertEqual(routing.stats.counts['sticky'], 1)
+
+        self.login(self.other)
+        self.assertEqual(self.read_aliases('get', path), {'replica'})
+
+    def test_cache_fills_read_primary(self):
+        # Geride kalan replica'nın eski verisi cache'e yazılmasın
+        self.login(self.owner)
+        cache.delete(f'boards:membership:{self.owner.id}')
+        self.assertEqual(self.read_aliases('get', '/api/tasks/'), {'default', 'replica'})
+
+        with self.settings(RESPONSE_CACHE_ENABLED=True):
+            self.assertEqual(self.read_aliases('get', '/api/tasks/'), {'default'})
+            self.assertEqual(self.read_aliases('get', '/api/tasks/'), set())
+
+    def test_lagging_replica_taken_out_of_rotation(self):
+        self.login(self.owner)
+        with mock.patch.object(routing.pool, 'measure_lag', return_value=60.0):
+            self.assertEqual(self.read_aliases('get', '/api/tasks/'), {'default'})
+        self.assertEqual(
+            routing.pool.snapshot(), {'replica': {'lag': 60.0, 'healthy': False}}
+        )
+
+    def test_outside_requests_read_primary(self):
+        self.assertEqual(routing.ReplicaRouter().db_for_read(Task), 'default')
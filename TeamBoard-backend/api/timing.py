@@ -0,0 +1,230 @@
+# api/timing.py
+import contextvars
+import logging
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework import serializers
+
+logger = logging.getLogger(__name__)
+
+# İstek bazında performans ölçümü (SERVER_TIMING_ENABLED).
+#
+# Ölçülenler: SQL sorgu sayısı ve süresi, permission kontrolleri
+# (TimedViewMixin), serializer is_valid + data (TimedSerializerMixin) ve
+# CustomJSONRenderer. Sonuç "api.timing" logger'ına view / action etiketli
+# tek satır olarak yazılır; istenirse Server-Timing header'ı olarak da döner.
+# Eşikler (SERVER_TIMING_SLOW_MS / SERVER_TIMING_MAX_QUERIES) aşılırsa
+# çalışan SQL'ler warning ile loglanır.
+#
+# Ölçüm isteğin context'inde (contextvars) tutulur. SQL sayacı her
+# veritabanı bağlantısına açıldığında (connection_created) bir kez eklenir
+# ve o anki context'in ölçümüne yazar; async view'ların sync_to_async
+# thread'lerinde çalışan sorgular da (asgiref context'i taşır) sayılır.
+#
+# Kapalıyken middleware hiç yüklenmez (MiddlewareNotUsed) ve bağlantılara
+# sayaç eklenmez; mixin'ler sadece aktif ölçüm yoksa hemen döner. Fazlar iç
+# içe olabilir (serializer içinde lazy sorgu çalışırsa süre hem db hem
+# serializer'a yazılır).
+
+PHASES = ('permission', 'serializer', 'render')
+
+_current = contextvars.ContextVar('request_timer', default=None)
+
+
+class RequestTimer:
+
+    def __init__(self, capture_limit):
+        self.started = time.perf_counter()
+        self.capture_limit = capture_limit
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.active = set()
+        self.query_count = 0
+        self.db_time = 0.0
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.query_count += 1
+            self.db_time += duration
+            if len(self.queries) < self.capture_limit:
+                self.queries.append((duration, sql))
+
+    def total(self):
+        return time.perf_counter() - self.started
+
+
+class phase:
+
+    """Aktif bir ölçüm varsa bloğun süresini ilgili faza ekler."""
+
+    __slots__ = ('name', 'timer', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        timer = _current.get()
+        # İç içe aynı faz (örn. nested serializer.data) bir kez sayılır
+        if timer is None or self.name in timer.active:
+            self.timer = None
+            return
+        self.timer = timer
+        timer.active.add(self.name)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        if self.timer is not None:
+            self.timer.phases[self.name] += time.perf_counter() - self.start
+            self.timer.active.discard(self.name)
+
+
+def record_query(execute, sql, params, many, context):
+    """Bağlantı execute_wrapper'ı; aktif ölçüm yoksa sorguyu aynen çalıştırır."""
+    timer = _current.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    return timer(execute, sql, params, many, context)
+
+
+def attach_query_timer(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def install_query_timer():
+    """Yeni açılan bağlantılara (ve bu thread'de açık olanlara) sayaç ekler."""
+    connection_created.connect(attach_query_timer, dispatch_uid='api.timing.query_timer')
+    for connection in connections.all(initialized_only=True):
+        attach_query_timer(connection)
+
+
+class TimedViewMixin:
+
+    """View: permission kontrollerinin süresi."""
+
+    def check_permissions(self, request):
+        with phase('permission'):
+            return super().check_permissions(request)
+
+    def check_object_permissions(self, request, obj):
+        with phase('permission'):
+            return super().check_object_permissions(request, obj)
+
+
+class TimedSerializerMixin:
+
+    """Serializer: is_valid ve data süresi (many=True listesi dahil)."""
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        serializer = super().many_init(*args, **kwargs)
+        # Meta'da list_serializer_class verilmemişse liste de ölçülür
+        if type(serializer) is serializers.ListSerializer:
+            serializer.__class__ = TimedListSerializer
+        return serializer
+
+    def is_valid(self, *args, **kwargs):
+        with phase('serializer'):
+            return super().is_valid(*args, **kwargs)
+
+    @property
+    def data(self):
+        with phase('serializer'):
+            return super().data
+
+
+class TimedListSerializer(TimedSerializerMixin, serializers.ListSerializer):
+    pass
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+class ServerTimingMiddleware:
+
+    def __init__(self, get_response):
+        if not settings.SERVER_TIMING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        install_query_timer()
+
+    def __call__(self, request):
+        timer = RequestTimer(settings.SERVER_TIMING_CAPTURE_QUERIES)
+        token = _current.set(timer)
+        try:
+            # Bu thread'de henüz sayaçsız açık bağlantı kaldıysa
+            for connection in connections.all(initialized_only=True):
+                attach_query_timer(connection)
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+
+        self.report(request, response, timer)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # DRF as_view(): cls ve (viewset ise) method -> action eşlemesi
+        cls = getattr(view_func, 'cls', None)
+        actions = getattr(view_func, 'actions', None) or {}
+        request.timing_view = cls.__name__ if cls else view_func.__name__
+        request.timing_action = actions.get(request.method.lower())
+
+    def report(self, request, response, timer):
+        total = timer.total()
+        metrics = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'view': getattr(request, 'timing_view', None),
+            'action': getattr(request, 'timing_action', None),
+            'queries': timer.query_count,
+            'db_ms': _ms(timer.db_time),
+            **{f'{name}_ms': _ms(timer.phases[name]) for name in PHASES},
+            'total_ms': _ms(total),
+        }
+
+        if settings.SERVER_TIMING_HEADER:
+            parts = [f'db;dur={metrics["db_ms"]};desc="{timer.query_count} queries"']
+            parts += [f'{name};dur={metrics[f"{name}_ms"]}' for name in PHASES]
+            parts.append(f'total;dur={metrics["total_ms"]}')
+            response['Server-Timing'] = ', '.join(parts)
+
+        label = f'{metrics["view"]}.{metrics["action"]}' if metrics['action'] else metrics['view']
+        logger.info(
+            '%s %s %s %s queries=%s db=%sms total=%sms',
+            request.method, request.path, response.status_code, label,
+            timer.query_count, metrics['db_ms'], metrics['total_ms'],
+            extra={'timing': metrics},
+        )
+
+        slow = metrics['total_ms'] >= settings.SERVER_TIMING_SLOW_MS
+        chatty = timer.query_count >= settings.SERVER_TIMING_MAX_QUERIES
+        if slow or chatty:
+            # Aynı SQL tekrar ediyorsa (N+1) tek satırda toplam süre ve adet
+            durations = Counter()
+            counts = Counter()
+            for duration, sql in timer.queries:
+                durations[sql] += duration
+                counts[sql] += 1
+            logger.warning(
+                '%s request %s %s (%s): %s queries, %sms\n%s',
+                'Slow' if slow else 'High query count',
+                request.method, request.path, label,
+                timer.query_count, metrics['total_ms'],
+                '\n'.join(
+                    f'  {_ms(duration):>8}ms x{counts[sql]} {sql}'
+                    for sql, duration in durations.most_common()
+                ),
+                extra={'timing': metrics, 'queries': [sql for _, sql in timer.queries]},
+            )
@@ -19,6 +19,8 @@ from django.urls import include, path
 from drf_spectacular.views import (SpectacularAPIView, SpectacularRedocView,
                                    SpectacularSwaggerView)
 
+from api.views import MetricsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
 
@@ -29,5 +31,7 @@ urlpatterns = [
     path('api/auth/', include('apps.accounts.urls')),
     path('api/', include('apps.boards.urls')),
     path("api/", include('apps.accounts.user_urls')),
+
+    path('api/metrics/', MetricsView.as_view(), name='metrics'),
 ]
 
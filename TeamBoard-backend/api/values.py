@@ -0,0 +1,294 @@
+# api/values.py
+import datetime
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601
+from rest_framework import fields as drf_fields
+from rest_framework import relations, serializers
+from rest_framework.settings import api_settings
+
+from .timing import phase
+
+# Liste action'ları için salt okunur serileştirme (.values() satırlarından).
+#
+# ModelSerializer her satır için bir model instance'ı kurar ve her alan için
+# get_attribute + to_representation çağırır; büyük listelerde CPU'nun çoğu
+# buraya gider. ValuesSerializer aynı serializer'ın alanlarından bir kez
+# "okuma planı" derler: her çıktı alanı bir .values() kolonuna (iç içe
+# ilişkiler JOIN'li kolonlara, SerializerMethodField'lar serializer'daki
+# values_expressions ile SQL ifadesine) eşlenir. Satır başına sadece dict
+# okuma ve gerekiyorsa (tarih / saat) alanın kendi to_representation'ı
+# çalışır; çıktı alan sırası ve değerleri serializer'la birebir aynıdır.
+# SQL karşılığı birebir aynı olmayan method alanları için values_method_sources
+# okunacak kolonları verir; serializer'ın get_<alan> metodu bu kolonlardan
+# kurulan hafif bir nesneyle çağrılır.
+#
+# Plan çıkarılamayan alan (ifadesi / kaynağı olmayan SerializerMethodField, özel
+# field sınıfı, many=True ilişki; örn. takımda members) varsa compile None
+# döner ve view normal serializer'la devam eder. Sparse fieldsets
+# (api/sparse.py) ile seçilmeyen alanlar plana hiç girmez.
+#
+# VALUES_LIST_ENABLED=False ile kapatılabilir.
+
+# Veritabanından gelen değeri aynen döndüren alanlar (to_representation str()
+# / int() / bool(); .values() zaten bu tipte döner)
+IDENTITY_FIELDS = (
+    drf_fields.CharField,
+    drf_fields.IntegerField,
+    drf_fields.BooleanField,
+)
+# to_representation'ı ham değerle (instance gerekmeden) çalışan alanlar
+RAW_VALUE_FIELDS = (
+    drf_fields.DateField,
+    drf_fields.DecimalField,
+    drf_fields.FloatField,
+)
+
+
+class Unsupported(Exception):
+    pass
+
+
+class DateTimeConverter:
+
+    """
+    DateTimeField.to_representation ile aynı çıktı (ISO 8601, +00:00 -> Z).
+    DRF her değerde aktif timezone'u yeniden okur (asgiref Local); burada
+    liste başına bir kez okunur (bind).
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def bind(self):
+        field = self.field
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+        if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+            return field.to_representation
+
+        utc = field_timezone is datetime.timezone.utc or getattr(field_timezone, 'key', None) == 'UTC'
+
+        def convert(value):
+            if isinstance(value, str) or value.tzinfo is None:
+                return field.to_representation(value)
+            if utc and value.tzinfo is datetime.timezone.utc:
+                # Veritabanı değeri zaten UTC; astimezone aynı anı döndürür
+                return value.isoformat()[:-6] + 'Z'
+            text = value.astimezone(field_timezone).isoformat()
+            if text.endswith('+00:00'):
+                return text[:-6] + 'Z'
+            return text
+
+        return convert
+
+
+def _leaf(field, column):
+    """(kolon, dönüştürücü ya da None)"""
+    if isinstance(field, relations.PrimaryKeyRelatedField) and field.pk_field is None:
+        # .values('project') FK id'sini döner; to_representation .pk'yi
+        return column, None
+    if isinstance(field, drf_fields.ChoiceField):
+        # Anahtarları str olan choices'ta to_representation değeri aynen döner
+        if all(isinstance(key, str) for key in field.choices):
+            return column, None
+        return column, field.to_representation
+    if isinstance(field, IDENTITY_FIELDS):
+        return column, None
+    if isinstance(field, drf_fields.DateTimeField):
+        return column, DateTimeConverter(field)
+    if (
+        type(field) is drf_fields.DateField
+        and getattr(field, 'format', api_settings.DATE_FORMAT) == ISO_8601
+    ):
+        # DateField.to_representation'ın ISO yolu; .values() date döner
+        return column, datetime.date.isoformat
+    if isinstance(field, RAW_VALUE_FIELDS):
+        return column, field.to_representation
+    raise Unsupported(type(field).__name__)
+
+
+class MethodConverter:
+
+    """get_<alan>(obj) metodunu satırın ilgili kolonlarıyla çağırır."""
+
+    def __init__(self, method, sources):
+        self.method = method
+        self.sources = sources
+
+    def __call__(self, row):
+        return self.method(SimpleNamespace(**{source: row[source] for source in self.sources}))
+
+
+def _prefixed(prefix, source):
+    if source == '*':
+        return prefix
+    return f'{prefix}__{source}' if prefix else source
+
+
+def _compile(serializer, prefix, columns, expressions):
+    """Serializer alanlarının okuma planı: [(ad, kolon, dönüştürücü, iç plan), ...]"""
+    plan = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        if isinstance(field, drf_fields.SerializerMethodField):
+            if prefix:
+                raise Unsupported(name)
+            sources = getattr(serializer, 'values_method_sources', {}).get(name)
+            if sources is not None:
+                columns.extend(sources)
+                method = getattr(serializer, field.method_name)
+                plan.append((name, None, MethodConverter(method, sources), None))
+                continue
+            expression = getattr(serializer, 'values_expressions', {}).get(name)
+            if expression is None:
+                raise Unsupported(name)
+            expressions[name] = expression
+            plan.append((name, name, None, None))
+            continue
+
+        if isinstance(field, (serializers.ListSerializer, serializers.ManyRelatedField)):
+            raise Unsupported(name)
+
+        source = '__'.join(field.source_attrs) if field.source != '*' else '*'
+        if isinstance(field, serializers.BaseSerializer):
+            nested_prefix = _prefixed(prefix, source)
+            nested = _compile(field, nested_prefix, columns, expressions)
+            # İlişki boşsa (LEFT JOIN'de pk NULL) serializer None döndürür
+            null_key = None
+            if source != '*':
+                null_key = f'{nested_prefix}__pk'
+                columns.append(null_key)
+            plan.append((name, null_key, None, nested))
+            continue
+
+        column, convert = _leaf(field, _prefixed(prefix, source))
+        columns.append(column)
+        plan.append((name, column, convert, None))
+    return plan
+
+
+def _bind(plan):
+    """İstek anına bağlı dönüştürücüleri (timezone) hazırlar."""
+    return [
+        (
+            name,
+            key,
+            convert.bind() if isinstance(convert, DateTimeConverter) else convert,
+            _bind(nested) if nested is not None else None,
+        )
+        for name, key, convert, nested in plan
+    ]
+
+
+def _represent(plan, row):
+    output = {}
+    for name, key, convert, nested in plan:
+        if nested is not None:
+            if key is not None and row[key] is None:
+                output[name] = None
+            else:
+                output[name] = _represent(nested, row)
+            continue
+        if key is None:
+            # MethodConverter: birden fazla kolondan hesaplanır
+            output[name] = convert(row)
+            continue
+        value = row[key]
+        if value is None or convert is None:
+            output[name] = value
+        else:
+            output[name] = convert(value)
+    return output
+
+
+class ValuesSerializer:
+
+    """Derlenmiş okuma planı; .values() satırlarından serializer çıktısı."""
+
+    def __init__(self, plan, columns, expressions):
+        self.plan = plan
+        self.columns = columns
+        self.expressions = expressions
+
+    @classmethod
+    def compile(cls, serializer):
+        columns = []
+        expressions = {}
+        try:
+            plan = _compile(serializer, '', columns, expressions)
+        except Unsupported:
+            return None
+        return cls(plan, list(dict.fromkeys(columns)), expressions)
+
+    def values(self, queryset, *extra):
+        """queryset'i planın kolonlarıyla .values() sorgusuna çevirir."""
+        extra = [column for column in extra if column not in self.expressions]
+        return queryset.values(*dict.fromkeys([*self.columns, *extra]), **self.expressions)
+
+    def to_representation(self, row):
+        return _represent(_bind(self.plan), row)
+
+    def many(self, rows):
+        plan = _bind(self.plan)
+        return [_represent(plan, row) for row in rows]
+
+
+class ValuesListData:
+
+    """get_serializer(page, many=True) yerine; sadece .data kullanılır."""
+
+    def __init__(self, values_serializer, rows):
+        self.values_serializer = values_serializer
+        self.rows = rows
+
+    @property
+    def data(self):
+        with phase('serializer'):
+            return serializers.ReturnList(
+                self.values_serializer.many(self.rows), serializer=self
+            )
+
+
+class ValuesListMixin:
+
+    """
+    View: values_list_actions'ta (varsayılan list) queryset filtrelendikten
+    sonra .values()'a çevrilir, get_serializer(page, many=True) satırları
+    ValuesSerializer ile serileştirir. Cursor sayfalama satır dict'inden
+    konum okuyabildiği için sıralama alanları da seçilir.
+    """
+
+    values_list_actions = ('list',)
+
+    def get_values_serializer(self):
+        if not hasattr(self, '_values_serializer'):
+            self._values_serializer = None
+            if (
+                settings.VALUES_LIST_ENABLED
+                and getattr(self, 'action', None) in self.values_list_actions
+            ):
+                self._values_serializer = ValuesSerializer.compile(self.get_serializer())
+        return self._values_serializer
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        values_serializer = self.get_values_serializer()
+        if values_serializer is None:
+            return queryset
+        ordering = [
+            *(field.lstrip('-') for field in getattr(self, 'ordering', None) or ()),
+            *(getattr(self, 'ordering_fields', None) or ()),
+        ]
+        return values_serializer.values(queryset, *ordering)
+
+    def get_serializer(self, *args, **kwargs):
+        if args and kwargs.get('many'):
+            values_serializer = self.get_values_serializer()
+            if values_serializer is not None:
+                return ValuesListData(values_serializer, args[0])
+        return super().get_serializer(*args, **kwargs)
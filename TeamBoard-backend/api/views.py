@@ -0,0 +1,14 @@
+# api/views.py
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import metrics
+from .timing import TimedViewMixin
+
+
+class MetricsView(TimedViewMixin, APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(metrics.collect())
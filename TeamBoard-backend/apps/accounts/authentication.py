@@ -0,0 +1,199 @@
+import uuid
+from datetime import datetime, timezone
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.token_blacklist.models import (BlacklistedToken,
+                                                             OutstandingToken)
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from api import metrics, routing
+
+# JWT ile gelen isteklerde request.user için kısa süreli cache.
+#
+# Anahtar: accounts:auth:<user_id>:<nesil>:<jti>. Kullanıcı kaydedildiğinde
+# (deaktivasyon, şifre değişikliği dahil) veya silindiğinde signals.py
+# kullanıcının nesil anahtarını siler; eski girişlere bir daha ulaşılamaz
+# ve sonraki istek SimpleJWT'nin kendi kontrolleriyle (aktif mi, revoke
+# claim'i vb.) kullanıcıyı veritabanından tekrar yükler.
+#
+# Cache'te şifre tutulmaz; sadece CACHED_FIELDS saklanır, diğer alanlar
+# (password, last_login, ...) erişildiğinde veritabanından okunur.
+#
+# Not: queryset.update() signal tetiklemez; bu yolla yapılan değişiklikler
+# en geç AUTH_USER_CACHE_TIMEOUT sonra görünür.
+#
+# İptal edilen token'lar (logout) SimpleJWT'nin token_blacklist tablolarına
+# yazılır; asıl kayıt budur (cache'ten düşse, worker'lar cache paylaşmasa da
+# geçerli). Cache'teki denylist anahtarı sadece hızlı yoldur: paylaşımlı
+# cache'te iptal her worker'da hemen görünür. Kullanıcı veritabanından her
+# yüklendiğinde (cache miss) blacklist de kontrol edildiğinden, paylaşımsız
+# cache'te gecikme en fazla AUTH_USER_CACHE_TIMEOUT olur.
+
+# Model.from_db() değerleri modeldeki alan sırasıyla bekler
+CACHED_FIELDS = [
+    field.attname for field in User._meta.concrete_fields
+    if field.attname in {
+        'id', 'username', 'email', 'first_name', 'last_name',
+        'is_active', 'is_staff', 'is_superuser',
+    }
+]
+
+counter = metrics.HitMissCounter()
+metrics.register('auth_user_cache', counter.snapshot)
+
+
+def _cache():
+    return caches[settings.AUTH_USER_CACHE_ALIAS]
+
+
+def _generation_key(user_id):
+    return f'accounts:auth:{user_id}'
+
+
+def _user_key(user_id, generation, jti):
+    return f'accounts:auth:{user_id}:{generation}:{jti}'
+
+
+def _denylist_key(jti):
+    return f'accounts:denylist:{jti}'
+
+
+def _seconds_left(token):
+    expires_at = token.get('exp')
+    if expires_at is None:
+        return None
+    return int(expires_at - datetime.now(timezone.utc).timestamp())
+
+
+def invalidate(user_ids):
+    keys = [_generation_key(user_id) for user_id in set(user_ids) if user_id is not None]
+    if not keys:
+        return
+
+    # membership.invalidate ile aynı: hemen ve commit sonrası
+    _cache().delete_many(keys)
+    transaction.on_commit(lambda: _cache().delete_many(keys))
+
+
+def revoke(token):
+    """Token'ı süresi dolana kadar reddedilecekler listesine ekler."""
+    jti = token.get(jwt_settings.JTI_CLAIM)
+    seconds = _seconds_left(token)
+    if jti is None or (seconds is not None and seconds <= 0):
+        return
+
+    user_id = token.get(jwt_settings.USER_ID_CLAIM)
+    outstanding, _ = OutstandingToken.objects.get_or_create(jti=jti, defaults={
+        'user_id': user_id,
+        'token': str(token),
+        'created_at': datetime_from_epoch(token['iat']) if 'iat' in token else None,
+        'expires_at': datetime_from_epoch(token['exp']),
+    })
+    BlacklistedToken.objects.get_or_create(token=outstanding)
+
+    _cache().set(_denylist_key(jti), True, seconds)
+    # Bu token için cache'lenmiş kullanıcı bir daha kullanılmasın
+    invalidate([user_id])
+
+
+def is_revoked(jti):
+    return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+
+    """
+    JWTAuthentication ile aynı; sadece token'daki kullanıcı cache'ten
+    çözülür. Cache hit'inde veritabanı sorgusu yapılmaz.
+    AUTH_TOKEN_DENYLIST açıksa revoke() edilen token'lar reddedilir.
+    """
+
+    def get_user(self, validated_token):
+        user = self.get_cached_user(validated_token)
+        if user is None:
+            user = self.load_user(validated_token)
+        return user
+
+    async def aauthenticate(self, request):
+        # authenticate ile aynı; cache hit'inde thread'e geçilmez
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_cached_user(validated_token)
+        if user is None:
+            # SimpleJWT'nin kontrolleri (aktif mi, revoke claim'i) aynen çalışsın
+            user = await sync_to_async(self.load_user)(validated_token)
+        return user, validated_token
+
+    def get_cached_user(self, validated_token):
+        user_id = validated_token.get(jwt_settings.USER_ID_CLAIM)
+        jti = validated_token.get(jwt_settings.JTI_CLAIM)
+        if user_id is None or jti is None:
+            return None
+
+        cache = _cache()
+        generation_key = _generation_key(user_id)
+        keys = [generation_key]
+        if settings.AUTH_TOKEN_DENYLIST:
+            keys.append(_denylist_key(jti))
+        values = cache.get_many(keys)
+
+        if values.get(_denylist_key(jti)):
+            raise AuthenticationFailed('Token iptal edilmiş.', code='token_revoked')
+
+        generation = values.get(generation_key)
+        if generation is not None:
+            fields = cache.get(_user_key(user_id, generation, jti))
+            if fields is not None:
+                counter.hit()
+                return User.from_db(None, CACHED_FIELDS, fields)
+        return None
+
+    def load_user(self, validated_token):
+        user_id = validated_token.get(jwt_settings.USER_ID_CLAIM)
+        jti = validated_token.get(jwt_settings.JTI_CLAIM)
+        cacheable = user_id is not None and jti is not None
+        if cacheable:
+            counter.miss()
+
+        # Yeni kayıt olan kullanıcı / yeni iptal replica'ya henüz ulaşmamış olabilir
+        with routing.use_primary():
+            user = super().get_user(validated_token)
+            if settings.AUTH_TOKEN_DENYLIST and jti is not None and is_revoked(jti):
+                seconds = _seconds_left(validated_token)
+                if seconds is None or seconds > 0:
+                    _cache().set(_denylist_key(jti), True, seconds)
+                raise AuthenticationFailed('Token iptal edilmiş.', code='token_revoked')
+        if not cacheable:
+            return user
+
+        cache = _cache()
+        generation_key = _generation_key(user_id)
+        generation = cache.get(generation_key)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            if not cache.add(generation_key, generation, None):
+                generation = cache.get(generation_key)
+
+        timeout = settings.AUTH_USER_CACHE_TIMEOUT
+        seconds = _seconds_left(validated_token)
+        if generation is not None and (seconds is None or seconds > 0):
+            cache.set(
+                _user_key(user_id, generation, jti),
+                [getattr(user, field) for field in CACHED_FIELDS],
+                timeout if seconds is None else min(timeout, seconds),
+            )
+        return user
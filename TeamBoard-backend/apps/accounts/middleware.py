@@ -0,0 +1,33 @@
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from .authentication import CachedJWTAuthentication
+
+# WebSocket bağlantıları için SimpleJWT doğrulaması.
+# Tarayıcı WebSocket API'si header gönderemediği için access token
+# ?token=<jwt> query parametresi ile gelir; HTTP ile aynı doğrulama
+# (imza, süre, aktif kullanıcı) uygulanır.
+
+
+@database_sync_to_async
+def get_user(raw_token):
+    authentication = CachedJWTAuthentication()
+    try:
+        validated_token = authentication.get_validated_token(raw_token)
+        return authentication.get_user(validated_token)
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return AnonymousUser()
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+
+    async def __call__(self, scope, receive, send):
+        query = parse_qs(scope.get('query_string', b'').decode())
+        token = query.get('token', [None])[0]
+        scope = dict(scope, user=await get_user(token) if token else AnonymousUser())
+        return await super().__call__(scope, receive, send)
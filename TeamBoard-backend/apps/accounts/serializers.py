@@ -1,13 +1,33 @@
 from django.contrib.auth.models import User
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 
+from api.sparse import SparseFieldsetsMixin
+from api.timing import TimedSerializerMixin
 
-class UserSerializer(serializers.ModelSerializer):
+
+class UserSerializer(TimedSerializerMixin, SparseFieldsetsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'first_name', 'last_name']
 
-class RegisterSerializer(serializers.ModelSerializer):
+class LogoutSerializer(TimedSerializerMixin, serializers.Serializer):
+    refresh = serializers.CharField(required=False)
+
+    def validate_refresh(self, value):
+        try:
+            token = RefreshToken(value)
+        except TokenError:
+            raise serializers.ValidationError('Geçersiz veya süresi dolmuş refresh token.')
+        user = self.context['request'].user
+        if str(token.get(jwt_settings.USER_ID_CLAIM)) != str(user.pk):
+            raise serializers.ValidationError('Refresh token bu kullanıcıya ait değil.')
+        return token
+
+
+class RegisterSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, min_length=6)
 
     class Meta:
@@ -24,9 +44,13 @@ class RegisterSerializer(serializers.ModelSerializer):
         )
         return user       
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(TimedSerializerMixin, SparseFieldsetsMixin, serializers.ModelSerializer):
     display_name = serializers.SerializerMethodField()
 
+    # Liste action'ında get_display_name bu kolonlarla çağrılır (bkz. api/values.py);
+    # SQL TRIM, str.strip()'ten farklı olarak sekme / satır sonunu kırpmaz
+    values_method_sources = {'display_name': ('first_name', 'last_name', 'username')}
+
     class Meta:
         model = User
         fields = [
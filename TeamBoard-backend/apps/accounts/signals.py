@@ -0,0 +1,20 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import authentication
+
+# Kullanıcı değişince (deaktivasyon, şifre, yetki ...) request.user cache'i silinir
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, update_fields=None, **kwargs):
+    # Login sırasında sadece last_login güncellenir; cache'teki alanlar değişmez
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    authentication.invalidate([instance.id])
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    authentication.invalidate([instance.id])
@@ -1,3 +1,144 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
-# Create your tests here.
+from . import authentication
+
+# Cache miss'te kullanıcı + token blacklist kontrolü
+MISS_QUERIES = 2
+
+
+class CachedJWTAuthenticationTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        authentication.counter.reset()
+        self.user = User.objects.create_user(username='ayse', email='ayse@example.com')
+        self.authorize(AccessToken.for_user(self.user))
+
+    def authorize(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def test_second_request_resolves_user_without_query(self):
+        with self.assertNumQueries(MISS_QUERIES):
+            self.assertEqual(self.client.get('/api/auth/me/').status_code, 200)
+        with self.assertNumQueries(0):
+            body = self.client.get('/api/auth/me/').json()
+
+        self.assertEqual(body['data']['username'], 'ayse')
+        self.assertEqual(authentication.counter.snapshot()['hits'], 1)
+
+    def test_cache_is_per_token(self):
+        self.client.get('/api/auth/me/')
+        self.authorize(AccessToken.for_user(self.user))
+
+        with self.assertNumQueries(MISS_QUERIES):
+            self.client.get('/api/auth/me/')
+
+    def test_deactivated_user_is_rejected(self):
+        self.client.get('/api/auth/me/')
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.client.get('/api/auth/me/').status_code, 401)
+
+    def test_profile_and_password_changes_reload_user(self):
+        self.client.get('/api/auth/me/')
+
+        self.user.first_name = 'Ayşe'
+        self.user.set_password('yeni-sifre-123')
+        self.user.save()
+
+        with self.assertNumQueries(MISS_QUERIES):
+            body = self.client.get('/api/auth/me/').json()
+        self.assertEqual(body['data']['first_name'], 'Ayşe')
+
+    def test_last_login_update_keeps_cache(self):
+        self.client.get('/api/auth/me/')
+
+        self.user.save(update_fields=['last_login'])
+
+        with self.assertNumQueries(0):
+            self.client.get('/api/auth/me/')
+
+    def test_logout_revokes_only_that_token(self):
+        self.assertEqual(self.client.post('/api/auth/logout/').status_code, 200)
+
+        response = self.client.get('/api/auth/me/')
+        self.assertEqual(response.status_code, 401)
+        self.assertFalse(response.json()['success'])
+
+        self.authorize(AccessToken.for_user(self.user))
+        self.assertEqual(self.client.get('/api/auth/me/').status_code, 200)
+
+    def test_revoked_token_is_rejected_without_shared_cache(self):
+        # Başka worker'ın (ya da boşalmış) cache'i: iptal veritabanından okunur
+        token = AccessToken.for_user(self.user)
+        self.authorize(token)
+        self.client.get('/api/auth/me/')
+        authentication.revoke(token)
+        cache.clear()
+
+        self.assertEqual(self.client.get('/api/auth/me/').status_code, 401)
+
+    def test_logout_blacklists_refresh_token(self):
+        refresh = RefreshToken.for_user(self.user)
+        self.authorize(refresh.access_token)
+
+        response = self.client.post('/api/auth/logout/', {'refresh': str(refresh)}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.post('/api/auth/refresh/', {'refresh': str(refresh)}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_logout_rejects_refresh_token_of_other_user(self):
+        other = User.objects.create_user(username='mehmet')
+
+        response = self.client.post(
+            '/api/auth/logout/', {'refresh': str(RefreshToken.for_user(other))}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_cached_user_loads_other_fields_lazily(self):
+        self.client.get('/api/auth/me/')
+        token = AccessToken(str(self.client._credentials['HTTP_AUTHORIZATION'].split()[1]))
+
+        user = authentication.CachedJWTAuthentication().get_user(token)
+
+        self.assertEqual(user.pk, self.user.pk)
+        with self.assertNumQueries(1):
+            self.assertFalse(user.has_usable_password())
+
+
+class UserListValuesTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='viewer')
+        self.client.force_authenticate(self.user)
+        for username, first_name, last_name in (
+            ('ad_soyad', 'Ayşe', 'Yılmaz'),
+            ('sadece_ad', 'Mehmet', ''),
+            ('sadece_soyad', '', 'Kaya'),
+            ('bos', '', ''),
+            ('bosluklu', '  ', ' '),
+            ('ic_bosluk', ' Ali ', ' Veli '),
+            ('sekme', '\tZeynep', 'Demir\n'),
+            ('sadece_sekme', '\t', '\n'),
+        ):
+            User.objects.create_user(username=username, first_name=first_name, last_name=last_name)
+
+    def test_display_name_matches_serializer(self):
+        # .values() yolu get_display_name'i satır kolonlarıyla çağırır; sekme / satır sonu dahil aynı
+        with override_settings(VALUES_LIST_ENABLED=False):
+            expected = self.client.get('/api/users/').json()['data']['results']
+        actual = self.client.get('/api/users/').json()['data']['results']
+
+        self.assertEqual(len(actual), 8)
+        for actual_row, expected_row in zip(actual, expected):
+            self.assertEqual(list(actual_row), list(expected_row))
+            self.assertEqual(actual_row, expected_row)
@@ -1,14 +1,16 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework_simplejwt.views import (TokenObtainPairView,
                                             TokenRefreshView)
 
-from .views import MeView, RegisterView
+from .views import AsyncMeView, LogoutView, MeView, RegisterView
 
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('login/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('refresh/', TokenRefreshView.as_view(), name='token_refresh'),
-    path('me/', MeView.as_view(), name='me'),
+    path('me/', (AsyncMeView if settings.ASYNC_READ_VIEWS else MeView).as_view(), name='me'),
+    path('logout/', LogoutView.as_view(), name='logout'),
 ]
 
 
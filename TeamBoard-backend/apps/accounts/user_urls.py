@@ -1,10 +1,15 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import ActiveUserViewSet
+from .views import ActiveUserViewSet, AsyncActiveUserViewSet
 
 router = DefaultRouter()
-router.register(r'users', ActiveUserViewSet, basename='users')
+router.register(
+    r'users',
+    AsyncActiveUserViewSet if settings.ASYNC_READ_VIEWS else ActiveUserViewSet,
+    basename='users',
+)
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -1,32 +1,93 @@
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.shortcuts import render
 from rest_framework import generics, permissions, viewsets
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .serializers import RegisterSerializer, UserListSerializer, UserSerializer
+from api.async_views import AsyncAPIViewMixin
+from api.exceptions import BusinessLogicException
+from api.sparse import SparseQuerysetMixin, columns_for
+from api.timing import TimedViewMixin
+from api.values import ValuesListMixin
 
+from . import authentication
+from .serializers import (LogoutSerializer, RegisterSerializer,
+                          UserListSerializer, UserSerializer)
 
-class RegisterView(generics.CreateAPIView):
+
+class RegisterView(TimedViewMixin, generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [permissions.AllowAny]
 
 
-class MeView(APIView):
+class MeView(TimedViewMixin, APIView):
+
+    # ?fields= (bkz. api/sparse.py); kullanıcı zaten yüklü, sorgu yok
+    sparse_fieldsets = True
+
     def get(self, request):
-        serializer = UserSerializer(request.user)
+        serializer = UserSerializer(request.user, context={'request': request, 'view': self})
         return Response(serializer.data)
+
+
+# ASGI'da (ASYNC_READ_VIEWS) kullanılır; kullanıcı auth cache'inden gelir
+class AsyncMeView(AsyncAPIViewMixin, MeView):
+
+    async_actions = ('get',)
+
+    async def aget(self, request):
+        return self.get(request)
     
-class ActiveUserViewSet(viewsets.ReadOnlyModelViewSet):
+class LogoutView(TimedViewMixin, APIView):
+
+    # Kullanılan access token'ı ve gönderilen refresh token'ı süreleri dolana
+    # kadar geçersiz kılar ({"refresh": "..."}; aksi halde istemci refresh ile
+    # yeni access token alabilir)
+    def post(self, request):
+        if not settings.AUTH_TOKEN_DENYLIST:
+            raise BusinessLogicException(detail='Token iptali bu sunucuda kapalı.')
+
+        serializer = LogoutSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            authentication.revoke(request.auth)
+            refresh = serializer.validated_data.get('refresh')
+            if refresh is not None:
+                refresh.blacklist()
+        return Response({'message': 'Çıkış yapıldı.'})
+
+# UserListSerializer alanı -> okuduğu kolonlar (bkz. api/sparse.py)
+USER_LIST_FIELD_COLUMNS = {
+    'display_name': ('first_name', 'last_name', 'username'),
+}
+
+
+class ActiveUserViewSet(TimedViewMixin, SparseQuerysetMixin, ValuesListMixin,
+                        viewsets.ReadOnlyModelViewSet):
    
     serializer_class = UserListSerializer
     permission_classes = [permissions.IsAuthenticated]
+    ordering = ('username',)
+    ordering_fields = ('username', 'id')
 
     def get_queryset(self):
         return (
             User.objects
             .filter(is_active=True)
             .exclude(id=self.request.user.id)
+            .only(*columns_for(
+                self.sparse_fields(), USER_LIST_FIELD_COLUMNS, always=self.ordering_fields
+            ))
             .order_by("username")
         )
+
+
+class AsyncActiveUserViewSet(AsyncAPIViewMixin, ActiveUserViewSet):
+
+    async_actions = ('list',)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.alist_response(self.filter_queryset(self.get_queryset()))
@@ -8,6 +8,7 @@ class BoardsConfig(AppConfig):
     name = 'apps.boards'
 
     def ready(self):
+        from . import signals  # noqa: F401
 
         if "runserver" in sys.argv:
 
@@ -0,0 +1,117 @@
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from . import membership, realtime
+from .models import Project
+from .permissions import parse_id
+
+# ws://<host>/ws/boards/?token=<access token>
+#
+# İstemci mesajları:
+#   {"action": "subscribe", "team": 1}
+#   {"action": "subscribe", "project": 5}
+#   {"action": "unsubscribe", "project": 5}
+#
+# Sunucu mesajları:
+#   {"type": "subscribed" | "unsubscribed", "team"|"project": id}
+#   ("unsubscribed" sunucudan da gelir: kullanıcı takımdan çıkarıldıysa)
+#   {"type": "error", "message": ...}
+#   {"type": "task.updated", "id": ..., "team": 1, "project": 5, "data": {...}}
+#
+# Yetki abonelik anında ve her olayda membership cache'inden kontrol edilir;
+# takımdan çıkarılan kullanıcı o takımın olaylarını almaz, abonelikleri
+# ilk olayda kaldırılır.
+
+CLOSE_UNAUTHORIZED = 4401
+
+ACTIONS = ('subscribe', 'unsubscribe')
+TARGETS = ('team', 'project')
+
+
+class BoardConsumer(AsyncJsonWebsocketConsumer):
+
+    async def connect(self):
+        user = self.scope.get('user')
+        if user is None or not user.is_authenticated:
+            await self.close(code=CLOSE_UNAUTHORIZED)
+            return
+        self.subscriptions = set()
+        await self.accept()
+
+    async def disconnect(self, code):
+        for group in getattr(self, 'subscriptions', ()):
+            await self.channel_layer.group_discard(group, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        action = content.get('action') if isinstance(content, dict) else None
+        target = next((name for name in TARGETS if name in content), None) if action else None
+        if action not in ACTIONS or target is None:
+            await self.send_error('Geçersiz mesaj.')
+            return
+
+        object_id = parse_id(content[target])
+        group = await self.resolve_group(target, object_id)
+        if group is None:
+            await self.send_error('Bu içeriğe erişmek için ilgili takımın üyesi olmanız gerekiyor.')
+            return
+
+        if action == 'subscribe':
+            await self.channel_layer.group_add(group, self.channel_name)
+            self.subscriptions.add(group)
+            await self.send_json({'type': 'subscribed', target: object_id})
+        else:
+            await self.channel_layer.group_discard(group, self.channel_name)
+            self.subscriptions.discard(group)
+            await self.send_json({'type': 'unsubscribed', target: object_id})
+
+    @database_sync_to_async
+    def resolve_group(self, target, object_id):
+        if object_id is None:
+            return None
+        user = self.scope['user']
+
+        if target == 'team':
+            if membership.get_role(user, object_id) is None:
+                return None
+            return realtime.team_group(object_id)
+
+        team_id = (
+            Project.objects.filter(pk=object_id)
+            .values_list('team_id', flat=True)
+            .first()
+        )
+        if team_id is None or membership.get_role(user, team_id) is None:
+            return None
+        return realtime.project_group(object_id)
+
+    async def send_error(self, message):
+        await self.send_json({'type': 'error', 'message': message})
+
+    @database_sync_to_async
+    def is_member(self, team_id):
+        return membership.get_role(self.scope['user'], team_id) is not None
+
+    # realtime.publish() ile gönderilen olaylar
+    async def board_event(self, message):
+        if not await self.is_member(message['team']):
+            await self.drop_subscriptions(message['team'], message['project'])
+            return
+        await self.send_json({
+            'type': message['event'],
+            'id': message['id'],
+            'team': message['team'],
+            'project': message['project'],
+            'data': message['data'],
+        })
+
+    async def drop_subscriptions(self, team_id, project_id):
+        groups = {'team': realtime.team_group(team_id)}
+        if project_id is not None:
+            groups['project'] = realtime.project_group(project_id)
+        for target, group in groups.items():
+            if group not in self.subscriptions:
+                continue
+            await self.channel_layer.group_discard(group, self.channel_name)
+            self.subscriptions.discard(group)
+            object_id = team_id if target == 'team' else project_id
+            await self.send_json({'type': 'unsubscribed', target: object_id})
@@ -0,0 +1,285 @@
+from collections import Counter, defaultdict
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+# Team.project_count ve Project görev sayaçları (durum başına, gecikmiş).
+#
+# Sayaçlar yazma yollarında tek bir UPDATE ... SET x = x + n (F()) ile
+# güncellenir; okuma ve güncelleme arasında yarış yoktur:
+#   - Task.save / Project.save: signals.py (post_save)
+#   - Task.delete / Project.delete ve QuerySet.delete(): models.py
+#   - Görev bulk_create / bulk_update: views.TaskViewSet.bulk
+# Proje/takım silinince alt kayıtların sayaçları satırla birlikte gider.
+# Sinyal göndermeyen diğer yollar (QuerySet.update, seed) sonrasında
+# repair_board_counters çalıştırılmalıdır.
+#
+# Gecikmiş görev (due_date < bugün, done değil) sayısı güne bağlıdır:
+# overdue_counted_on hangi gün için sayıldığını tutar. Artış/azalışlar sadece
+# sayaç bugüne aitse uygulanır; gün değişince refresh_overdue (günlük
+# `repair_board_counters --overdue`) eski sayaçları tek sorguyla yeniden sayar.
+#
+# Sayaçlar yanıtların parçası olduğundan (project_count, task_counts) değişen
+# takım/projenin updated_at'i de güncellenir; ETag / Last-Modified ve
+# /api/sync/ bunu görür.
+
+STATUS_FIELDS = {
+    'todo': 'todo_count',
+    'in_progress': 'in_progress_count',
+    'done': 'done_count',
+}
+OVERDUE_FIELD = 'overdue_count'
+DONE = 'done'
+
+
+def _model(name):
+    return apps.get_model('boards', name)
+
+
+def is_overdue(status, due_date, today):
+    return due_date is not None and due_date < today and status != DONE
+
+
+def loaded_state(instance):
+    # from_db sırasında alanlardan biri defer edilmişse None (bkz. Task.from_db)
+    return getattr(instance, '_counter_state', None)
+
+
+def current_state(task):
+    return (task.project_id, task.status, task.due_date)
+
+
+class TaskDeltas:
+
+    """Proje -> sayaç alanı -> değişim."""
+
+    def __init__(self, today=None):
+        self.today = today or timezone.localdate()
+        self.changes = defaultdict(Counter)
+        self.recount = set()
+
+    def add(self, state, sign):
+        project_id, status, due_date = state
+        if project_id is None:
+            return
+        changes = self.changes[project_id]
+        changes[STATUS_FIELDS[status]] += sign
+        if is_overdue(status, due_date, self.today):
+            changes[OVERDUE_FIELD] += sign
+
+    def move(self, old, new):
+        if old != new:
+            self.add(old, -1)
+            self.add(new, 1)
+
+    def apply(self):
+        Project = _model('Project')
+        now = timezone.now()
+        for project_id, changes in self.changes.items():
+            values = {
+                field: F(field) + delta
+                for field, delta in changes.items()
+                if delta and field != OVERDUE_FIELD
+            }
+            overdue = changes.get(OVERDUE_FIELD)
+            if overdue:
+                # Sayaç bugüne ait değilse dokunulmaz; refresh_overdue yeniden sayar
+                values[OVERDUE_FIELD] = Case(
+                    When(overdue_counted_on=self.today, then=F(OVERDUE_FIELD) + overdue),
+                    default=F(OVERDUE_FIELD),
+                )
+            if values:
+                Project.objects.filter(pk=project_id).update(updated_at=now, **values)
+        if self.recount:
+            recount_projects(self.recount)
+
+
+def tasks_saved(tasks, created=False):
+    deltas = TaskDeltas()
+    for task in tasks:
+        new = current_state(task)
+        if created:
+            deltas.add(new, 1)
+        else:
+            old = loaded_state(task)
+            if old is None:
+                # Eski değerler bilinmiyor (defer edilmiş ya da yüklenmemiş)
+                deltas.recount.update(
+                    {task.project_id, getattr(task, '_loaded_project_id', None)} - {None}
+                )
+            else:
+                deltas.move(old, new)
+        task._counter_state = new
+    deltas.apply()
+
+
+def tasks_deleted(tasks):
+    deltas = TaskDeltas()
+    for task in tasks:
+        deltas.add(loaded_state(task) or current_state(task), -1)
+    deltas.apply()
+
+
+def task_queryset_deleted(queryset):
+    """QuerySet.delete()'ten önce: silinecek görevler gruplanarak düşülür."""
+    today = timezone.localdate()
+    rows = (
+        queryset.order_by()
+        .values('project_id', 'status')
+        .annotate(
+            total=Count('pk'),
+            overdue=Count('pk', filter=Q(due_date__lt=today) & ~Q(status=DONE)),
+        )
+    )
+    deltas = TaskDeltas(today)
+    for row in rows:
+        changes = deltas.changes[row['project_id']]
+        changes[STATUS_FIELDS[row['status']]] -= row['total']
+        changes[OVERDUE_FIELD] -= row['overdue']
+    deltas.apply()
+
+
+def change_project_count(changes):
+    """{team_id: değişim}"""
+    Team = _model('Team')
+    now = timezone.now()
+    for team_id, delta in changes.items():
+        if team_id is not None and delta:
+            Team.objects.filter(pk=team_id).update(
+                project_count=F('project_count') + delta, updated_at=now
+            )
+
+
+def project_saved(project, created):
+    if created:
+        change_project_count({project.team_id: 1})
+        return
+    loaded = getattr(project, '_loaded_team_id', None)
+    if loaded is not None and loaded != project.team_id:
+        change_project_count({loaded: -1, project.team_id: 1})
+
+
+def project_queryset_deleted(queryset):
+    rows = queryset.order_by().values('team_id').annotate(total=Count('pk'))
+    change_project_count({row['team_id']: -row['total'] for row in rows})
+
+
+# Yeniden sayma (repair_board_counters, migration, gün değişimi)
+
+def _task_count(**filters):
+    Task = _model('Task')
+    return Coalesce(
+        Subquery(
+            Task.objects.filter(project_id=OuterRef('pk'), **filters)
+            .order_by().values('project_id').annotate(total=Count('pk')).values('total')
+        ),
+        Value(0),
+    )
+
+
+def _overdue_count(today):
+    Task = _model('Task')
+    return Coalesce(
+        Subquery(
+            Task.objects.filter(project_id=OuterRef('pk'), due_date__lt=today)
+            .exclude(status=DONE)
+            .order_by().values('project_id').annotate(total=Count('pk')).values('total')
+        ),
+        Value(0),
+    )
+
+
+def _project_counts(today):
+    return {
+        **{field: _task_count(status=status) for status, field in STATUS_FIELDS.items()},
+        OVERDUE_FIELD: _overdue_count(today),
+    }
+
+
+def _project_count():
+    Project = _model('Project')
+    return Coalesce(
+        Subquery(
+            Project.objects.filter(team_id=OuterRef('pk'))
+            .order_by().values('team_id').annotate(total=Count('pk')).values('total')
+        ),
+        Value(0),
+    )
+
+
+def recount_projects(project_ids, today=None):
+    """Projelerin tüm sayaçlarını tek UPDATE ile yeniden sayar."""
+    Project = _model('Project')
+    today = today or timezone.localdate()
+    return Project.objects.filter(pk__in=project_ids).update(
+        **_project_counts(today),
+        overdue_counted_on=today,
+        updated_at=timezone.now(),
+    )
+
+
+def recount_teams(team_ids):
+    Team = _model('Team')
+    return Team.objects.filter(pk__in=team_ids).update(
+        project_count=_project_count(), updated_at=timezone.now()
+    )
+
+
+def repair_projects(project_ids, today=None):
+    """
+    Sayaçları gerçek değerden farklı olan projeleri yeniden sayar ve takım
+    id'lerini döner. Doğru sayaçlı projelere (updated_at dahil) dokunulmaz.
+    """
+    Project = _model('Project')
+    today = today or timezone.localdate()
+    stale = dict(
+        Project.objects.filter(pk__in=project_ids)
+        .exclude(overdue_counted_on=today, **_project_counts(today))
+        .values_list('pk', 'team_id')
+    )
+    if stale:
+        recount_projects(stale, today)
+    return set(stale.values())
+
+
+def repair_teams(team_ids):
+    Team = _model('Team')
+    stale = list(
+        Team.objects.filter(pk__in=team_ids)
+        .exclude(project_count=_project_count())
+        .values_list('pk', flat=True)
+    )
+    if stale:
+        recount_teams(stale)
+    return set(stale)
+
+
+def refresh_overdue(project_ids=None, today=None):
+    """
+    Bugüne ait olmayan gecikmiş görev sayaçlarını yeniden sayar (gün
+    değişimi). Sayısı değişen projelerin takım id'lerini döner; değişmeyen
+    projelerin updated_at'i korunur.
+    """
+    Project = _model('Project')
+    today = today or timezone.localdate()
+    stale = Project.objects.exclude(overdue_counted_on=today)
+    if project_ids is not None:
+        stale = stale.filter(pk__in=project_ids)
+
+    overdue = _overdue_count(today)
+    with transaction.atomic():
+        changed = dict(stale.exclude(overdue_count=overdue).values_list('pk', 'team_id'))
+        # Tek UPDATE: sayma ve overdue_counted_on aynı satır kilidi altında,
+        # araya giren görev değişimi kaybolmaz
+        stale.update(
+            updated_at=Case(
+                When(overdue_count=overdue, then=F('updated_at')),
+                default=Value(timezone.now()),
+            ),
+            overdue_count=overdue,
+            overdue_counted_on=today,
+        )
+    return set(changed.values())
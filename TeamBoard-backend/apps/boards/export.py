@@ -0,0 +1,105 @@
+import csv
+import io
+from datetime import date
+from itertools import islice
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from api.renderers import CustomJSONRenderer
+
+# GET /api/tasks/export/?format=ndjson|csv
+#
+# Satırlar Task nesnesi ve serializer olmadan values_list().iterator() ile
+# okunur (Postgres'te server-side cursor) ve parça parça yazılır; bellek
+# kullanımı toplam satır sayısından bağımsızdır. CSV başlığı sorgu
+# çalışmadan önce gönderilir.
+
+COLUMNS = (
+    ('id', 'id'),
+    ('title', 'title'),
+    ('description', 'description'),
+    ('project', 'project_id'),
+    ('assignee', 'assignee_id'),
+    ('assignee_username', 'assignee__username'),
+    ('status', 'status'),
+    ('due_date', 'due_date'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+)
+HEADER = [name for name, _ in COLUMNS]
+
+
+# Renderer'lar ?format= ile içerik seçimi için var; başarılı gövde
+# stream_response() ile yazılır, hata yanıtları TaskViewSet.handle_exception
+# içinde tekrar JSON zarfına çevrilir.
+
+class NDJSONRenderer(CustomJSONRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
+class CSVRenderer(CustomJSONRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+
+def _rows(queryset):
+    return (
+        queryset.values_list(*(column for _, column in COLUMNS))
+        .iterator(chunk_size=settings.TASK_EXPORT_CHUNK_SIZE)
+    )
+
+
+def _batches(rows):
+    size = settings.TASK_EXPORT_CHUNK_SIZE
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _csv_value(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def iter_ndjson(queryset):
+    encoder = JSONEncoder(ensure_ascii=False)
+    for batch in _batches(_rows(queryset)):
+        yield ''.join(
+            encoder.encode(dict(zip(HEADER, row))) + '\n' for row in batch
+        )
+
+
+def iter_csv(queryset):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(HEADER)
+    yield flush()
+
+    for batch in _batches(_rows(queryset)):
+        writer.writerows([_csv_value(value) for value in row] for row in batch)
+        yield flush()
+
+
+STREAMS = {
+    NDJSONRenderer.format: (iter_ndjson, NDJSONRenderer.media_type),
+    CSVRenderer.format: (iter_csv, CSVRenderer.media_type),
+}
+
+
+def stream_response(queryset, fmt, filename='tasks'):
+    iterator, media_type = STREAMS[fmt]
+    response = StreamingHttpResponse(
+        iterator(queryset), content_type=f'{media_type}; charset=utf-8'
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{fmt}"'
+    return response
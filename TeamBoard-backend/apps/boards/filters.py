@@ -2,27 +2,28 @@ import django_filters
 
 from .models import Project, Task
 
+# İlişki filtreleri (team, project, assignee) id üzerinden NumberFilter olarak
+# tanımlı; ModelChoiceFilter her istekte seçilen satırı doğrulamak için ayrı
+# bir SELECT atıyordu. Görünürlük zaten viewset queryset'inde sağlanıyor.
+
 
 class ProjectFilter(django_filters.FilterSet):
+    team = django_filters.NumberFilter(field_name='team_id')
+
     class Meta:
         model = Project
         fields = {
-            'team': ['exact'],
             'is_active': ['exact'],
         }
 
 class TaskFilter(django_filters.FilterSet):
+    project = django_filters.NumberFilter(field_name='project_id')
+    assignee = django_filters.NumberFilter(field_name='assignee_id')
     due_before = django_filters.DateFilter(field_name='due_date', lookup_expr='lte')
     due_after = django_filters.DateFilter(field_name='due_date', lookup_expr='gte')
 
     class Meta:
         model = Task
         fields = {
-            'project': ['exact'],
-            'assignee': ['exact'],
             'status': ['exact'],
         }
-
-      
-
-        
\ No newline at end of file
@@ -0,0 +1,207 @@
+import atexit
+import datetime
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+from django.utils import timezone
+
+from api import metrics
+
+from .models import TaskEvent
+
+# Görev geçmişi (TaskEvent): kim, ne zaman, hangi alanı, eski / yeni değer.
+#
+# Eski değerler istekte zaten yüklü olan instance'tan alınır (snapshot);
+# kayıttan sonra farklar olay olarak toplanır. Ek SELECT yapılmaz.
+#
+# Olaylar transaction commit olunca (on_commit) process içi bir kuyruğa
+# konur; arka plan thread'i kuyruğu TASK_HISTORY_BATCH_SIZE'lık gruplar
+# halinde, en geç TASK_HISTORY_FLUSH_INTERVAL saniyede bir bulk_create ile
+# yazar. İstek thread'i veritabanına geçmiş için hiç yazmaz. Kuyruk doluysa
+# olay atılır ve sayılır (GET /api/metrics/ içinde "task_history").
+# Process kapanırken (atexit, gunicorn worker_exit) kuyrukta kalanlar yazılır.
+#
+# TASK_HISTORY_WRITE_BEHIND=False: olaylar commit sonrasında istek
+# thread'inde yazılır (testler; test transaction'ı arka plan thread'inin
+# bağlantısından görünmez).
+
+logger = logging.getLogger(__name__)
+
+# Model alanı -> geçmişte görünen ad (API'deki alan adları)
+TRACKED_FIELDS = {
+    'title': 'title',
+    'description': 'description',
+    'status': 'status',
+    'assignee_id': 'assignee',
+    'project_id': 'project',
+    'due_date': 'due_date',
+}
+
+
+def _json_value(value):
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def snapshot(task):
+    """Yüklü alanların değerleri; defer edilmiş alan okunmaz (sorgu yok)."""
+    return {
+        attname: _json_value(task.__dict__[attname])
+        for attname in TRACKED_FIELDS
+        if attname in task.__dict__
+    }
+
+
+def _event(task, user, field, old_value=None, new_value=None, at=None):
+    return TaskEvent(
+        task_id=task.pk,
+        user_id=getattr(user, 'pk', None),
+        username=getattr(user, 'username', ''),
+        field=field,
+        old_value=old_value,
+        new_value=new_value,
+        created_at=at or timezone.now(),
+    )
+
+
+def created(task, user, at=None):
+    return [_event(task, user, TaskEvent.FIELD_CREATED, at=at)]
+
+
+def changes(task, before, user, at=None):
+    """snapshot(task) ile kayıttan sonraki değerler arasındaki farklar."""
+    at = at or timezone.now()
+    after = snapshot(task)
+    return [
+        _event(task, user, TRACKED_FIELDS[attname], old_value, after[attname], at)
+        for attname, old_value in before.items()
+        if attname in after and after[attname] != old_value
+    ]
+
+
+def record(events):
+    events = list(events)
+    if not events:
+        return
+    if settings.TASK_HISTORY_WRITE_BEHIND:
+        transaction.on_commit(lambda: writer.add(events))
+    else:
+        transaction.on_commit(lambda: writer.write(events))
+
+
+class HistoryStats:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def add(self, name, count=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + count)
+
+    def snapshot(self):
+        return {
+            'queued': self.queued,
+            'written': self.written,
+            'dropped': self.dropped,
+            'failed': self.failed,
+        }
+
+
+stats = HistoryStats()
+metrics.register('task_history', stats.snapshot)
+
+
+class EventWriter:
+
+    """
+    Kuyruğu arka plan thread'inde boşaltır (api/log.BatchQueueListener
+    gibi); bir batch dolana ya da flush_interval geçene kadar bekler.
+    Thread ilk olayla başlar.
+    """
+
+    sentinel = None
+
+    def __init__(self):
+        self.queue = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.queue = queue.Queue(maxsize=settings.TASK_HISTORY_QUEUE_SIZE)
+            self._thread = threading.Thread(
+                target=self._monitor, name='task-history-writer', daemon=True,
+            )
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def add(self, events):
+        self.start()
+        for event in events:
+            try:
+                self.queue.put_nowait(event)
+            except queue.Full:
+                stats.add('dropped')
+            else:
+                stats.add('queued')
+
+    def _monitor(self):
+        batch_size = settings.TASK_HISTORY_BATCH_SIZE
+        interval = settings.TASK_HISTORY_FLUSH_INTERVAL
+        try:
+            while True:
+                batch = [self.queue.get()]
+                deadline = time.monotonic() + interval
+                while len(batch) < batch_size and batch[-1] is not self.sentinel:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(self.queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+
+                events = [event for event in batch if event is not self.sentinel]
+                if events:
+                    # İstek döngüsündeki gibi: süresi dolan bağlantı kapanır
+                    # (havuzda CONN_MAX_AGE=0; bağlantı havuza geri döner)
+                    close_old_connections()
+                    self.write(events)
+                    close_old_connections()
+                if len(events) != len(batch):
+                    return
+        finally:
+            connections.close_all()
+
+    def write(self, events):
+        try:
+            TaskEvent.objects.bulk_create(events, batch_size=settings.TASK_HISTORY_BATCH_SIZE)
+        except Exception:
+            # Geçmiş yazılamadı diye thread durmasın; olaylar kaybolur
+            stats.add('failed', len(events))
+            logger.exception('Could not write %s task history event(s)', len(events))
+        else:
+            stats.add('written', len(events))
+
+    def stop(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None:
+            return
+        # Kuyruk doluysa boşalmasını bekler; kalan olaylar yazılır
+        self.queue.put(self.sentinel)
+        thread.join()
+
+
+writer = EventWriter()
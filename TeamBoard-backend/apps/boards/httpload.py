@@ -0,0 +1,320 @@
+import asyncio
+import os
+import random
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+
+from django.conf import settings
+
+from .loadtest import build_request, percentile
+
+# Gerçek HTTP sunucusu (gunicorn) üzerinden eşzamanlı okuma yükü.
+#
+# loadtest.LoadRunner uygulamayı test Client'ıyla süreç içinde çağırır;
+# burada ise sunucu ayrı süreçte başlatılır ve çok sayıda keep-alive
+# bağlantı asyncio ile aynı anda açık tutulur. Böylece WSGI (gthread) ve
+# ASGI (uvicorn + async view'lar) profilleri aynı veri ve aynı istek
+# karışımıyla karşılaştırılır: throughput, gecikme ve sunucu süreçlerinin
+# bağlantı başına bellek artışı (RSS, /proc üzerinden; sadece Linux).
+#
+# İstemci ve sunucu aynı makinede çalışır; sonuçlar mutlak değil,
+# profiller arası karşılaştırma içindir.
+
+READ_SCENARIOS = ('list', 'detail')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def process_tree_rss_kb(pid):
+    """Sürecin ve tüm alt süreçlerinin RSS toplamı (KB)."""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f'/proc/{current}/status') as status:
+                for line in status:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1])
+                        break
+            with open(f'/proc/{current}/task/{current}/children') as children:
+                pending.extend(int(child) for child in children.read().split())
+        except (FileNotFoundError, ProcessLookupError):
+            continue
+    return total
+
+
+class ServerProcess:
+
+    """gunicorn.conf.py profiliyle ayrı süreçte çalışan sunucu."""
+
+    def __init__(self, mode, workers, port=None, startup_timeout=30):
+        self.mode = mode
+        self.workers = workers
+        self.port = port or free_port()
+        self.startup_timeout = startup_timeout
+        self.process = None
+
+    def environ(self):
+        return {
+            **os.environ,
+            'SERVER_MODE': self.mode,
+            # ASGI profili async okuma view'larıyla (api/async_views.py) ölçülür
+            'ASYNC_READ_VIEWS': str(self.mode == 'asgi'),
+            'WEB_CONCURRENCY': str(self.workers),
+            # Yük sadece okuma; worker'lar arası invalidation gerekmez
+            'ALLOW_PROCESS_LOCAL_CACHE': 'True',
+            'GUNICORN_BIND': f'127.0.0.1:{self.port}',
+            'SECRET_KEY': settings.SECRET_KEY,
+        }
+
+    def __enter__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py'],
+            cwd=settings.BASE_DIR,
+            env=self.environ(),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            self.wait_ready()
+        except BaseException:
+            self.stop()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def wait_ready(self):
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f'{self.mode} server exited with {self.process.returncode}')
+            try:
+                status = asyncio.run(self.probe())
+            except OSError:
+                status = None
+            if status is not None:
+                return
+            time.sleep(0.2)
+        raise RuntimeError(f'{self.mode} server did not start in {self.startup_timeout}s')
+
+    async def probe(self):
+        connection = HTTPConnection('127.0.0.1', self.port)
+        try:
+            status, _ = await connection.request('GET', '/api/auth/me/', {})
+        finally:
+            await connection.close()
+        return status
+
+    def rss_kb(self):
+        return process_tree_rss_kb(self.process.pid)
+
+    def stop(self):
+        if self.process is None or self.process.poll() is not None:
+            return
+        self.process.send_signal(signal.SIGTERM)
+        try:
+            self.process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class HTTPConnection:
+
+    """Tek keep-alive bağlantı üzerinde sıralı HTTP/1.1 istekleri."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+            self.reader = self.writer = None
+
+    async def request(self, method, path, headers):
+        reused = self.writer is not None
+        try:
+            return await self.send(method, path, headers)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            if not reused:
+                raise
+            # Sunucu boşta kalan keep-alive bağlantıyı kapatmış; tarayıcılar
+            # gibi yeni bağlantıyla bir kez tekrar denenir
+            await self.close()
+            return await self.send(method, path, headers)
+
+    async def send(self, method, path, headers):
+        if self.writer is None:
+            await self.connect()
+
+        lines = [f'{method} {path} HTTP/1.1', f'Host: {self.host}:{self.port}']
+        lines += [f'{name}: {value}' for name, value in headers.items()]
+        self.writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode())
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        status = int(status_line.split()[1])
+        response_headers = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(':')
+                response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get('transfer-encoding') == 'chunked':
+            body = await self.read_chunked()
+        else:
+            body = await self.reader.readexactly(int(response_headers.get('content-length', 0)))
+
+        if response_headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, body
+
+    async def read_chunked(self):
+        parts = []
+        while True:
+            size = int((await self.reader.readuntil(b'\r\n')).split(b';')[0], 16)
+            if size == 0:
+                await self.reader.readuntil(b'\r\n')
+                return b''.join(parts)
+            parts.append(await self.reader.readexactly(size))
+            await self.reader.readexactly(2)
+
+
+class HTTPLoadRunner:
+
+    """
+    `clients` bağlantı aynı anda açılır; her biri `requests` okuma isteğini
+    sırayla atar (öncesinde `warmup` ölçülmeyen istek). Yük sürerken
+    sunucu süreçlerinin RSS'i örneklenir.
+    """
+
+    def __init__(self, server, actors, mix, clients=1000, requests=20, warmup=2,
+                 random_seed=0, sample_interval=0.2):
+        self.server = server
+        self.actors = [actor for actor in actors if actor.task_ids and actor.project_ids]
+        if not self.actors:
+            raise ValueError('No actors with tasks; seed the database first (manage.py seed_boards).')
+        self.mix = {name: weight for name, weight in mix.items() if name in READ_SCENARIOS}
+        if not self.mix:
+            raise ValueError(f'Mix must contain one of {READ_SCENARIOS}')
+        self.clients = clients
+        self.requests = requests
+        self.warmup = warmup
+        self.random_seed = random_seed
+        self.sample_interval = sample_interval
+
+    def run(self):
+        return asyncio.run(self.arun())
+
+    async def arun(self):
+        self.samples = []
+        self.warm = 0
+        self.all_warm = asyncio.Event()
+        self.start = asyncio.Event()
+        idle_rss = self.server.rss_kb()
+        peak_rss = idle_rss
+
+        clients = asyncio.gather(*(self.client(index) for index in range(self.clients)))
+        # Ölçüm tüm bağlantılar açılıp ısındıktan sonra başlar
+        await self.all_warm.wait()
+        begin = time.perf_counter()
+        self.start.set()
+        while not clients.done():
+            peak_rss = max(peak_rss, self.server.rss_kb())
+            await asyncio.wait([clients], timeout=self.sample_interval)
+        await clients
+        elapsed = time.perf_counter() - begin
+
+        return {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'mode': self.server.mode,
+            'workers': self.server.workers,
+            'clients': self.clients,
+            'requests_per_client': self.requests,
+            'mix': self.mix,
+            'elapsed_s': round(elapsed, 3),
+            **summarize_http(self.samples, elapsed),
+            'idle_rss_mb': round(idle_rss / 1024, 1),
+            'peak_rss_mb': round(peak_rss / 1024, 1),
+            'rss_per_connection_kb': round(max(peak_rss - idle_rss, 0) / self.clients, 1),
+        }
+
+    async def client(self, index):
+        rng = random.Random(self.random_seed + index)
+        actor = self.actors[index % len(self.actors)]
+        names = list(self.mix)
+        weights = list(self.mix.values())
+        headers = {'Authorization': f'Bearer {actor.token}', 'Connection': 'keep-alive'}
+        connection = HTTPConnection('127.0.0.1', self.server.port)
+
+        async def one():
+            method, path, params = build_request(rng.choices(names, weights)[0], actor, rng)
+            if params:
+                path = f'{path}?{urlencode(params)}'
+            started = time.perf_counter()
+            try:
+                status, _ = await connection.request(method.upper(), path, headers)
+            except (OSError, asyncio.IncompleteReadError, ValueError):
+                # Bağlantı koptuysa sonraki istek yeniden bağlanır
+                await connection.close()
+                status = 599
+            return (time.perf_counter() - started) * 1000, status
+
+        try:
+            for _ in range(self.warmup):
+                await one()
+        finally:
+            self.warm += 1
+            if self.warm == self.clients:
+                self.all_warm.set()
+
+        await self.start.wait()
+        try:
+            for _ in range(self.requests):
+                self.samples.append(await one())
+        finally:
+            await connection.close()
+
+
+def summarize_http(samples, elapsed):
+    timings = [sample[0] for sample in samples]
+    if not timings:
+        return {
+            **dict.fromkeys(('requests', 'rps', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'errors'), 0),
+            'statuses': {},
+        }
+    return {
+        'requests': len(samples),
+        'rps': round(len(samples) / elapsed, 1),
+        'p50_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'p99_ms': round(percentile(timings, 99), 2),
+        'max_ms': round(max(timings), 2),
+        'errors': sum(1 for sample in samples if sample[1] >= 400),
+        'statuses': dict(Counter(sample[1] for sample in samples)),
+    }
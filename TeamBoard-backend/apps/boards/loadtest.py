@@ -0,0 +1,306 @@
+import json
+import random
+import statistics
+import threading
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.db import close_old_connections, connection, connections
+from django.db.backends.signals import connection_created
+from django.db.models import Count
+from django.test import Client
+from django.utils import timezone as django_timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Project, Task, Team
+
+# Seed edilmiş veri üzerinde gerçek URL'lere (api/urls.py) eşzamanlı yük.
+#
+# İstekler Django test Client'ı ile uygulamanın tamamından (middleware,
+# JWT doğrulama, DRF, renderer) geçer; HTTP sunucusu ölçüme dahil değildir.
+# Her thread kendi DB bağlantısını kullanır ve ayrı takım sahipleri
+# (actor) adına istek atar; üye düzenleme senaryosu böylece çakışmaz.
+#
+# Sonuçlar senaryo bazında: istek sayısı, throughput, p50/p95/p99 ve
+# istek başına SQL sorgu sayısı. save_baseline()/compare() ile JSON olarak
+# saklanıp sonraki değişikliklerle karşılaştırılır.
+
+SCENARIOS = ('list', 'detail', 'status', 'members')
+DEFAULT_MIX = {'list': 50, 'detail': 30, 'status': 15, 'members': 5}
+
+TASK_SAMPLE = 200
+
+
+def parse_mix(value):
+    """'list=50,detail=30' -> {'list': 50, 'detail': 30}"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        if name not in SCENARIOS or not weight.isdigit():
+            raise ValueError(value)
+        mix[name] = int(weight)
+    return mix
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+class Actor:
+
+    """Sahibi olduğu takımlar üzerinde istek atan kullanıcı."""
+
+    def __init__(self, user, team_id, member_ids, candidate_ids, project_ids, task_ids):
+        self.user = user
+        self.token = str(AccessToken.for_user(user))
+        self.team_id = team_id
+        self.member_ids = set(member_ids)
+        self.candidate_ids = candidate_ids
+        self.project_ids = project_ids
+        self.task_ids = task_ids
+
+
+def load_actors(count, rng):
+    # En az bir görevi olan takımların sahipleri
+    teams = list(
+        Team.objects.annotate(task_count=Count('projects__tasks'))
+        .filter(task_count__gt=0)
+        .order_by('id')
+        .values('id', 'owner_id')
+    )
+    seen = set()
+    owners = []
+    for team in rng.sample(teams, len(teams)):
+        if team['owner_id'] not in seen:
+            seen.add(team['owner_id'])
+            owners.append(team)
+        if len(owners) == count:
+            break
+
+    user_ids = list(User.objects.order_by('?').values_list('id', flat=True)[:500])
+    users = User.objects.in_bulk([team['owner_id'] for team in owners])
+
+    actors = []
+    for team in owners:
+        project_ids = list(
+            Project.objects.filter(team_id=team['id']).values_list('id', flat=True)
+        )
+        task_ids = list(
+            Task.objects.filter(project_id__in=project_ids)
+            .order_by('?').values_list('id', flat=True)[:TASK_SAMPLE]
+        )
+        member_ids = list(
+            Team.members.through.objects.filter(team_id=team['id'])
+            .values_list('user_id', flat=True)
+        )
+        actors.append(Actor(
+            users[team['owner_id']], team['id'], member_ids,
+            [user_id for user_id in user_ids if user_id not in member_ids],
+            project_ids, task_ids,
+        ))
+    return actors
+
+
+def build_request(scenario, actor, rng):
+    """(method, path, body) döner."""
+    statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+
+    if scenario == 'list':
+        project_id = rng.choice(actor.project_ids)
+        return 'get', '/api/tasks/', rng.choice([
+            {'project': project_id},
+            {'project': project_id, 'status': rng.choice(statuses)},
+            {'assignee': rng.choice(list(actor.member_ids)), 'status': rng.choice(statuses)},
+            {'due_before': django_timezone.localdate().isoformat(), 'status': 'todo'},
+            {},
+        ])
+
+    if scenario == 'detail':
+        return 'get', f'/api/tasks/{rng.choice(actor.task_ids)}/', None
+
+    if scenario == 'status':
+        return (
+            'patch', f'/api/tasks/{rng.choice(actor.task_ids)}/',
+            {'status': rng.choice(statuses)},
+        )
+
+    if scenario == 'members':
+        # Bir üye çıkar ya da ekle (sahip her zaman takımda kalır)
+        removable = actor.member_ids - {actor.user.id}
+        if removable and (rng.random() < 0.5 or not actor.candidate_ids):
+            actor.member_ids.discard(rng.choice(sorted(removable)))
+        elif actor.candidate_ids:
+            actor.member_ids.add(actor.candidate_ids.pop())
+        return 'patch', f'/api/teams/{actor.team_id}/', {'member_ids': sorted(actor.member_ids)}
+
+    raise ValueError(f'Unknown scenario: {scenario}')
+
+
+class QueryCounter:
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class LoadRunner:
+
+    def __init__(self, actors, mix=None, threads=4, requests=200, warmup=10, random_seed=0):
+        if not actors:
+            raise ValueError('No actors; seed the database first (manage.py seed_boards).')
+        mix = mix or DEFAULT_MIX
+        # Her senaryo için gereken veri yoksa karışımdan çıkarılır
+        if not any(actor.task_ids for actor in actors):
+            mix = {name: weight for name, weight in mix.items() if name not in ('detail', 'status')}
+        self.mix = mix
+        self.actors = [actor for actor in actors if actor.task_ids] or actors
+        self.threads = threads
+        self.requests = requests
+        self.warmup = warmup
+        self.random_seed = random_seed
+        self.samples = {name: [] for name in self.mix}
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+
+    def run(self):
+        connection_created.connect(self.on_connection_created)
+        start = time.perf_counter()
+        try:
+            if self.threads == 1:
+                self.worker(0)
+            else:
+                workers = [
+                    threading.Thread(target=self.worker, args=(index,))
+                    for index in range(self.threads)
+                ]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+        finally:
+            connection_created.disconnect(self.on_connection_created)
+        return self.summary(time.perf_counter() - start)
+
+    def on_connection_created(self, sender, connection, **kwargs):
+        # Isınma istekleri dahil; bağlantı kurma maliyetini görmek için
+        with self._lock:
+            self.connections_opened += 1
+
+    def worker(self, index):
+        rng = random.Random(self.random_seed + index)
+        actors = self.actors[index::self.threads] or [self.actors[index % len(self.actors)]]
+        clients = {
+            actor.user.id: Client(headers={'authorization': f'Bearer {actor.token}'})
+            for actor in actors
+        }
+        names = list(self.mix)
+        weights = list(self.mix.values())
+        counter = QueryCounter()
+        samples = {name: [] for name in names}
+
+        try:
+            with ExitStack() as stack:
+                # Replica alias'ları dahil tüm bağlantılardaki sorgular sayılır
+                for conn in connections.all():
+                    stack.enter_context(conn.execute_wrapper(counter))
+                for i in range(self.warmup + self.requests):
+                    actor = rng.choice(actors)
+                    scenario = rng.choices(names, weights)[0]
+                    method, path, body = build_request(scenario, actor, rng)
+                    client = clients[actor.user.id]
+
+                    counter.count = 0
+                    started = time.perf_counter()
+                    if method == 'get':
+                        response = client.get(path, body)
+                    else:
+                        response = getattr(client, method)(
+                            path, json.dumps(body), content_type='application/json'
+                        )
+                    elapsed = (time.perf_counter() - started) * 1000
+
+                    if i >= self.warmup:
+                        samples[scenario].append((elapsed, counter.count, response.status_code))
+
+                    # Test Client bağlantıyı açık bırakır; WSGI sunucusundaki gibi
+                    # istek sonunda CONN_MAX_AGE'e göre kapatılır
+                    if not connection.in_atomic_block:
+                        close_old_connections()
+        finally:
+            if self.threads > 1:
+                connections.close_all()
+
+        with self._lock:
+            for name, values in samples.items():
+                self.samples[name].extend(values)
+
+    def summary(self, elapsed):
+        results = {}
+        everything = []
+        for name, values in self.samples.items():
+            if values:
+                results[name] = summarize(values, elapsed)
+                everything.extend(values)
+        results['total'] = summarize(everything, elapsed)
+        return {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'database': connection.vendor,
+            'threads': self.threads,
+            'requests_per_thread': self.requests,
+            'mix': self.mix,
+            'elapsed_s': round(elapsed, 3),
+            'connections_opened': self.connections_opened,
+            'results': results,
+        }
+
+
+def summarize(values, elapsed):
+    timings = [value[0] for value in values]
+    queries = [value[1] for value in values]
+    return {
+        'requests': len(values),
+        'rps': round(len(values) / elapsed, 1),
+        'p50_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(percentile(timings, 95), 2),
+        'p99_ms': round(percentile(timings, 99), 2),
+        'max_ms': round(max(timings), 2),
+        'queries_avg': round(statistics.mean(queries), 2),
+        'queries_max': max(queries),
+        'errors': sum(1 for value in values if value[2] >= 400),
+    }
+
+
+METRICS = ('rps', 'p50_ms', 'p95_ms', 'p99_ms', 'queries_avg')
+
+
+def compare(current, baseline):
+    """Senaryo -> metrik -> (şimdiki, baseline, değişim %)."""
+    diff = {}
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        diff[name] = {
+            metric: (
+                result[metric], base[metric],
+                round((result[metric] - base[metric]) / base[metric] * 100, 1)
+                if base[metric] else None,
+            )
+            for metric in METRICS
+        }
+    return diff
+
+
+def save_baseline(result, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=2))
+
+
+def load_baseline(path):
+    return json.loads(path.read_text())
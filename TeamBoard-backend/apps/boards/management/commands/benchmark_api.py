@@ -0,0 +1,94 @@
+import random
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.boards.loadtest import (DEFAULT_MIX, METRICS, LoadRunner, compare,
+                                  load_actors, load_baseline, parse_mix,
+                                  save_baseline)
+
+
+class Command(BaseCommand):
+    help = (
+        'Drives the API routes concurrently on a seeded dataset (see seed_boards): '
+        'task list with filters, task detail, status updates and team member edits. '
+        'Reports throughput, p50/p95/p99 latency and queries per request; results '
+        'can be saved as a baseline and compared with later runs.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--requests', type=int, default=200,
+                            help='Measured requests per thread.')
+        parser.add_argument('--warmup', type=int, default=10,
+                            help='Unmeasured requests per thread before measuring.')
+        parser.add_argument('--actors', type=int, default=32,
+                            help='Number of team owners issuing requests.')
+        parser.add_argument(
+            '--mix', type=parse_mix, default=DEFAULT_MIX,
+            help='Scenario weights, e.g. list=50,detail=30,status=15,members=5',
+        )
+        parser.add_argument('--random-seed', type=int, default=0)
+        parser.add_argument('--baseline-dir', type=Path, default=settings.BASE_DIR / 'benchmarks')
+        parser.add_argument('--save', metavar='NAME', help='Save the result as NAME.json.')
+        parser.add_argument('--compare', metavar='NAME', help='Compare with a saved baseline.')
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options['compare']:
+            path = options['baseline_dir'] / f'{options["compare"]}.json'
+            if not path.exists():
+                raise CommandError(f'Baseline not found: {path}')
+            baseline = load_baseline(path)
+
+        rng = random.Random(options['random_seed'])
+        actors = load_actors(options['actors'], rng)
+        if not actors:
+            raise CommandError('No teams with tasks; seed the database first (seed_boards).')
+
+        runner = LoadRunner(
+            actors,
+            mix=options['mix'],
+            threads=options['threads'],
+            requests=options['requests'],
+            warmup=options['warmup'],
+            random_seed=options['random_seed'],
+        )
+        result = runner.run()
+        self.report(result)
+
+        if baseline is not None:
+            self.report_diff(compare(result, baseline), options['compare'])
+
+        if options['save']:
+            path = options['baseline_dir'] / f'{options["save"]}.json'
+            save_baseline(result, path)
+            self.stdout.write(f'Saved baseline: {path}')
+
+    def report(self, result):
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f'{result["database"]}, {result["threads"]} threads x '
+            f'{result["requests_per_thread"]} requests, {result["elapsed_s"]}s, '
+            f'{result["connections_opened"]} DB connections opened'
+        ))
+        self.stdout.write(
+            f'  {"scenario":<10}{"requests":>9}{"req/s":>9}{"p50":>9}{"p95":>9}'
+            f'{"p99":>9}{"queries":>9}{"errors":>8}'
+        )
+        for name, row in result['results'].items():
+            self.stdout.write(
+                f'  {name:<10}{row["requests"]:>9}{row["rps"]:>9}{row["p50_ms"]:>9}'
+                f'{row["p95_ms"]:>9}{row["p99_ms"]:>9}{row["queries_avg"]:>9}{row["errors"]:>8}'
+            )
+        self.stdout.write('  (latency in ms, queries = average per request)')
+
+    def report_diff(self, diff, name):
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Compared with baseline "{name}"'))
+        for scenario, metrics in diff.items():
+            parts = []
+            for metric in METRICS:
+                current, base, change = metrics[metric]
+                change = '' if change is None else f' ({change:+}%)'
+                parts.append(f'{metric} {base} -> {current}{change}')
+            self.stdout.write(f'  {scenario:<10}' + ', '.join(parts))
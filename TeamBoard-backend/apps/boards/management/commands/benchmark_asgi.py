@@ -0,0 +1,91 @@
+import random
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.serving import MODE_ASGI, MODE_WSGI, cpu_count
+from apps.boards.httpload import HTTPLoadRunner, ServerProcess
+from apps.boards.loadtest import load_actors, parse_mix, save_baseline
+
+
+class Command(BaseCommand):
+    help = (
+        'Starts the gunicorn profile twice on the seeded dataset (see seed_boards): '
+        'sync WSGI (gthread) and ASGI (uvicorn workers with the async read views), '
+        'holds --clients keep-alive connections open against each and compares '
+        'requests/sec, latency and server memory growth per concurrent connection.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=1000,
+                            help='Concurrent keep-alive connections.')
+        parser.add_argument('--requests', type=int, default=20,
+                            help='Measured requests per connection.')
+        parser.add_argument('--warmup', type=int, default=2,
+                            help='Unmeasured requests per connection before measuring.')
+        parser.add_argument('--workers', type=int, default=cpu_count(),
+                            help='Server processes for both profiles.')
+        parser.add_argument('--actors', type=int, default=32)
+        parser.add_argument('--mix', type=parse_mix, default={'list': 60, 'detail': 40},
+                            help='Read scenario weights, e.g. list=60,detail=40')
+        parser.add_argument('--random-seed', type=int, default=0)
+        parser.add_argument('--baseline-dir', type=Path, default=settings.BASE_DIR / 'benchmarks')
+        parser.add_argument('--save', metavar='NAME', help='Save both results as NAME.json.')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['random_seed'])
+        actors = load_actors(options['actors'], rng)
+        if not actors:
+            raise CommandError('No teams with tasks; seed the database first (seed_boards).')
+
+        results = {}
+        for mode in (MODE_WSGI, MODE_ASGI):
+            self.stdout.write(f'Starting {mode} server ({options["workers"]} workers)...')
+            try:
+                with ServerProcess(mode, options['workers']) as server:
+                    results[mode] = HTTPLoadRunner(
+                        server,
+                        actors,
+                        mix=options['mix'],
+                        clients=options['clients'],
+                        requests=options['requests'],
+                        warmup=options['warmup'],
+                        random_seed=options['random_seed'],
+                    ).run()
+            except (RuntimeError, ValueError) as exc:
+                raise CommandError(str(exc))
+            self.report(results[mode])
+
+        self.report_diff(results[MODE_WSGI], results[MODE_ASGI])
+
+        if options['save']:
+            path = options['baseline_dir'] / f'{options["save"]}.json'
+            save_baseline({'results': results}, path)
+            self.stdout.write(f'Saved results: {path}')
+
+    def report(self, result):
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f'{result["mode"]}: {result["clients"]} connections x '
+            f'{result["requests_per_client"]} requests, {result["elapsed_s"]}s'
+        ))
+        self.stdout.write(
+            f'  req/s {result["rps"]}, p50 {result["p50_ms"]}ms, p95 {result["p95_ms"]}ms, '
+            f'p99 {result["p99_ms"]}ms, errors {result["errors"]}'
+        )
+        statuses = ', '.join(f'{status}: {count}' for status, count in sorted(result['statuses'].items()))
+        self.stdout.write(f'  status codes: {statuses} (599 = connection error)')
+        self.stdout.write(
+            f'  RSS idle {result["idle_rss_mb"]}MB, peak {result["peak_rss_mb"]}MB, '
+            f'{result["rss_per_connection_kb"]}KB per connection'
+        )
+
+    def report_diff(self, before, after):
+        self.stdout.write('')
+        self.stdout.write(self.style.MIGRATE_HEADING('asgi vs wsgi'))
+        for metric in ('rps', 'p50_ms', 'p95_ms', 'p99_ms', 'rss_per_connection_kb'):
+            change = (
+                f'({(after[metric] - before[metric]) / before[metric] * 100:+.1f}%)'
+                if before[metric] else ''
+            )
+            self.stdout.write(f'  {metric:<22}{before[metric]:>9} -> {after[metric]:<9}{change}')
@@ -0,0 +1,62 @@
+import random
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from apps.boards.loadtest import LoadRunner, load_actors
+
+from .benchmark_api import Command as BenchmarkAPICommand
+
+
+class Command(BenchmarkAPICommand):
+    help = (
+        'Runs the benchmark_api load twice on the same dataset: with a new database '
+        'connection per request (CONN_MAX_AGE=0, the runserver default) and with '
+        'persistent connections plus health checks (the gunicorn profile), and '
+        'reports the connections opened and the latency difference.'
+    )
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.set_defaults(requests=500)
+        parser.add_argument('--conn-max-age', type=int, default=60)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['random_seed'])
+        actors = load_actors(options['actors'], rng)
+        db_settings = connections.settings[DEFAULT_DB_ALIAS]
+        original = {key: db_settings.get(key) for key in ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS')}
+
+        profiles = (
+            ('connection per request', {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False}),
+            ('persistent connections', {
+                'CONN_MAX_AGE': options['conn_max_age'], 'CONN_HEALTH_CHECKS': True,
+            }),
+        )
+        results = []
+        try:
+            for label, overrides in profiles:
+                # Bağlantı ayarları thread'lerin paylaştığı settings sözlüğünden okunur
+                db_settings.update(overrides)
+                connections.close_all()
+                result = LoadRunner(
+                    actors,
+                    mix=options['mix'],
+                    threads=options['threads'],
+                    requests=options['requests'],
+                    warmup=options['warmup'],
+                    random_seed=options['random_seed'],
+                ).run()
+                self.stdout.write('')
+                self.stdout.write(self.style.SUCCESS(label))
+                self.report(result)
+                results.append(result['results']['total'])
+        finally:
+            db_settings.update(original)
+            connections.close_all()
+
+        before, after = results
+        self.stdout.write('')
+        self.stdout.write(self.style.MIGRATE_HEADING('persistent vs per request'))
+        for metric in ('rps', 'p50_ms', 'p95_ms', 'p99_ms'):
+            change = (after[metric] - before[metric]) / before[metric] * 100
+            self.stdout.write(f'  {metric:<7}{before[metric]:>9} -> {after[metric]:<9}({change:+.1f}%)')
@@ -0,0 +1,97 @@
+import logging
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from api.log import QueueHandler, stats
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures per-call logger.info latency under concurrent writers for the '
+        'synchronous FileHandler and the queue-based JSON handler (LOG_MODE).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--records', type=int, default=5000,
+                            help='Records written by each thread.')
+        parser.add_argument('--queue-size', type=int, default=10000)
+        parser.add_argument('--work-us', type=int, default=200,
+                            help='Simulated request work between two log calls (0 = burst).')
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as directory:
+            directory = Path(directory)
+            sync_handler = logging.FileHandler(directory / 'sync.log')
+            sync_handler.setFormatter(
+                logging.Formatter('[{asctime}] {levelname} {name} {message}', style='{')
+            )
+            queue_handler = QueueHandler(
+                directory / 'queue.log', max_bytes=50 * 1024 * 1024,
+                queue_size=options['queue_size'],
+            )
+
+            for label, handler in (('sync FileHandler', sync_handler),
+                                   ('queue + JSON', queue_handler)):
+                dropped_before = stats.dropped
+                timings, elapsed = self.run(
+                    handler, options['threads'], options['records'], options['work_us'] / 1_000_000
+                )
+                handler.close()
+
+                self.stdout.write(self.style.MIGRATE_HEADING(label))
+                self.stdout.write(
+                    f'  {len(timings)} records in {elapsed:.2f}s '
+                    f'({len(timings) / elapsed:,.0f}/s), dropped {stats.dropped - dropped_before}'
+                )
+                self.stdout.write(
+                    '  per call: '
+                    f'p50 {statistics.median(timings):.1f}us, '
+                    f'p95 {percentile(timings, 95):.1f}us, '
+                    f'p99 {percentile(timings, 99):.1f}us, '
+                    f'max {max(timings):.1f}us'
+                )
+
+    def run(self, handler, threads, records, work):
+        logger = logging.getLogger(f'benchmark.logging.{id(handler)}')
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(handler)
+
+        timings = []
+        lock = threading.Lock()
+
+        def writer(index):
+            local = []
+            for i in range(records):
+                start = time.perf_counter()
+                logger.info(
+                    'User %s updated task %s (id=%s) - old_status=%s, new_status=%s',
+                    f'user{index}', 'Quarterly report', i, 'todo', 'done',
+                )
+                local.append((time.perf_counter() - start) * 1_000_000)
+                if work:
+                    time.sleep(work)
+            with lock:
+                timings.extend(local)
+
+        workers = [threading.Thread(target=writer, args=(i,)) for i in range(threads)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        logger.removeHandler(handler)
+        return timings, elapsed
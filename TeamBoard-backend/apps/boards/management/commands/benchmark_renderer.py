@@ -0,0 +1,80 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from api.encoders import BACKENDS, orjson
+from api.renderers import CustomJSONRenderer
+
+
+def task_payload(count):
+    # TaskSerializer çıktısıyla aynı şekilde, cursor sayfası olarak
+    return {
+        'next': 'http://localhost:8000/api/tasks/?cursor=cD0yMDI1LTAxLTAx',
+        'previous': None,
+        'results': [
+            {
+                'id': i,
+                'title': f'Görev {i} - rapor hazırlığı',
+                'description': 'Haftalık toplantı notlarını derleyip ekiple paylaş.',
+                'project': i % 50 + 1,
+                'assignee': i % 20 + 1,
+                'assignee_detail': {
+                    'id': i % 20 + 1,
+                    'username': f'user{i % 20}',
+                    'email': f'user{i % 20}@example.com',
+                    'first_name': 'Ayşe',
+                    'last_name': 'Yılmaz',
+                },
+                'status': ('todo', 'in_progress', 'done')[i % 3],
+                'due_date': '2025-01-31',
+                'created_at': '2025-01-02T03:04:05.678901Z',
+                'updated_at': '2025-01-03T03:04:05.678901Z',
+            }
+            for i in range(count)
+        ],
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Micro-benchmark of CustomJSONRenderer with each JSON encoder backend '
+        'on 1k / 10k task list payloads.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000])
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def handle(self, *args, **options):
+        backends = [name for name in BACKENDS if name != 'orjson' or orjson is not None]
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed; only stdlib is measured.'))
+
+        renderer = CustomJSONRenderer()
+        for size in options['sizes']:
+            payload = task_payload(size)
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{size} tasks'))
+
+            outputs = {}
+            medians = {}
+            for name in backends:
+                with override_settings(JSON_ENCODER=name):
+                    timings = []
+                    for _ in range(options['repeat']):
+                        start = time.perf_counter()
+                        outputs[name] = renderer.render(payload)
+                        timings.append((time.perf_counter() - start) * 1000)
+                medians[name] = statistics.median(timings)
+                self.stdout.write(
+                    f'  {name:<8} median {medians[name]:8.2f} ms, '
+                    f'min {min(timings):8.2f} ms, {len(outputs[name]) / 1024:.0f} KiB'
+                )
+
+            if len(set(outputs.values())) > 1:
+                self.stdout.write(self.style.ERROR('  outputs differ between backends!'))
+            elif 'orjson' in medians:
+                self.stdout.write(self.style.SUCCESS(
+                    f'  identical output, orjson {medians["stdlib"] / medians["orjson"]:.1f}x faster'
+                ))
@@ -0,0 +1,77 @@
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from api.values import ValuesSerializer
+from apps.accounts.serializers import UserListSerializer
+from apps.boards.models import Project, Task
+from apps.boards.serializers import ProjectSerializer, TaskSerializer
+from apps.boards.views import TASK_LIST_COLUMNS
+
+
+def querysets(rows):
+    # Liste view'larının okuduğu kolonlarla (bkz. views.get_queryset)
+    return {
+        'tasks': (
+            TaskSerializer,
+            Task.objects.select_related('assignee').only(*TASK_LIST_COLUMNS).order_by('-id')[:rows],
+        ),
+        'projects': (ProjectSerializer, Project.objects.order_by('-id')[:rows]),
+        'users': (
+            UserListSerializer,
+            User.objects.only('id', 'username', 'first_name', 'last_name').order_by('-id')[:rows],
+        ),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares CPU time per listed row of the ModelSerializer path and the '
+        '.values() fast path of list actions (api/values.py) on existing rows '
+        '(see seed_boards), including the query, and checks that both produce '
+        'identical output.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5_000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        request = Request(RequestFactory().get('/'))
+        for name, (serializer_class, queryset) in querysets(options['rows']).items():
+            values_serializer = ValuesSerializer.compile(
+                serializer_class(context={'request': request})
+            )
+            def serializer_path():
+                return serializer_class(list(queryset), many=True, context={'request': request}).data
+
+            def values_path():
+                rows = values_serializer.values(queryset.model.objects.order_by('-id'))
+                return values_serializer.many(list(rows[:options['rows']]))
+
+            expected, actual = serializer_path(), values_path()
+            if not expected:
+                raise CommandError(f'No {name}; seed the database first (seed_boards).')
+            if [dict(row) for row in expected] != actual:
+                raise CommandError(f'{name}: .values() output differs from the serializer')
+
+            before = self.measure(serializer_path, options['repeat'])
+            after = self.measure(values_path, options['repeat'])
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name} ({len(expected)} rows)'))
+            self.stdout.write(
+                f'  serializer {before / len(expected) * 1000:7.2f} µs/row, '
+                f'values {after / len(expected) * 1000:7.2f} µs/row '
+                f'({before / after:.1f}x less CPU), identical output'
+            )
+
+    def measure(self, build, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.process_time()
+            build()
+            timings.append((time.process_time() - start) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,117 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.boards.models import Project, Task, Team
+
+VARIANTS = {
+    'full': {},
+    'board fields': {'fields': 'id,title,status,assignee'},
+    'board + assignee': {'fields': 'id,title,status', 'expand': 'assignee_detail'},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Loads every page of a --tasks task board through the API with and '
+        'without ?fields= / ?expand= trimming and compares payload size, '
+        'latency and SQL. The board is created in a transaction that is rolled '
+        'back at the end; the response cache is disabled while measuring.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=5_000)
+        parser.add_argument('--members', type=int, default=20)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic(), override_settings(RESPONSE_CACHE_ENABLED=False):
+            user, project = self.create_board(options['tasks'], options['members'])
+            client = Client(headers={'authorization': f'Bearer {AccessToken.for_user(user)}'})
+
+            results = {}
+            for label, params in VARIANTS.items():
+                results[label] = self.measure(client, project, params, options['repeat'])
+                self.report(label, params, results[label])
+
+            transaction.set_rollback(True)
+
+        full = results['full']
+        for label, result in results.items():
+            if label != 'full':
+                self.stdout.write(self.style.SUCCESS(
+                    f'{label}: {result["bytes"] / full["bytes"] * 100:.0f}% of the payload, '
+                    f'{result["median_ms"] / full["median_ms"] * 100:.0f}% of the latency'
+                ))
+
+    def create_board(self, tasks, members):
+        prefix = f'sparse_bench_{time.time_ns()}'
+        owner = User.objects.create(username=f'{prefix}_owner', password='!')
+        users = User.objects.bulk_create(
+            User(
+                username=f'{prefix}_{i}', password='!', email=f'{prefix}_{i}@example.com',
+                first_name='Ayşe', last_name='Yılmaz',
+            )
+            for i in range(members)
+        )
+        team = Team.objects.create(name=prefix, owner=owner)
+        team.members.add(owner, *users)
+        project = Project.objects.create(title=prefix, team=team)
+        Task.objects.bulk_create(
+            Task(
+                title=f'Görev {i} - rapor hazırlığı',
+                description='Haftalık toplantı notlarını derleyip ekiple paylaş. ' * 3,
+                project=project,
+                assignee=users[i % members],
+                status=(Task.STATUS_TODO, Task.STATUS_IN_PROGRESS, Task.STATUS_DONE)[i % 3],
+            )
+            for i in range(tasks)
+        )
+        return owner, project
+
+    def load_board(self, client, project, params):
+        # Tüm sayfalar (cursor ile), sayfa boyutu API_MAX_PAGE_SIZE
+        url = '/api/tasks/'
+        query = {'project': project.id, 'page_size': settings.API_MAX_PAGE_SIZE, **params}
+        size = rows = 0
+        while url:
+            response = client.get(url, query)
+            assert response.status_code == 200, response.content[:200]
+            size += len(response.content)
+            data = response.json()['data']
+            rows += len(data['results'])
+            url, query = data['next'], None
+        return size, rows
+
+    def measure(self, client, project, params, repeat):
+        self.load_board(client, project, params)
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                size, rows = self.load_board(client, project, params)
+                timings.append((time.perf_counter() - start) * 1000)
+        page_sql = [q['sql'] for q in queries.captured_queries if 'LIMIT' in q['sql']]
+        return {
+            'bytes': size,
+            'rows': rows,
+            'median_ms': statistics.median(timings),
+            'queries': len(queries.captured_queries),
+            'joins': page_sql[-1].count(' JOIN ') if page_sql else 0,
+            'columns': page_sql[-1].split(' FROM ')[0].count(',') + 1 if page_sql else 0,
+        }
+
+    def report(self, label, params, result):
+        self.stdout.write(self.style.MIGRATE_HEADING(f'{label} {params or ""}'))
+        self.stdout.write(
+            f'  {result["rows"]} tasks, {result["bytes"] / 1024:.0f} KiB, '
+            f'median {result["median_ms"]:.1f} ms per board, {result["queries"]} queries, '
+            f'page query: {result["columns"]} columns, {result["joins"]} joins'
+        )
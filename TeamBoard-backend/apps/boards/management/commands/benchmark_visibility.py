@@ -0,0 +1,83 @@
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Count, Q
+
+from apps.boards.models import Task, Team
+from apps.boards.seeding import seed_boards
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares the old OR-join + DISTINCT task visibility query with the '
+        'membership-based Task.objects.visible_to on a seeded dataset.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', action='store_true',
+                            help='Seed a synthetic dataset before measuring.')
+        parser.add_argument('--tasks', type=int, default=100_000)
+        parser.add_argument('--teams', type=int, default=200)
+        parser.add_argument('--members-per-team', type=int, default=50)
+        parser.add_argument('--user', type=int,
+                            help='User id to measure (default: user with most teams).')
+        parser.add_argument('--page-size', type=int, default=50)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        if options['seed']:
+            counts = seed_boards(
+                users=options['teams'] * 2,
+                teams=options['teams'],
+                members_per_team=options['members_per_team'],
+                tasks=options['tasks'],
+            )
+            self.stdout.write(f'Seeded: {counts}')
+
+        user = self.get_user(options['user'])
+        self.stdout.write(
+            f'User {user.username} (id={user.id}) sees '
+            f'{Team.objects.visible_to(user).count()} teams'
+        )
+
+        legacy = Task.objects.filter(
+            Q(project__team__owner=user) | Q(project__team__members=user)
+        ).distinct()
+        subquery = Task.objects.visible_to(user)
+
+        for label, queryset in (('OR-join + DISTINCT', legacy),
+                                ('visible_to (membership ids)', subquery)):
+            self.measure(label, queryset, options['page_size'], options['repeat'])
+
+    def get_user(self, user_id):
+        if user_id:
+            return User.objects.get(pk=user_id)
+        return (
+            User.objects.annotate(team_count=Count('teams'))
+            .order_by('-team_count', 'id')
+            .first()
+        )
+
+    def measure(self, label, queryset, page_size, repeat):
+        page = queryset.order_by('-created_at', '-id')[:page_size]
+
+        self.stdout.write('')
+        self.stdout.write(self.style.MIGRATE_HEADING(label))
+        self.stdout.write(str(page.query))
+        analyze = connection.vendor == 'postgresql'
+        self.stdout.write(page.explain(analyze=analyze) if analyze else page.explain())
+
+        for name, run in (('first page', lambda: list(page.all())),
+                          ('count', queryset.count)):
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - start) * 1000)
+            self.stdout.write(
+                f'{name}: median {statistics.median(timings):.2f} ms, '
+                f'min {min(timings):.2f} ms over {repeat} runs'
+            )
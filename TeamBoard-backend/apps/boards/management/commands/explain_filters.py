@@ -0,0 +1,104 @@
+import itertools
+import re
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.boards.filters import ProjectFilter, TaskFilter
+from apps.boards.models import Project, Task
+from apps.boards.search import search
+
+# Sıralı tablo taraması (index kullanılmayan) satırları
+SEQ_SCAN_PATTERNS = {
+    'postgresql': r'Seq Scan on "?{table}"?',
+    'sqlite': r'SCAN {table}(?! USING)',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs EXPLAIN (ANALYZE on Postgres) for every filter combination exposed by '
+        'TaskFilter and ProjectFilter and reports whether each one is index-backed.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int,
+                            help='Scope the querysets with visible_to(user) like the API does.')
+        parser.add_argument('--page-size', type=int, default=50)
+        parser.add_argument('--search',
+                            help='Also combine every filter with ?search=<text> (full-text).')
+        parser.add_argument('--show-plans', action='store_true',
+                            help='Print the full plan for every combination.')
+
+    def handle(self, *args, **options):
+        if connection.vendor not in SEQ_SCAN_PATTERNS:
+            raise CommandError(f'Unsupported database vendor: {connection.vendor}')
+
+        task = Task.objects.exclude(assignee=None).exclude(due_date=None).first()
+        project = Project.objects.first()
+        if task is None or project is None:
+            raise CommandError('No data to explain; seed the database first.')
+
+        user = User.objects.get(pk=options['user']) if options['user'] else None
+
+        samples = {
+            TaskFilter: {
+                'project': task.project_id,
+                'assignee': task.assignee_id,
+                'status': task.status,
+                'due_before': task.due_date.isoformat(),
+                'due_after': task.due_date.isoformat(),
+            },
+            ProjectFilter: {
+                'team': project.team_id,
+                'is_active': 'true',
+            },
+        }
+
+        if options['search']:
+            for values in samples.values():
+                values['search'] = options['search']
+
+        unindexed = 0
+        for filterset_class, values in samples.items():
+            model = filterset_class._meta.model
+            self.stdout.write(self.style.MIGRATE_HEADING(model.__name__))
+            for params in self.combinations(values):
+                plan = self.explain(filterset_class, params, user, options['page_size'])
+                table = model._meta.db_table
+                seq_scan = re.search(
+                    SEQ_SCAN_PATTERNS[connection.vendor].format(table=table), plan
+                )
+                unindexed += bool(seq_scan)
+
+                label = '&'.join(f'{k}={v}' for k, v in params.items()) or '(no filter)'
+                status = self.style.ERROR('SEQ SCAN') if seq_scan else self.style.SUCCESS('index')
+                timing = re.search(r'Execution Time: ([\d.]+ ms)', plan)
+                self.stdout.write(f'  {status:<20} {timing.group(1) if timing else "":>12}  {label}')
+                if options['show_plans']:
+                    self.stdout.write(plan)
+
+        if unindexed:
+            self.stdout.write(self.style.WARNING(f'{unindexed} combination(s) are not index-backed.'))
+
+    def combinations(self, values):
+        names = list(values)
+        for size in range(len(names) + 1):
+            for combo in itertools.combinations(names, size):
+                yield {name: values[name] for name in combo}
+
+    def explain(self, filterset_class, params, user, page_size):
+        model = filterset_class._meta.model
+        queryset = model.objects.visible_to(user) if user else model.objects.all()
+        params = dict(params)
+        if 'search' in params:
+            queryset = search(queryset, params.pop('search'))
+        filterset = filterset_class(data=params, queryset=queryset)
+        if not filterset.is_valid():
+            raise CommandError(f'Invalid filter params {params}: {filterset.errors}')
+
+        page = filterset.qs.order_by('-created_at', '-id')[:page_size]
+        if connection.vendor == 'postgresql':
+            return page.explain(analyze=True)
+        return page.explain()
@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.boards.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = (
+        'Deletes sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS. Clients '
+        'with an older sync token fall back to a full reload.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        deleted, _ = Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(f'Deleted {deleted} tombstone(s) older than {cutoff.isoformat()}')
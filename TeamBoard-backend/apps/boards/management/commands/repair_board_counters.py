@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.boards import counters, response_cache
+from apps.boards.models import Project, Team
+
+
+def id_batches(queryset, batch_size):
+    # pk sırasıyla, OFFSET kullanmadan
+    last = 0
+    while True:
+        ids = list(
+            queryset.filter(pk__gt=last).order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not ids:
+            return
+        yield ids
+        last = ids[-1]
+
+
+class Command(BaseCommand):
+    help = (
+        'Recomputes the denormalized board counters (Team.project_count, Project '
+        'task counts per status and overdue count) in batches and fixes the rows '
+        'that drifted. With --overdue only refreshes overdue counts that were '
+        'counted on a previous day; run it daily after midnight.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--overdue', action='store_true',
+                            help='Only refresh overdue counts from a previous day.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        if options['overdue']:
+            teams = set()
+            for ids in id_batches(Project.objects.all(), batch_size):
+                teams |= counters.refresh_overdue(ids)
+            response_cache.bump_teams(teams)
+            self.stdout.write(f'Refreshed overdue counts; {len(teams)} team(s) changed.')
+            return
+
+        repaired_teams = set()
+        for ids in id_batches(Team.objects.all(), batch_size):
+            with transaction.atomic():
+                repaired_teams |= counters.repair_teams(ids)
+
+        project_teams = set()
+        for ids in id_batches(Project.objects.all(), batch_size):
+            with transaction.atomic():
+                project_teams |= counters.repair_projects(ids)
+
+        response_cache.bump_teams(repaired_teams | project_teams)
+        self.stdout.write(
+            f'Repaired project counts of {len(repaired_teams)} team(s) and task '
+            f'counts in {len(project_teams)} team(s).'
+        )
@@ -0,0 +1,62 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.boards.seeding import clear_seed, seed_boards
+
+
+class Command(BaseCommand):
+    help = (
+        'Seeds a synthetic dataset (users, teams with skewed member counts, '
+        'projects and tasks with realistic status / due date distributions) '
+        'using bulk inserts.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=2_000)
+        parser.add_argument('--teams', type=int, default=300)
+        parser.add_argument('--members-per-team', type=int, default=15,
+                            help='Mean team size; sizes follow a Pareto distribution.')
+        parser.add_argument('--projects-per-team', type=int, default=5)
+        parser.add_argument('--tasks', type=int, default=1_000_000)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--prefix', default='seed')
+        parser.add_argument('--random-seed', type=int, default=42)
+        parser.add_argument('--replace', action='store_true',
+                            help='Delete a previous dataset with the same prefix first.')
+
+    def handle(self, *args, **options):
+        prefix = options['prefix']
+        if options['projects_per_team'] > 10:
+            raise CommandError('A team can have at most 10 projects.')
+
+        if User.objects.filter(username__startswith=f'{prefix}_user_').exists():
+            if not options['replace']:
+                raise CommandError(
+                    f'A dataset with prefix "{prefix}" exists; use --replace or another --prefix.'
+                )
+            deleted, _ = clear_seed(prefix)
+            self.stdout.write(f'Deleted {deleted} rows of the previous dataset.')
+
+        start = time.perf_counter()
+
+        def progress(done, total):
+            self.stdout.write(
+                f'  tasks {done:,}/{total:,} ({time.perf_counter() - start:.1f}s)'
+            )
+
+        counts = seed_boards(
+            users=options['users'],
+            teams=options['teams'],
+            members_per_team=options['members_per_team'],
+            projects_per_team=options['projects_per_team'],
+            tasks=options['tasks'],
+            batch_size=options['batch_size'],
+            prefix=prefix,
+            random_seed=options['random_seed'],
+            progress=progress if options['verbosity'] > 1 else None,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {counts} in {time.perf_counter() - start:.1f}s'
+        ))
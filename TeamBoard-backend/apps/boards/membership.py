@@ -0,0 +1,108 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from api import metrics, routing
+
+# Kullanıcı -> {team_id: rol} eşlemesi için cache katmanı.
+# Görünürlük filtreleri (visible_to) ve permission sınıfları üyeliği buradan
+# okur; Team / Team.members değiştiğinde signals.py ilgili kullanıcıları siler.
+#
+# Async view'lar (api/async_views.py) üyeliği aget_memberships ile yükler;
+# sonuç istek boyunca user objesinde tutulur, böylece senkron permission ve
+# visible_to çağrıları event loop'ta veritabanına gitmez.
+#
+# Cache'i dolduran okuma primary'den yapılır (replica yönlendirmesi açık
+# olsa da): invalidation'dan sonra geride kalan bir replica'dan okunan eski
+# üyelik cache'e yazılırsa MEMBERSHIP_CACHE_TIMEOUT boyunca kullanılırdı.
+
+ROLE_OWNER = 'owner'
+ROLE_MEMBER = 'member'
+
+counter = metrics.HitMissCounter()
+metrics.register('membership_cache', counter.snapshot)
+
+
+def _cache():
+    return caches[settings.MEMBERSHIP_CACHE_ALIAS]
+
+
+def _key(user_id):
+    return f'boards:membership:{user_id}'
+
+
+def _rows(user_id):
+    Team = apps.get_model('boards', 'Team')
+    return Team.objects.with_member(user_id).order_by().values_list('id', 'owner_id')
+
+
+def _roles(user_id, rows):
+    return {
+        team_id: ROLE_OWNER if owner_id == user_id else ROLE_MEMBER
+        for team_id, owner_id in rows
+    }
+
+
+def _load(user_id):
+    with routing.use_primary():
+        return _roles(user_id, _rows(user_id))
+
+
+def get_memberships(user):
+    if user.id is None:
+        return {}
+
+    preloaded = getattr(user, '_board_memberships', None)
+    if preloaded is not None:
+        return preloaded
+
+    cache = _cache()
+    key = _key(user.id)
+    memberships = cache.get(key)
+    if memberships is not None:
+        counter.hit()
+        return memberships
+
+    counter.miss()
+    memberships = _load(user.id)
+    cache.set(key, memberships, settings.MEMBERSHIP_CACHE_TIMEOUT)
+    return memberships
+
+
+async def aget_memberships(user):
+    if user.id is None:
+        return {}
+
+    cache = _cache()
+    key = _key(user.id)
+    memberships = cache.get(key)
+    if memberships is not None:
+        counter.hit()
+    else:
+        counter.miss()
+        with routing.use_primary():
+            memberships = _roles(user.id, [row async for row in _rows(user.id)])
+        cache.set(key, memberships, settings.MEMBERSHIP_CACHE_TIMEOUT)
+
+    user._board_memberships = memberships
+    return memberships
+
+
+def get_team_ids(user):
+    return sorted(get_memberships(user))
+
+
+def get_role(user, team_id):
+    return get_memberships(user).get(team_id)
+
+
+def invalidate(user_ids):
+    keys = [_key(user_id) for user_id in set(user_ids) if user_id is not None]
+    if not keys:
+        return
+
+    # Hem hemen hem de commit sonrası siliyoruz; transaction sürerken başka
+    # bir istek eski veriyi tekrar cache'e yazmışsa o da temizlenir.
+    _cache().delete_many(keys)
+    transaction.on_commit(lambda: _cache().delete_many(keys))
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:36
+
+from django.db import migrations, models
+
+
+def backfill_updated_at(apps, schema_editor):
+    # Mevcut satırlar için en iyi tahmin oluşturulma zamanı
+    for model_name in ('Team', 'Project', 'Task'):
+        model = apps.get_model('boards', model_name)
+        model.objects.update(updated_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0002_task_project_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
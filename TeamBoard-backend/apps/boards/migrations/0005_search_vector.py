@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:44
+
+import apps.boards.search
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+# GIN index sadece Postgres'te (SQLite'ta kolon düz metindir, index yok)
+INDEXES = (
+    ('boards_project', 'project_search_vector_idx'),
+    ('boards_task', 'task_search_vector_idx'),
+)
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table, name in INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (search_vector)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for _, name in INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0004_sync_tombstones'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=apps.boards.search.SearchDocument('title', 'description'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=apps.boards.search.SearchDocument('title', 'description'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
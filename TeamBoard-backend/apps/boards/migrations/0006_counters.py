@@ -0,0 +1,77 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:29
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def _count(queryset, key):
+    return Coalesce(
+        Subquery(
+            queryset.filter(**{key: OuterRef('pk')})
+            .order_by().values(key).annotate(total=Count('pk')).values('total')
+        ),
+        Value(0),
+    )
+
+
+def backfill_counters(apps, schema_editor):
+    # Mevcut satırlar için sayaçlar bir kez sayılır (bkz. counters.py)
+    Team = apps.get_model('boards', 'Team')
+    Project = apps.get_model('boards', 'Project')
+    Task = apps.get_model('boards', 'Task')
+    today = timezone.localdate()
+
+    Team.objects.update(project_count=_count(Project.objects.all(), 'team_id'))
+    Project.objects.update(
+        todo_count=_count(Task.objects.filter(status='todo'), 'project_id'),
+        in_progress_count=_count(Task.objects.filter(status='in_progress'), 'project_id'),
+        done_count=_count(Task.objects.filter(status='done'), 'project_id'),
+        overdue_count=_count(
+            Task.objects.filter(due_date__lt=today).exclude(status='done'), 'project_id'
+        ),
+        overdue_counted_on=today,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0005_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='done_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='in_progress_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='overdue_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='overdue_counted_on',
+            field=models.DateField(blank=True, default=django.utils.timezone.localdate, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='todo_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='project_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
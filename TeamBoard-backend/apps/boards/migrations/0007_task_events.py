@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 21:41
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boards', '0006_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.BigIntegerField()),
+                ('user_id', models.IntegerField(blank=True, null=True)),
+                ('username', models.CharField(blank=True, max_length=150)),
+                ('field', models.CharField(max_length=30)),
+                ('old_value', models.JSONField(blank=True, null=True)),
+                ('new_value', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['task_id', '-created_at', '-id'], name='taskevent_task_created_idx')],
+            },
+        ),
+    ]
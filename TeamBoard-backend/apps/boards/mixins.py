@@ -0,0 +1,198 @@
+import hashlib
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework.response import Response
+
+from api import routing
+from api.async_views import AsyncAPIViewMixin
+from api.renderers import CustomJSONRenderer
+
+from . import membership, response_cache
+
+# Liste ETag'i: filtrelenmiş kümede son güncelleme + satır sayısı
+LIST_STATE = {'last_modified': Max('updated_at'), 'count': Count('pk')}
+
+
+def make_etag(*parts):
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+class ConditionalGetMixin:
+
+    """
+    list / retrieve için ETag ve Last-Modified desteği (modelde updated_at olmalı).
+
+    Liste: filtrelenmiş queryset üzerinde tek bir Max(updated_at) + Count
+    sorgusu çalışır. Satır eklenir/güncellenirse max, silinirse count değişir.
+    Detay: zaten yüklenen objenin updated_at değeri kullanılır.
+
+    If-None-Match / If-Modified-Since eşleşirse 304, serializer ve
+    CustomJSONRenderer hiç çalışmadan döner.
+
+    Not: Listelerde silinen satırlar sadece ETag (count) ile anlaşılabildiği
+    için 304 kararı listelerde yalnızca If-None-Match ile verilir;
+    Last-Modified bilgi amaçlı gönderilir.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        state = queryset.order_by().aggregate(**LIST_STATE)
+        etag, last_modified = self.list_validators(request, state)
+
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return self.set_validators(not_modified, etag, last_modified)
+
+        response = super().list(request, *args, **kwargs)
+        return self.set_validators(response, etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        return self.detail_response(request, instance)
+
+    # Async yol (AsyncReadMixin): aynı kararlar, sorgular async ORM ile
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        state = await queryset.order_by().aaggregate(**LIST_STATE)
+        etag, last_modified = self.list_validators(request, state)
+
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return self.set_validators(not_modified, etag, last_modified)
+
+        response = await self.alist_response(queryset)
+        return self.set_validators(response, etag, last_modified)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        return self.detail_response(request, instance)
+
+    def list_validators(self, request, state):
+        last_modified = state['last_modified']
+        etag = make_etag(
+            request.get_full_path(),
+            last_modified.isoformat() if last_modified else '',
+            state['count'],
+        )
+        return etag, last_modified
+
+    def detail_response(self, request, instance):
+        last_modified = instance.updated_at
+        etag = make_etag(request.path, instance.pk, last_modified.isoformat())
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=int(last_modified.timestamp())
+        )
+        if not_modified is not None:
+            return self.set_validators(not_modified, etag, last_modified)
+
+        serializer = self.get_serializer(instance)
+        return self.set_validators(Response(serializer.data), etag, last_modified)
+
+    def set_validators(self, response, etag, last_modified):
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        return response
+
+
+class CachedResponseMixin:
+
+    """
+    list / retrieve yanıtlarını render edilmiş haliyle cache'ler (bkz.
+    response_cache.py). ConditionalGetMixin'den önce gelmelidir; hit'te
+    If-None-Match yine kontrol edilir ve 304 dönebilir.
+
+    Sadece JSON (CustomJSONRenderer) yanıtları ve 200'ler saklanır.
+    Permission kontrolleri (initial) her istekte çalışır; retrieve hit'inde
+    get_object atlanır ama anahtar kullanıcının gördüğü takımları içerdiğinden
+    aynı yanıtı sadece o objeyi görebilen kullanıcılar alır.
+
+    Miss'te yanıt primary'den üretilir: geride kalan bir replica'nın eski
+    verisi yeni nesil anahtarıyla saklanırsa invalidation'a rağmen
+    TIMEOUT boyunca dönerdi.
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.acached_response(super().alist, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await self.acached_response(super().aretrieve, request, *args, **kwargs)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        key = self.response_cache_key(request)
+        if key is None:
+            return handler(request, *args, **kwargs)
+        cached = self.get_cached_response(request, key)
+        if cached is not None:
+            return cached
+        with routing.use_primary():
+            response = handler(request, *args, **kwargs)
+        return self.store_response(key, response)
+
+    async def acached_response(self, handler, request, *args, **kwargs):
+        key = self.response_cache_key(request)
+        if key is None:
+            return await handler(request, *args, **kwargs)
+        cached = self.get_cached_response(request, key)
+        if cached is not None:
+            return cached
+        with routing.use_primary():
+            response = await handler(request, *args, **kwargs)
+        return self.store_response(key, response)
+
+    def response_cache_key(self, request):
+        if not (settings.RESPONSE_CACHE_ENABLED
+                and isinstance(request.accepted_renderer, CustomJSONRenderer)):
+            return None
+        return response_cache.make_key(request)
+
+    def get_cached_response(self, request, key):
+        cached = response_cache.get(key)
+        if cached is None:
+            return None
+
+        # ConditionalGetMixin ile aynı: If-Modified-Since sadece detayda
+        last_modified = None
+        if self.action == 'retrieve' and 'Last-Modified' in cached:
+            last_modified = parse_http_date_safe(cached['Last-Modified'])
+        not_modified = get_conditional_response(
+            request, etag=cached.get('ETag'), last_modified=last_modified
+        )
+        if not_modified is not None:
+            for name in response_cache.CACHED_HEADERS:
+                if name in cached:
+                    not_modified[name] = cached[name]
+            return not_modified
+        return cached
+
+    def store_response(self, key, response):
+        if response.status_code == 200 and isinstance(response, Response):
+            response.add_post_render_callback(
+                lambda rendered: response_cache.store(key, rendered)
+            )
+        return response
+
+
+class AsyncReadMixin(AsyncAPIViewMixin):
+
+    """
+    Board viewset'lerinin list / retrieve action'larını async çalıştırır
+    (bkz. api/async_views.py). Üyelik istek başında async yüklenir; permission
+    sınıfları ve visible_to aynı veriyi senkron okur.
+    """
+
+    async_actions = ('list', 'retrieve')
+
+    async def aprefetch(self, request):
+        await membership.aget_memberships(request.user)
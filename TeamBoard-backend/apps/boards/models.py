@@ -1,10 +1,100 @@
 from django.contrib.auth.models import User
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.utils import timezone
+
+from . import counters, membership, response_cache
+from .search import SearchDocument
 
 # Burada “proje sahibi”ni team.owner olarak kabul ediyoruz.
 # Yani takımı kuran kullanıcı, takım altındaki tüm projelerin ve görevlerin sahibi gibi davranacak.
 
-class Team(models.Model):
+# Görünürlük sorguları M2M tablosuna JOIN yapmak yerine takım id listesi
+# üzerinden filtreler. JOIN her üyelik için satırı çoğalttığından DISTINCT
+# gerekiyordu. Kullanıcının takımları membership cache'inden gelir; cache
+# boşsa with_member() alt sorgusuyla (IN (SELECT ...)) bir kez yüklenir.
+
+class TeamQuerySet(models.QuerySet):
+
+    def with_member(self, user_id):
+        # Kullanıcının sahibi veya üyesi olduğu takımlar
+        member_team_ids = (
+            self.model.members.through.objects
+            .filter(user_id=user_id)
+            .values('team_id')
+        )
+        return self.filter(models.Q(owner_id=user_id) | models.Q(id__in=member_team_ids))
+
+    def visible_to(self, user):
+        return self.filter(id__in=membership.get_team_ids(user))
+
+
+# search_vector her satır okumasında taşınmasın diye varsayılan olarak
+# defer edilir; sadece arama filtresi/rank onu SQL içinde kullanır.
+
+class SearchVectorManager(models.Manager):
+
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
+
+
+class ProjectQuerySet(models.QuerySet):
+
+    def visible_to(self, user):
+        return self.filter(team_id__in=membership.get_team_ids(user))
+
+    def delete(self):
+        # Toplu silmede Project.delete çalışmaz; takım sayaçları ve
+        # /api/sync/ izleri burada
+        with transaction.atomic():
+            Tombstone.objects.bulk_create(
+                Tombstone(object_type=Tombstone.TYPE_PROJECT, object_id=pk, team_id=team_id)
+                for pk, team_id in self.values_list('pk', 'team_id')
+            )
+            counters.project_queryset_deleted(self)
+            return super().delete()
+
+
+class TaskQuerySet(models.QuerySet):
+
+    def visible_to(self, user):
+        return self.filter(project_id__in=Project.objects.visible_to(user).values('id'))
+
+    def delete(self):
+        with transaction.atomic():
+            Tombstone.objects.bulk_create(
+                Tombstone(object_type=Tombstone.TYPE_TASK, object_id=pk, project_id=project_id)
+                for pk, project_id in self.values_list('pk', 'project_id')
+            )
+            counters.task_queryset_deleted(self)
+            return super().delete()
+
+
+# Sayaç kolonları (counters.py) normal save() ile yazılmaz: bellekteki eski
+# değer, okunduktan sonra yapılan F() güncellemelerini ezerdi. Güncellemede
+# update_fields verilmemişse yüklü alanlar eksi sayaçlar yazılır.
+
+class CounterFieldsMixin:
+
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if (
+            not self._state.adding
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+        ):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not field.generated
+                and field.name not in self.counter_fields
+                and field.attname in self.__dict__
+            ]
+        return super().save(*args, **kwargs)
+
+
+class Team(CounterFieldsMixin, models.Model):
     name = models.CharField(max_length=255)
     owner = models.ForeignKey(
         User, related_name='owned_teams', on_delete=models.CASCADE
@@ -13,16 +103,25 @@ class Team(models.Model):
         User, related_name='teams', blank=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Denormalize sayaç (bkz. counters.py); sadece F() ile güncellenir
+    project_count = models.IntegerField(default=0, editable=False)
+
+    objects = TeamQuerySet.as_manager()
 
+    counter_fields = ('project_count',)
     
     class Meta:
         ordering = ['name']
 
     def __str__(self):
         return self.name
+
+    def has_member(self, user):
+        return membership.get_role(user, self.id) is not None
     
 
-class Project(models.Model):
+class Project(CounterFieldsMixin, models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     team = models.ForeignKey(
@@ -30,12 +129,68 @@ class Project(models.Model):
     )
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Tam metin arama (bkz. search.py); GIN indexi Postgres'te migration ile
+    search_vector = models.GeneratedField(
+        expression=SearchDocument('title', 'description'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    # Görev sayaçları (bkz. counters.py); sadece F() ile güncellenir. Positive
+    # değil: sinyalsiz bir yoldan kalan sapma yazmaları CHECK hatasıyla
+    # düşürmesin, repair_board_counters düzeltir
+    todo_count = models.IntegerField(default=0, editable=False)
+    in_progress_count = models.IntegerField(default=0, editable=False)
+    done_count = models.IntegerField(default=0, editable=False)
+    overdue_count = models.IntegerField(default=0, editable=False)
+    # overdue_count'un hangi gün için sayıldığı; yeni projede gecikmiş görev yok
+    overdue_counted_on = models.DateField(
+        null=True, blank=True, editable=False, default=timezone.localdate
+    )
+
+    objects = SearchVectorManager.from_queryset(ProjectQuerySet)()
+
+    counter_fields = (
+        'todo_count', 'in_progress_count', 'done_count', 'overdue_count', 'overdue_counted_on',
+    )
 
     class Meta:
         ordering = ['-created_at']
+        # ProjectFilter (team, is_active) + varsayılan sıralama
+        indexes = [
+            models.Index(
+                fields=['team', 'is_active', '-created_at'],
+                name='project_team_active_idx',
+            ),
+            # /api/sync/: takım bazında updated_at aralığı
+            models.Index(
+                fields=['team', 'updated_at', 'id'],
+                name='project_team_updated_idx',
+            ),
+        ]
 
     def __str__(self):
         return self.title
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Proje başka takıma taşınırsa eski takımın yanıt cache'i de
+        # geçersiz olmalı (signals.bump_project_team)
+        instance._loaded_team_id = instance.__dict__.get('team_id')
+        return instance
+
+    def delete(self, *args, **kwargs):
+        # /api/sync/ için iz. Signal yerine burada: post_delete receiver'ı
+        # Django'nun cascade'de toplu (fast) silmesini engelliyordu.
+        # Takım silinince projeler için iz tutulmaz (takım listeden düşer).
+        with transaction.atomic():
+            Tombstone.objects.create(
+                object_type=Tombstone.TYPE_PROJECT, object_id=self.pk, team_id=self.team_id
+            )
+            response_cache.bump_teams([self.team_id])
+            counters.change_project_count({self.team_id: -1})
+            return super().delete(*args, **kwargs)
     
 
 class Task(models.Model):
@@ -62,10 +217,148 @@ class Task(models.Model):
     )   
     due_date = models.DateField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Tam metin arama (bkz. search.py); GIN indexi Postgres'te migration ile
+    search_vector = models.GeneratedField(
+        expression=SearchDocument('title', 'description'),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    objects = SearchVectorManager.from_queryset(TaskQuerySet)()
 
     class Meta:
         ordering = ['-created_at']
+        # TaskFilter'ın gerçek sorgu şekillerine göre (bkz. explain_filters)
+        indexes = [
+            # ?project=X (cursor sayfalama -created_at, -id ile ilerler)
+            models.Index(
+                fields=['project', '-created_at', '-id'],
+                name='task_project_created_idx',
+            ),
+            # /api/sync/: proje bazında updated_at aralığı
+            models.Index(
+                fields=['project', 'updated_at', 'id'],
+                name='task_project_updated_idx',
+            ),
+            # ?project=X&status=Y
+            models.Index(
+                fields=['project', 'status', '-created_at'],
+                name='task_project_status_idx',
+            ),
+            # ?assignee=X(&status=Y)
+            models.Index(
+                fields=['assignee', 'status'],
+                name='task_assignee_status_idx',
+            ),
+            # ?due_before / ?due_after ve gecikmiş görevler; tamamlananlar hariç
+            models.Index(
+                fields=['due_date'],
+                name='task_open_due_date_idx',
+                condition=~models.Q(status='done'),
+            ),
+        ]
     
     def __str__(self):
         return self.title
-    
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Görev başka projeye taşınırsa eski projenin takımı da (signals.bump_task_team)
+        instance._loaded_project_id = instance.__dict__.get('project_id')
+        # Sayaç değişimi için eski (proje, durum, bitiş) (bkz. counters.py);
+        # alanlardan biri defer edildiyse kayıtta proje yeniden sayılır
+        if all(name in instance.__dict__ for name in ('project_id', 'status', 'due_date')):
+            instance._counter_state = counters.current_state(instance)
+        return instance
+
+    def delete(self, *args, **kwargs):
+        # Proje/takım cascade'inde üst kaydın izi yeterli; burası sadece
+        # doğrudan silinen görevler için çalışır.
+        with transaction.atomic():
+            Tombstone.objects.create(
+                object_type=Tombstone.TYPE_TASK, object_id=self.pk, project_id=self.project_id
+            )
+            response_cache.bump_teams(task_team_ids([self]))
+            counters.tasks_deleted([self])
+            return super().delete(*args, **kwargs)
+
+
+def task_team_ids(tasks):
+    """Görevlerin (ve taşındıkları projelerin) takım id'leri."""
+    team_ids = set()
+    project_ids = set()
+    for task in tasks:
+        if Task.project.is_cached(task) and task.project is not None:
+            team_ids.add(task.project.team_id)
+        else:
+            project_ids.add(task.project_id)
+        loaded = getattr(task, '_loaded_project_id', None)
+        if loaded is not None and loaded != task.project_id:
+            project_ids.add(loaded)
+    project_ids.discard(None)
+    if project_ids:
+        team_ids.update(
+            Project.objects.filter(pk__in=project_ids).values_list('team_id', flat=True)
+        )
+    return team_ids
+
+
+# Silinen görev/projelerin izi (/api/sync/ "deleted" listesi için).
+# Silinen satır artık olmadığından ilişkiler FK değil düz id olarak tutulur:
+# proje izleri team_id, görev izleri project_id ile kapsama göre filtrelenir.
+
+class Tombstone(models.Model):
+    TYPE_PROJECT = 'project'
+    TYPE_TASK = 'task'
+
+    TYPE_CHOICES = [
+        (TYPE_PROJECT, 'Project'),
+        (TYPE_TASK, 'Task'),
+    ]
+
+    object_type = models.CharField(max_length=20, choices=TYPE_CHOICES)
+    object_id = models.BigIntegerField()
+    team_id = models.BigIntegerField(null=True, blank=True)
+    project_id = models.BigIntegerField(null=True, blank=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['deleted_at', 'id']
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='tombstone_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.object_type} #{self.object_id}'
+
+
+# Görev geçmişi (bkz. history.py). Olaylar istekten sonra toplu yazıldığı
+# için görev / kullanıcı o sırada silinmiş olabilir; ilişkiler Tombstone
+# gibi düz id olarak tutulur ve geçmiş görev silindikten sonra da kalır.
+# Kullanıcı adı olay anındaki haliyle saklanır (listelemede JOIN yok).
+
+class TaskEvent(models.Model):
+    FIELD_CREATED = 'created'
+
+    task_id = models.BigIntegerField()
+    user_id = models.IntegerField(null=True, blank=True)
+    username = models.CharField(max_length=150, blank=True)
+    field = models.CharField(max_length=30)
+    old_value = models.JSONField(null=True, blank=True)
+    new_value = models.JSONField(null=True, blank=True)
+    # İstekteki değişiklik anı (yazıldığı an değil)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            # GET /api/tasks/{id}/history/ (cursor sayfalama -created_at, -id)
+            models.Index(
+                fields=['task_id', '-created_at', '-id'], name='taskevent_task_created_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'task #{self.task_id} {self.field}'
@@ -2,26 +2,38 @@ from rest_framework import permissions
 
 from api.exceptions import BusinessLogicException
 
+from . import membership
 from .models import Project, Task, Team
 
 
+# Objenin bağlı olduğu takım id'si (takım/proje satırı yüklenmeden)
+def get_team_id(obj):
+    if isinstance(obj, Team):
+        return obj.id
+    if isinstance(obj, Project):
+        return obj.team_id
+    if isinstance(obj, Task):
+        return obj.project.team_id
+    return None
+
+
+def parse_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
 class IsTeamMember(permissions.BasePermission):
 
     #Objeye erişen kullanıcı takım üyesi mi?
     def has_object_permission(self, request, view, obj):
-        if isinstance(obj, Team):
-            team = obj
-        elif isinstance(obj, Project):
-            team = obj.team
-        elif isinstance(obj, Task):
-            team = obj.project.team
-        else:
+        team_id = get_team_id(obj)
+        if team_id is None:
             return False
         
-        user = request.user
-        is_member = user == team.owner or team.members.filter(id=user.id).exists()
-
-        if not is_member:
+        # Üyelik bilgisi membership cache'inden okunur
+        if membership.get_role(request.user, team_id) is None:
 
             raise BusinessLogicException(
                 detail='Bu içeriğe erişmek için ilgili takımın üyesi olmanız gerekiyor.',
@@ -42,15 +54,15 @@ class IsTeamOwner(permissions.BasePermission):
                     detail="Proje oluşturmak için takım bilgisi zorunludur."
                 )
 
-            try:
-                team = Team.objects.get(pk=team_id)
-            except Team.DoesNotExist:
-                raise BusinessLogicException(
-                    detail="Böyle bir takım bulunamadı.",
-                    status_code=404,
-                )
+            team_id = parse_id(team_id)
+            role = membership.get_role(request.user, team_id)
 
-            if request.user != team.owner:
+            if role != membership.ROLE_OWNER:
+                if team_id is None or not Team.objects.filter(pk=team_id).exists():
+                    raise BusinessLogicException(
+                        detail="Böyle bir takım bulunamadı.",
+                        status_code=404,
+                    )
                 raise BusinessLogicException(
                     detail="Bu takım için proje oluşturma yetkiniz yok.",
                     status_code=403,
@@ -61,16 +73,11 @@ class IsTeamOwner(permissions.BasePermission):
 
     #Sadece takım sahibi (owner) için izin.
     def has_object_permission(self, request, view, obj):
-        if isinstance(obj, Team):
-            team = obj
-        elif isinstance(obj, Project):
-            team = obj.team
-        elif isinstance(obj, Task):
-            team = obj.project.team
-        else:
+        team_id = get_team_id(obj)
+        if team_id is None:
             return False
         
-        if request.user != team.owner:
+        if membership.get_role(request.user, team_id) != membership.ROLE_OWNER:
             # Tek tip bir owner hatası
             raise BusinessLogicException(
                 detail="Bu işlem için sadece takım sahibi yetkilidir.",
@@ -91,17 +98,18 @@ class TaskEditPermission(permissions.BasePermission):
                     detail="Görev oluşturmak için proje bilgisi zorunludur."
                 )
 
-            try:
-                project = Project.objects.select_related("team__owner").get(
-                    pk=project_id
-                )
-            except Project.DoesNotExist:
+            team_id = (
+                Project.objects.filter(pk=parse_id(project_id))
+                .values_list("team_id", flat=True)
+                .first()
+            )
+            if team_id is None:
                 raise BusinessLogicException(
                     detail="Böyle bir proje bulunamadı.", status_code=404
                 )
 
             # Sadece takım sahibi görev oluşturabilir
-            if request.user != project.team.owner:
+            if membership.get_role(request.user, team_id) != membership.ROLE_OWNER:
                 raise BusinessLogicException(
                     detail="Bu projeye görev eklemek için yetkiniz yok.",
                     status_code=403,
@@ -114,18 +122,18 @@ class TaskEditPermission(permissions.BasePermission):
     def has_object_permission(self, request, view, obj: Task):
         
         user = request.user
-        team_owner = obj.project.team.owner
+        role = membership.get_role(user, obj.project.team_id)
 
         # Okuma serbest (Team member şartı view tarafında)
         if request.method in permissions.SAFE_METHODS:
             return True
         
         # Düzenleme sadece takım sahibi için
-        if user == team_owner:
+        if role == membership.ROLE_OWNER:
             return True
         
         # Atanan kişinin kendi görevini güncellemesi için izin
-        if obj.assignee == user:
+        if obj.assignee_id == user.id:
             if set(request.data.keys()) == {"status"}:
                 return True
             else:
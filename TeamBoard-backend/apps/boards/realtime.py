@@ -0,0 +1,94 @@
+import uuid
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+from .models import Project
+
+# WebSocket abonelerine board olaylarını yayınlar (bkz. consumers.py).
+#
+# Olaylar channel layer üzerinden team.<id> ve project.<id> gruplarına
+# gönderilir. Layer CHANNEL_LAYERS ayarından gelir: tek process için
+# InMemoryChannelLayer, birden fazla worker için Redis.
+#
+# Gönderim transaction commit edildikten sonra yapılır; rollback olan
+# değişiklikler yayınlanmaz. Hem takıma hem projeye abone olan istemci
+# aynı olayı iki kez alabilir, "id" alanıyla tekilleştirebilir.
+#
+# Görev başka bir projeye / takıma taşınırsa eski grupların abonelerine
+# task.deleted gider; görev yeni gruplarda task.updated ile görünür.
+
+MESSAGE_TYPE = 'board.event'
+
+TASK_CREATED = 'task.created'
+TASK_UPDATED = 'task.updated'
+TASK_DELETED = 'task.deleted'
+PROJECT_CREATED = 'project.created'
+PROJECT_UPDATED = 'project.updated'
+PROJECT_DELETED = 'project.deleted'
+
+
+def team_group(team_id):
+    return f'team.{team_id}'
+
+
+def project_group(project_id):
+    return f'project.{project_id}'
+
+
+def _send(groups, message):
+    layer = get_channel_layer()
+    if layer is None:
+        return
+    for group in groups:
+        async_to_sync(layer.group_send)(group, message)
+
+
+def publish(event, data, team_id, project_id=None):
+    groups = [team_group(team_id)]
+    if project_id is not None:
+        groups.append(project_group(project_id))
+    _publish(groups, event, data, team_id, project_id)
+
+
+def _publish(groups, event, data, team_id, project_id):
+    message = {
+        'type': MESSAGE_TYPE,
+        'id': uuid.uuid4().hex,
+        'event': event,
+        'team': team_id,
+        'project': project_id,
+        'data': data,
+    }
+    transaction.on_commit(lambda: _send(groups, message))
+
+
+def publish_task(event, task, data, previous_project_id=None):
+    # task.project çoğu yerde zaten yüklü; yoksa tek sorguyla team_id okunur
+    team_id = task.project.team_id
+    publish(event, data, team_id, task.project_id)
+
+    if previous_project_id is None or previous_project_id == task.project_id:
+        return
+    # Görev taşındı: eski projenin (takım da değiştiyse eski takımın)
+    # aboneleri görevin ayrıldığını öğrenir
+    previous_team_id = (
+        Project.objects.filter(pk=previous_project_id).values_list('team_id', flat=True).first()
+    )
+    groups = [project_group(previous_project_id)]
+    if previous_team_id is not None and previous_team_id != team_id:
+        groups.append(team_group(previous_team_id))
+    _publish(groups, TASK_DELETED, {'id': task.id}, previous_team_id, previous_project_id)
+
+
+def publish_task_deleted(task_id, project_id, team_id):
+    publish(TASK_DELETED, {'id': task_id}, team_id, project_id)
+
+
+def publish_project(event, project, data):
+    publish(event, data, project.team_id, project.id)
+
+
+def publish_project_deleted(project_id, team_id):
+    publish(PROJECT_DELETED, {'id': project_id}, team_id, project_id)
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+
+from api import metrics
+
+from . import membership
+
+# Boards list / retrieve yanıtları için cache (bkz. mixins.CachedResponseMixin).
+#
+# Anahtar: istek yolu + normalize edilmiş query parametreleri + kullanıcının
+# görebildiği takımlar + bu takımların nesil sayaçları. Takım, proje veya
+# görev yazıldığında ilgili takımın sayacı artırılır (bump_teams); eski
+# girişler silinmez, anahtarları bir daha üretilmediği için cache'in kendi
+# boyut sınırıyla (MAX_ENTRIES) ya da süresi dolunca düşer.
+#
+# Aynı takımları gören kullanıcılar aynı girişi paylaşır. Yanıtlar render
+# edilmiş haliyle (ETag / Last-Modified dahil) saklanır; hit'te veritabanı,
+# serializer ve renderer çalışmaz.
+#
+# Sayaçlar ve yanıtlar RESPONSE_CACHE_ALIAS'ta tutulur; birden fazla worker
+# varsa bu cache paylaşımlı olmalıdır (Redis, FileBasedCache). Değilse
+# (LocMemCache) RESPONSE_CACHE_ENABLED kapatılır (api.serving.response_cache_enabled).
+
+counter = metrics.HitMissCounter()
+metrics.register('response_cache', counter.snapshot)
+
+CACHED_HEADERS = ('ETag', 'Last-Modified')
+
+
+def _cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _generation_key(team_id):
+    return f'boards:generation:{team_id}'
+
+
+def get_generations(team_ids):
+    cache = _cache()
+    keys = [_generation_key(team_id) for team_id in team_ids]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            # Sayaç hiç yoksa ya da cache'ten düştüyse 1'den değil zamandan
+            # başlatılır; eski nesillerle çakışıp bayat yanıt dönmez
+            value = time.time_ns()
+            if not cache.add(key, value, None):
+                value = cache.get(key, value)
+            generations[key] = value
+    return [generations[key] for key in keys]
+
+
+def _bump(team_ids):
+    cache = _cache()
+    for team_id in team_ids:
+        key = _generation_key(team_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+
+def bump_teams(team_ids):
+    team_ids = {team_id for team_id in team_ids if team_id is not None}
+    if not team_ids:
+        return
+
+    # membership.invalidate ile aynı: hemen ve commit sonrası (transaction
+    # sürerken eski veriyle cache'e yazılmış yanıt da geçersiz kalır)
+    _bump(team_ids)
+    transaction.on_commit(lambda: _bump(team_ids))
+
+
+def make_key(request):
+    team_ids = membership.get_team_ids(request.user)
+    params = sorted(
+        (name, sorted(values)) for name, values in request.query_params.lists()
+    )
+    raw = json.dumps([
+        request.build_absolute_uri(request.path),
+        params,
+        team_ids,
+        get_generations(team_ids),
+    ])
+    return 'boards:response:' + hashlib.sha1(raw.encode()).hexdigest()
+
+
+def get(key):
+    entry = _cache().get(key)
+    if entry is None:
+        counter.miss()
+        return None
+
+    counter.hit()
+    content, content_type, headers = entry
+    response = HttpResponse(content, content_type=content_type)
+    for name, value in headers.items():
+        response[name] = value
+    return response
+
+
+def store(key, response):
+    if len(response.content) > settings.RESPONSE_CACHE_MAX_ENTRY_BYTES:
+        return
+    headers = {name: response[name] for name in CACHED_HEADERS if name in response}
+    _cache().set(key, (response.content, response['Content-Type'], headers))
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .consumers import BoardConsumer
+
+websocket_urlpatterns = [
+    path('ws/boards/', BoardConsumer.as_asgi()),
+]
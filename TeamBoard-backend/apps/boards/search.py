@@ -0,0 +1,123 @@
+import re
+
+from django.contrib.postgres.search import (SearchQuery, SearchRank,
+                                            SearchVectorField)
+from django.db import connection
+from django.db.models import Case, F, FloatField, Func, Q, Value, When
+from rest_framework import filters
+
+# Görev/proje başlık + açıklama üzerinde tam metin arama.
+#
+# Postgres: search_vector, title (A) ve description (B) ağırlıklı,
+# 'simple' sözlüklü bir tsvector'dür. Veritabanının hesapladığı (generated)
+# bir kolondur, bulk_create / bulk_update / update() sonrasında da güncel
+# kalır. GIN indexi migration'da oluşturulur (0005_search_vector).
+# Kelimeler önek olarak aranır ("rapo" -> "rapor").
+#
+# SQLite (testler): aynı kolon LOWER(title || ' ' || description) metnidir,
+# arama LIKE ile yapılır. Index kullanılmaz, sadece işlevsel eşdeğer.
+
+SEARCH_CONFIG = 'simple'
+MAX_TERMS = 8
+
+
+class SearchDocument(Func):
+
+    output_field = SearchVectorField()
+
+    def __init__(self, title, description):
+        super().__init__(F(title), F(description))
+
+    def _compile_args(self, compiler):
+        title, title_params = compiler.compile(self.source_expressions[0])
+        description, description_params = compiler.compile(self.source_expressions[1])
+        return title, description, (*title_params, *description_params)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        title, description, params = self._compile_args(compiler)
+        return f"LOWER({title} || ' ' || {description})", params
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        title, description, params = self._compile_args(compiler)
+        config = f"'{SEARCH_CONFIG}'::regconfig"
+        return (
+            f"setweight(to_tsvector({config}, COALESCE({title}, '')), 'A') || "
+            f"setweight(to_tsvector({config}, COALESCE({description}, '')), 'B')"
+        ), params
+
+
+def parse_terms(text):
+    return re.findall(r'\w+', (text or '').lower())[:MAX_TERMS]
+
+
+def _uses_tsvector():
+    return connection.vendor == 'postgresql'
+
+
+def _tsquery(terms):
+    return SearchQuery(
+        ' & '.join(f"'{term}':*" for term in terms),
+        search_type='raw',
+        config=SEARCH_CONFIG,
+    )
+
+
+def search(queryset, text):
+    # Eşleşen satırlar; sıralamaya dokunmaz (liste endpointleri için)
+    terms = parse_terms(text)
+    if not terms:
+        return queryset
+    if _uses_tsvector():
+        return queryset.filter(search_vector=_tsquery(terms))
+
+    condition = Q()
+    for term in terms:
+        condition &= Q(search_vector__contains=term)
+    return queryset.filter(condition)
+
+
+def ranked(queryset, text):
+    # Eşleşen satırlar, rank alanıyla ve en alakalı önce
+    terms = parse_terms(text)
+    if not terms:
+        return queryset.none()
+
+    queryset = search(queryset, text)
+    if _uses_tsvector():
+        rank = SearchRank(F('search_vector'), _tsquery(terms))
+    else:
+        # Başlıkta geçen her kelime açıklamadakinden daha değerli
+        rank = Value(0.0)
+        for term in terms:
+            rank = rank + Case(
+                When(title__icontains=term, then=Value(1.0)),
+                default=Value(0.4),
+                output_field=FloatField(),
+            )
+    return queryset.annotate(rank=rank).order_by('-rank', '-id')
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+
+    """
+    ?search= için. View'da search_vector = True ise search_vector kolonu
+    üzerinden arar; diğer view'larda DRF SearchFilter gibi search_fields
+    kullanır. Sonuçlar view'ın kendi sıralamasıyla (cursor sayfalama)
+    döner; alakaya göre sıralama için /api/search/ kullanılır.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not getattr(view, 'search_vector', False):
+            return super().filter_queryset(request, queryset, view)
+        return search(queryset, request.query_params.get(self.search_param, ''))
+
+    def get_schema_operation_parameters(self, view):
+        if not getattr(view, 'search_vector', False):
+            return super().get_schema_operation_parameters(view)
+        return [{
+            'name': self.search_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Başlık ve açıklamada tam metin arama',
+            'schema': {'type': 'string'},
+        }]
@@ -0,0 +1,143 @@
+import random
+from datetime import timedelta
+from itertools import accumulate
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from . import counters
+from .models import Project, Task, Team
+
+# Benchmark ve yük testleri için sentetik veri üretimi.
+# Tüm kayıtlar bulk_create ile, batch'ler halinde yazılır; bulk_create
+# sayaçları güncellemediği için sonunda yeni takım/projeler yeniden sayılır.
+#
+# Dağılımlar gerçek kullanıma yakın tutulur:
+#   - takım büyüklükleri Pareto: çoğu takım küçük, birkaç takım çok büyük
+#     (ortalama members_per_team)
+#   - görevler takım büyüklüğüyle orantılı olarak projelere dağılır
+#   - status: STATUS_WEIGHTS; tamamlananların bitiş tarihi çoğunlukla
+#     geçmişte, açık görevlerin bir kısmı gecikmiş, bir kısmında tarih yok
+
+STATUS_WEIGHTS = {
+    Task.STATUS_TODO: 35,
+    Task.STATUS_IN_PROGRESS: 20,
+    Task.STATUS_DONE: 45,
+}
+NO_DUE_DATE_RATIO = 0.15
+UNASSIGNED_RATIO = 0.1
+
+WORDS = (
+    'rapor', 'toplantı', 'tasarım', 'test', 'deploy', 'müşteri', 'fatura',
+    'sunum', 'analiz', 'hata', 'güncelleme', 'dokümantasyon', 'review', 'api',
+)
+
+
+def _team_sizes(rng, teams, mean, users):
+    # paretovariate(1.5) ortalaması 3 olduğundan mean / 3 ile ölçeklenir
+    return [
+        max(1, min(users, round(rng.paretovariate(1.5) * mean / 3)))
+        for _ in range(teams)
+    ]
+
+
+def _due_date(rng, status, today):
+    if rng.random() < NO_DUE_DATE_RATIO:
+        return None
+    if status == Task.STATUS_DONE:
+        return today + timedelta(days=round(rng.triangular(-90, 14, -7)))
+    # Açık görevlerin yaklaşık %20'si gecikmiş
+    return today + timedelta(days=round(rng.triangular(-21, 60, 7)))
+
+
+def _text(rng, count):
+    return ' '.join(rng.choices(WORDS, k=count))
+
+
+def seed_boards(*, users=200, teams=50, members_per_team=20, projects_per_team=5,
+                tasks=100_000, batch_size=5000, prefix='seed', random_seed=42,
+                progress=None):
+    rng = random.Random(random_seed)
+    today = timezone.localdate()
+
+    with transaction.atomic():
+        user_objs = User.objects.bulk_create(
+            (User(username=f'{prefix}_user_{i}', password='!') for i in range(users)),
+            batch_size=batch_size,
+        )
+
+        team_objs = Team.objects.bulk_create(
+            Team(name=f'{prefix} team {i}', owner=rng.choice(user_objs))
+            for i in range(teams)
+        )
+
+        Membership = Team.members.through
+        team_members = {}
+        memberships = []
+        for team, size in zip(team_objs, _team_sizes(rng, teams, members_per_team, users)):
+            members = {team.owner_id}
+            members.update(user.id for user in rng.sample(user_objs, size))
+            team_members[team.id] = list(members)
+            memberships.extend(
+                Membership(team_id=team.id, user_id=user_id) for user_id in members
+            )
+        Membership.objects.bulk_create(memberships, batch_size=batch_size)
+
+        project_objs = Project.objects.bulk_create(
+            Project(
+                title=f'{prefix} project {team.id}-{i}',
+                team=team,
+                is_active=rng.random() < 0.9,
+            )
+            for team in team_objs
+            for i in range(projects_per_team)
+        )
+
+        # Büyük takımların projelerine daha çok görev düşer
+        cum_weights = list(accumulate(len(team_members[p.team_id]) for p in project_objs))
+        statuses = list(STATUS_WEIGHTS)
+        status_weights = list(accumulate(STATUS_WEIGHTS.values()))
+
+        created = 0
+        while created < tasks:
+            count = min(batch_size, tasks - created)
+            projects = rng.choices(project_objs, cum_weights=cum_weights, k=count)
+            batch = []
+            for i, (project, status) in enumerate(
+                zip(projects, rng.choices(statuses, cum_weights=status_weights, k=count)),
+                start=created,
+            ):
+                batch.append(Task(
+                    title=f'{prefix} task {i} {_text(rng, 2)}',
+                    description=_text(rng, rng.randint(0, 8)),
+                    project=project,
+                    assignee_id=(
+                        None if rng.random() < UNASSIGNED_RATIO
+                        else rng.choice(team_members[project.team_id])
+                    ),
+                    status=status,
+                    due_date=_due_date(rng, status, today),
+                ))
+            Task.objects.bulk_create(batch)
+            created += count
+            if progress:
+                progress(created, tasks)
+
+        for start in range(0, len(team_objs), batch_size):
+            counters.recount_teams([team.id for team in team_objs[start:start + batch_size]])
+        for start in range(0, len(project_objs), batch_size):
+            counters.recount_projects([p.id for p in project_objs[start:start + batch_size]])
+
+    return {
+        'users': len(user_objs),
+        'teams': len(team_objs),
+        'memberships': len(memberships),
+        'projects': len(project_objs),
+        'tasks': tasks,
+    }
+
+
+def clear_seed(prefix='seed'):
+    # Takım, proje ve görevler kullanıcı silinince cascade ile gider
+    return User.objects.filter(username__startswith=f'{prefix}_user_').delete()
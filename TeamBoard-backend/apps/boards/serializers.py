@@ -1,12 +1,17 @@
+from django.conf import settings
 from django.contrib.auth.models import User
 from rest_framework import serializers
 
+from api.sparse import SparseFieldsetsMixin
+from api.timing import TimedSerializerMixin
 from apps.accounts.serializers import UserSerializer
 
-from .models import Project, Task, Team
+from .models import Project, Task, TaskEvent, Team
 
 
-class TeamSerializer(serializers.ModelSerializer):
+class TeamSerializer(TimedSerializerMixin, SparseFieldsetsMixin, serializers.ModelSerializer):
+    expandable_fields = ('owner', 'members')
+
     owner = UserSerializer(read_only=True)
     members = UserSerializer(many=True, read_only=True)
     member_ids = serializers.PrimaryKeyRelatedField(
@@ -15,8 +20,11 @@ class TeamSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Team
-        fields = ['id', 'name', 'owner', 'members', 'member_ids', 'created_at']
-        read_only_fields = ['id', 'owner', 'members', 'created_at']
+        fields = [
+            'id', 'name', 'owner', 'members', 'member_ids', 'project_count',
+            'created_at', 'updated_at',
+        ]
+        read_only_fields = ['id', 'owner', 'members', 'project_count', 'created_at', 'updated_at']
 
     def create(self, validated_data):
         member_ids = validated_data.pop('member_ids', [])
@@ -38,13 +46,52 @@ class TeamSerializer(serializers.ModelSerializer):
             instance.members.add(instance.owner)
         return instance
     
-class ProjectSerializer(serializers.ModelSerializer):
+class TaskCountsSerializer(serializers.Serializer):
+    # Project üzerindeki denormalize sayaçlar (bkz. counters.py); COUNT sorgusu yok
+    todo = serializers.IntegerField(source='todo_count')
+    in_progress = serializers.IntegerField(source='in_progress_count')
+    done = serializers.IntegerField(source='done_count')
+    overdue = serializers.IntegerField(source='overdue_count')
+
+
+class ProjectSerializer(TimedSerializerMixin, SparseFieldsetsMixin, serializers.ModelSerializer):
+    task_counts = TaskCountsSerializer(source='*', read_only=True)
+
     class Meta:
         model = Project
-        fields = ['id', 'title', 'description', 'team', 'is_active', 'created_at']
-        read_only_fields = ['id', 'created_at']
+        fields = [
+            'id', 'title', 'description', 'team', 'is_active', 'task_counts',
+            'created_at', 'updated_at',
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at']
 
-class TaskSerializer(serializers.ModelSerializer):
+class PreloadedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+
+    # Toplu işlemlerde her satır için ayrı SELECT atılmasın diye, context'te
+    # related_cache[field_name] = {pk: obj} verilmişse nesne oradan çözülür.
+    def to_internal_value(self, data):
+        cache = self.context.get('related_cache', {}).get(self.field_name)
+        if cache is None:
+            return super().to_internal_value(data)
+
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        obj = cache.get(pk)
+        if obj is None:
+            self.fail('does_not_exist', pk_value=data)
+        return obj
+
+
+class TaskSerializer(TimedSerializerMixin, SparseFieldsetsMixin, serializers.ModelSerializer):
+    expandable_fields = ('assignee_detail',)
+
+    project = PreloadedPrimaryKeyRelatedField(queryset=Project.objects.all())
+    assignee = PreloadedPrimaryKeyRelatedField(
+        queryset=User.objects.all(), allow_null=True, required=False
+    )
     assignee_detail = UserSerializer(source='assignee', read_only=True)
 
     class Meta:
@@ -58,9 +105,63 @@ class TaskSerializer(serializers.ModelSerializer):
             'assignee_detail', 
             'status', 
             'due_date', 
-            'created_at'
+            'created_at',
+            'updated_at',
         ]
-        read_only_fields = ['id', 'created_at']
+        read_only_fields = ['id', 'created_at', 'updated_at']
+
+
+class TaskEventSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    task = serializers.IntegerField(source='task_id', read_only=True)
+    user = serializers.IntegerField(source='user_id', read_only=True)
+
+    class Meta:
+        model = TaskEvent
+        fields = ['id', 'task', 'user', 'username', 'field', 'old_value', 'new_value', 'created_at']
+        read_only_fields = fields
+
+
+class TaskBulkOperationSerializer(serializers.Serializer):
+    OP_CREATE = 'create'
+    OP_UPDATE = 'update'
+
+    op = serializers.ChoiceField(choices=[OP_CREATE, OP_UPDATE])
+    id = serializers.IntegerField(required=False)
+    data = serializers.DictField()
+
+    def validate(self, attrs):
+        if attrs['op'] == self.OP_UPDATE and 'id' not in attrs:
+            raise serializers.ValidationError({'id': 'Güncelleme için görev id zorunludur.'})
+        return attrs
+
+
+class TaskBulkSerializer(TimedSerializerMixin, serializers.Serializer):
+    operations = TaskBulkOperationSerializer(many=True, allow_empty=False)
+
+    def validate_operations(self, value):
+        limit = settings.TASK_BULK_MAX_OPERATIONS
+        if len(value) > limit:
+            raise serializers.ValidationError(
+                f'Tek istekte en fazla {limit} işlem gönderilebilir.'
+            )
+        return value
+
+
+class SyncQuerySerializer(TimedSerializerMixin, serializers.Serializer):
+    since = serializers.CharField(required=False)
+    limit = serializers.IntegerField(required=False, min_value=1)
+
+    def validate_limit(self, value):
+        return min(value, settings.SYNC_MAX_PAGE_SIZE)
+
+
+class SearchQuerySerializer(TimedSerializerMixin, serializers.Serializer):
+    TYPE_PROJECT = 'project'
+    TYPE_TASK = 'task'
+
+    q = serializers.CharField(max_length=200)
+    type = serializers.ChoiceField(choices=[TYPE_PROJECT, TYPE_TASK], required=False)
+    limit = serializers.IntegerField(required=False, min_value=1)
 
-        
-        
\ No newline at end of file
+    def validate_limit(self, value):
+        return min(value, settings.SEARCH_MAX_RESULTS)
@@ -0,0 +1,128 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete, pre_save)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.accounts.serializers import UserSerializer
+
+from . import counters, membership, response_cache
+from .models import Project, Task, Team, task_team_ids
+
+
+def team_user_ids(team):
+    return {team.owner_id, *team.members.through.objects
+            .filter(team_id=team.id).values_list('user_id', flat=True)}
+
+
+# Membership cache invalidation
+
+@receiver(pre_save, sender=Team)
+def remember_previous_owner(sender, instance, **kwargs):
+    # Owner değişirse eski owner'ın cache'i de silinmeli
+    instance._previous_owner_id = None
+    if instance.pk is not None:
+        instance._previous_owner_id = (
+            Team.objects.filter(pk=instance.pk).values_list('owner_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Team)
+def invalidate_team_membership(sender, instance, created, **kwargs):
+    response_cache.bump_teams([instance.id])
+    if created:
+        # Yeni takımın henüz üyesi yok, sadece owner etkilenir
+        membership.invalidate([instance.owner_id])
+        return
+    membership.invalidate(
+        team_user_ids(instance) | {getattr(instance, '_previous_owner_id', None)}
+    )
+
+
+@receiver(pre_delete, sender=Team)
+def collect_team_users(sender, instance, **kwargs):
+    # Üyelik satırları takımla birlikte (sinyalsiz) silineceği için önceden topluyoruz
+    instance._member_user_ids = team_user_ids(instance)
+
+
+@receiver(post_delete, sender=Team)
+def invalidate_deleted_team(sender, instance, **kwargs):
+    response_cache.bump_teams([instance.id])
+    membership.invalidate(getattr(instance, '_member_user_ids', {instance.owner_id}))
+
+
+@receiver(m2m_changed, sender=Team.members.through)
+def invalidate_members(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear':
+        # clear() sonrasında kimin silindiği bilinmez
+        if reverse:
+            # user.teams.clear(): post_clear'da pk_set None, takımlar burada
+            instance._cleared_team_user_ids = {instance.pk}
+            instance._cleared_team_ids = set(instance.teams.values_list('pk', flat=True))
+        else:
+            instance._cleared_team_user_ids = team_user_ids(instance)
+        return
+
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if reverse:
+        # user.teams.add(team): instance kullanıcı
+        membership.invalidate([instance.pk])
+        if action == 'post_clear':
+            team_ids = getattr(instance, '_cleared_team_ids', set())
+        else:
+            team_ids = pk_set or ()
+    elif action == 'post_clear':
+        membership.invalidate(getattr(instance, '_cleared_team_user_ids', set()))
+        team_ids = [instance.pk]
+    else:
+        membership.invalidate(pk_set or ())
+        team_ids = [instance.pk]
+
+    # Üye listesi takım yanıtının parçası; ETag / Last-Modified değişmeli
+    response_cache.bump_teams(team_ids)
+    if team_ids:
+        Team.objects.filter(pk__in=team_ids).update(updated_at=timezone.now())
+
+
+# Yanıt cache'i (response_cache.py): yazılan kaydın takımının nesli artar;
+# sayaçlar (counters.py) da burada güncellenir. Silmeler Project.delete /
+# Task.delete içinde (post_delete receiver'ı cascade'deki toplu silmeyi
+# engelliyordu); toplu işlemler view'da.
+
+@receiver(post_save, sender=Project)
+def bump_project_team(sender, instance, created, **kwargs):
+    response_cache.bump_teams([instance.team_id, getattr(instance, '_loaded_team_id', None)])
+    counters.project_saved(instance, created)
+    instance._loaded_team_id = instance.team_id
+
+
+@receiver(post_save, sender=Task)
+def bump_task_team(sender, instance, created, **kwargs):
+    response_cache.bump_teams(task_team_ids([instance]))
+    counters.tasks_saved([instance], created=created)
+    instance._loaded_project_id = instance.project_id
+
+
+# Takım (owner / members) ve görev (assignee_detail) yanıtları kullanıcıyı
+# iç içe içerir; kullanıcı değişince bu satırların updated_at'i yenilenir,
+# ETag / Last-Modified ve /api/sync/ değişikliği görür. İlgili takımların
+# yanıt cache'i nesli de artar.
+NESTED_USER_FIELDS = set(UserSerializer.Meta.fields) - {'id'}
+
+
+@receiver(post_save, sender=User)
+def touch_user_boards(sender, instance, created, update_fields=None, **kwargs):
+    # Yeni kullanıcı henüz hiçbir yanıtta yok; last_login gibi alanlar görünmez
+    if created or (update_fields is not None and not NESTED_USER_FIELDS & set(update_fields)):
+        return
+    member_team_ids = set(Team.objects.with_member(instance.pk).values_list('pk', flat=True))
+    assigned_team_ids = set(
+        Project.objects.filter(tasks__assignee_id=instance.pk).values_list('team_id', flat=True)
+    )
+    response_cache.bump_teams(member_team_ids | assigned_team_ids)
+
+    now = timezone.now()
+    Team.objects.filter(pk__in=member_team_ids).update(updated_at=now)
+    Task.objects.filter(assignee_id=instance.pk).update(updated_at=now)
@@ -0,0 +1,69 @@
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import Task
+
+# Board özetleri (durum sayıları, gecikmiş görevler, kişi/proje bazında yük).
+# Task nesneleri oluşturulmaz: (proje, assignee) bazında gruplanmış tek bir
+# COUNT(... FILTER (WHERE ...)) sorgusu çalışır, toplamlar Python'da birleştirilir.
+
+STATUSES = [status for status, _ in Task.STATUS_CHOICES]
+
+
+def _empty_counts():
+    return {'total': 0, **{status: 0 for status in STATUSES}, 'overdue': 0}
+
+
+def _add(target, row):
+    for key in ('total', *STATUSES, 'overdue'):
+        target[key] += row[key]
+
+
+def build_summary(tasks):
+    today = timezone.localdate()
+    counts = {
+        status: Count('id', filter=Q(status=status)) for status in STATUSES
+    }
+    rows = (
+        tasks.order_by()
+        .values('project_id', 'project__title', 'assignee_id', 'assignee__username')
+        .annotate(
+            total=Count('id'),
+            overdue=Count(
+                'id',
+                filter=Q(due_date__lt=today) & ~Q(status=Task.STATUS_DONE),
+            ),
+            **counts,
+        )
+    )
+
+    totals = _empty_counts()
+    by_assignee = {}
+    by_project = {}
+
+    for row in rows:
+        _add(totals, row)
+
+        assignee = by_assignee.setdefault(row['assignee_id'], {
+            'assignee': row['assignee_id'],
+            'username': row['assignee__username'],
+            **_empty_counts(),
+        })
+        _add(assignee, row)
+
+        project = by_project.setdefault(row['project_id'], {
+            'project': row['project_id'],
+            'title': row['project__title'],
+            **_empty_counts(),
+        })
+        _add(project, row)
+
+    return {
+        'total': totals['total'],
+        'by_status': {status: totals[status] for status in STATUSES},
+        'overdue': totals['overdue'],
+        'by_assignee': sorted(
+            by_assignee.values(), key=lambda item: (-item['total'], item['username'] or '')
+        ),
+        'by_project': sorted(by_project.values(), key=lambda item: item['project']),
+    }
@@ -0,0 +1,172 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from . import membership
+from .models import Project, Task, Tombstone
+from .serializers import ProjectSerializer, TaskSerializer
+
+# GET /api/sync/ "şu andan beri değişenler" akışı.
+#
+# Token (istemci için opak) şu durumu taşır:
+#   since   : bu pencerenin alt sınırı (updated_at > since), ilk yüklemede None
+#   until   : pencerenin üst sınırı, ilk sayfada sabitlenir
+#   teams   : istemcinin bir önceki senkronizasyonda bildiği takımlar;
+#             sonradan görünür olan takımların tüm verisi gönderilir
+#   cursors : sayfalama için her akışta son görülen (zaman, id)
+#
+# Pencere bitince bir sonraki since = until - SYNC_OVERLAP_SECONDS olur;
+# commit sırası yüzünden geç görünen satırlar kaçmasın diye pencereler
+# biraz örtüşür (istemci kayıtları id ile upsert ettiği için sorun olmaz).
+
+TOKEN_VERSION = 1
+STREAMS = ('projects', 'tasks', 'deleted')
+DONE = 'done'
+
+INVALID_TOKEN = 'Geçersiz senkronizasyon anahtarı.'
+
+
+def initial_state():
+    return {'since': None, 'until': None, 'teams': [], 'cursors': {}}
+
+
+def encode_token(state):
+    payload = {
+        'v': TOKEN_VERSION,
+        'since': state['since'].isoformat() if state['since'] else None,
+        'until': state['until'].isoformat() if state['until'] else None,
+        'teams': state['teams'],
+        'cursors': {
+            name: cursor if cursor == DONE else [cursor[0].isoformat(), cursor[1]]
+            for name, cursor in state['cursors'].items()
+        },
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_token(token):
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        payload = json.loads(raw)
+        if payload.get('v') != TOKEN_VERSION:
+            raise ValueError('version')
+
+        def parse(value):
+            return datetime.fromisoformat(value) if value else None
+
+        cursors = {}
+        for name, cursor in payload.get('cursors', {}).items():
+            if name not in STREAMS:
+                raise ValueError(name)
+            cursors[name] = cursor if cursor == DONE else (parse(cursor[0]), int(cursor[1]))
+
+        return {
+            'since': parse(payload['since']),
+            'until': parse(payload['until']),
+            'teams': [int(team_id) for team_id in payload['teams']],
+            'cursors': cursors,
+        }
+    except (ValueError, TypeError, KeyError, IndexError):
+        raise ValidationError({'since': INVALID_TOKEN})
+
+
+def _page(queryset, field, cursor, limit):
+    if cursor == DONE:
+        return [], DONE, False
+    if cursor is not None:
+        ts, pk = cursor
+        queryset = queryset.filter(Q(**{f'{field}__gt': ts}) | Q(**{field: ts, 'id__gt': pk}))
+
+    rows = list(queryset.order_by(field, 'id')[:limit + 1])
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, (getattr(last, field), last.id), True
+    return rows, DONE, False
+
+
+def get_changes(user, state, limit, context=None):
+    now = timezone.now()
+    team_ids = membership.get_team_ids(user)
+    first_page = not state['cursors']
+
+    since = state['since']
+    retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    if first_page and since is not None and since < now - retention:
+        # İzler silinmiş olabilir; güvenli yol tam yükleme
+        since = None
+
+    until = state['until'] or now
+    known = sorted(set(state['teams']) & set(team_ids)) if since else []
+    new = sorted(set(team_ids) - set(known))
+
+    project_scope = Q(team_id__in=new)
+    task_scope = Q(project_id__in=Project.objects.filter(team_id__in=new).values('id'))
+    if known:
+        project_scope |= Q(team_id__in=known, updated_at__gt=since)
+        task_scope |= Q(
+            project_id__in=Project.objects.filter(team_id__in=known).values('id'),
+            updated_at__gt=since,
+        )
+
+    projects, project_cursor, more_projects = _page(
+        Project.objects.filter(project_scope, updated_at__lte=until),
+        'updated_at', state['cursors'].get('projects'), limit,
+    )
+    tasks, task_cursor, more_tasks = _page(
+        Task.objects.filter(task_scope, updated_at__lte=until).select_related('assignee'),
+        'updated_at', state['cursors'].get('tasks'), limit,
+    )
+
+    deleted, deleted_cursor, more_deleted = [], DONE, False
+    if known:
+        deleted, deleted_cursor, more_deleted = _page(
+            Tombstone.objects.filter(
+                Q(object_type=Tombstone.TYPE_PROJECT, team_id__in=known)
+                | Q(object_type=Tombstone.TYPE_TASK,
+                    project_id__in=Project.objects.filter(team_id__in=known).values('id')),
+                deleted_at__gt=since,
+                deleted_at__lte=until,
+            ),
+            'deleted_at', state['cursors'].get('deleted'), limit,
+        )
+
+    has_more = more_projects or more_tasks or more_deleted
+    if has_more:
+        next_state = {
+            'since': since,
+            'until': until,
+            'teams': known,
+            'cursors': {
+                'projects': project_cursor,
+                'tasks': task_cursor,
+                'deleted': deleted_cursor,
+            },
+        }
+    else:
+        next_state = {
+            'since': until - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS),
+            'until': None,
+            'teams': team_ids,
+            'cursors': {},
+        }
+
+    return {
+        # True ise istemci yerel durumu silip bu akışla baştan kurmalı
+        'reset': first_page and since is None,
+        'teams': team_ids,
+        'projects': ProjectSerializer(projects, many=True, context=context).data,
+        'tasks': TaskSerializer(tasks, many=True, context=context).data,
+        'deleted': [
+            {'type': row.object_type, 'id': row.object_id, 'deleted_at': row.deleted_at}
+            for row in deleted
+        ],
+        'has_more': has_more,
+        'next': encode_token(next_state),
+    }
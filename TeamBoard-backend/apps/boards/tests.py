@@ -1,3 +1,1435 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import tempfile
+from datetime import date, timedelta
+from pathlib import Path
 
-# Create your tests here.
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from channels.db import database_sync_to_async
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncRequestFactory, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.asgi import application
+from apps.accounts.views import AsyncActiveUserViewSet, AsyncMeView
+
+from . import counters, history, membership, response_cache
+from .models import Project, Task, TaskEvent, Team
+from .seeding import seed_boards
+from .views import (AsyncProjectViewSet, AsyncTaskViewSet, AsyncTeamViewSet,
+                    TaskViewSet, TeamViewSet)
+
+
+# Görev geçmişi istek thread'inde yazılır; test transaction'ı arka plan
+# thread'inin bağlantısından görünmez (bkz. history.py)
+@override_settings(TASK_HISTORY_WRITE_BEHIND=False)
+class BoardsAPITestCase(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        caches['responses'].clear()
+        membership.counter.reset()
+
+        self.owner = User.objects.create_user(username='owner')
+        self.member = User.objects.create_user(username='member')
+        self.outsider = User.objects.create_user(username='outsider')
+
+        self.team = Team.objects.create(name='Core', owner=self.owner)
+        self.team.members.add(self.owner, self.member)
+        self.project = Project.objects.create(title='Board', team=self.team)
+
+        self.client.force_authenticate(self.owner)
+
+    def create_tasks(self, count, **kwargs):
+        return Task.objects.bulk_create(
+            Task(title=f'Task {i}', project=self.project, **kwargs)
+            for i in range(count)
+        )
+
+
+class CursorPaginationTests(BoardsAPITestCase):
+
+    def collect_pages(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            body = response.json()
+            self.assertTrue(body['success'])
+            ids.extend(item['id'] for item in body['data']['results'])
+            url = body['data']['next']
+        return ids
+
+    def test_list_is_wrapped_in_envelope(self):
+        self.create_tasks(3)
+
+        body = self.client.get('/api/tasks/').json()
+
+        self.assertEqual(set(body), {'success', 'message', 'data'})
+        self.assertEqual(set(body['data']), {'next', 'previous', 'results'})
+        self.assertEqual(len(body['data']['results']), 3)
+
+    def test_pages_cover_every_task_once(self):
+        tasks = self.create_tasks(7)
+
+        ids = self.collect_pages('/api/tasks/?page_size=3')
+
+        self.assertEqual(sorted(ids), sorted(task.id for task in tasks))
+
+    def test_pages_respect_filters_and_ordering(self):
+        self.create_tasks(4, status=Task.STATUS_DONE)
+        self.create_tasks(3, status=Task.STATUS_TODO)
+
+        ids = self.collect_pages('/api/tasks/?status=done&ordering=title&page_size=2')
+
+        titles = list(Task.objects.filter(id__in=ids).order_by('title', 'id')
+                      .values_list('id', flat=True))
+        self.assertEqual(ids, titles)
+
+    @override_settings(API_MAX_PAGE_SIZE=2)
+    def test_page_size_is_capped(self):
+        self.create_tasks(5)
+
+        body = self.client.get('/api/tasks/?page_size=100').json()
+
+        self.assertEqual(len(body['data']['results']), 2)
+        self.assertIsNotNone(body['data']['next'])
+
+
+# Yanıt cache'i kapalı: ölçülen, cache miss'te çalışan veritabanı yolu
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class QueryCountTests(BoardsAPITestCase):
+
+    # Liste istekleri sayfa boyutundan bağımsız, sabit sayıda sorgu atmalı.
+    # Üyelik cache'i önceden doldurulur; soğuk cache +1 sorgu demektir.
+    # Board listelerinde ilk sorgu ETag için Max(updated_at) + Count'tur.
+    def assert_constant_queries(self, url, expected, grow):
+        membership.get_memberships(self.owner)
+        with self.assertNumQueries(expected):
+            self.client.get(url)
+        grow()
+        membership.get_memberships(self.owner)
+        with self.assertNumQueries(expected):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def add_team(self):
+        team = Team.objects.create(name=f'Team {Team.objects.count()}', owner=self.owner)
+        team.members.add(self.owner, self.member, self.outsider)
+
+    def test_task_list(self):
+        self.create_tasks(2, assignee=self.member)
+
+        self.assert_constant_queries(
+            '/api/tasks/', 2, lambda: self.create_tasks(20, assignee=self.outsider)
+        )
+
+    def test_project_list(self):
+        def grow():
+            Project.objects.bulk_create(
+                Project(title=f'P{i}', team=self.team) for i in range(20)
+            )
+
+        self.assert_constant_queries('/api/projects/', 2, grow)
+
+    def test_team_list(self):
+        def grow():
+            for _ in range(10):
+                self.add_team()
+
+        # ETag, takımlar ve üyelerin prefetch sorgusu
+        self.assert_constant_queries('/api/teams/', 3, grow)
+
+    def test_user_list(self):
+        def grow():
+            User.objects.bulk_create(User(username=f'user{i}') for i in range(20))
+
+        self.assert_constant_queries('/api/users/', 1, grow)
+
+    def test_task_detail(self):
+        task = self.create_tasks(1, assignee=self.member)[0]
+        self.client.force_authenticate(self.member)
+        membership.get_memberships(self.member)
+
+        # görev (+ proje, assignee join); üyelik cache'ten
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/tasks/{task.id}/')
+        self.assertEqual(response.status_code, 200)
+
+    def test_task_update_does_not_reload_task(self):
+        task = self.create_tasks(1)[0]
+        membership.get_memberships(self.owner)
+
+        # görev, SAVEPOINT, UPDATE, proje sayaçları, RELEASE
+        with self.assertNumQueries(5):
+            response = self.client.patch(
+                f'/api/tasks/{task.id}/', {'status': Task.STATUS_DONE}, format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+
+
+class VisibilityTests(BoardsAPITestCase):
+
+    def test_owner_and_member_see_each_row_once(self):
+        # owner hem sahip hem üye; JOIN ile satır iki kez gelirdi
+        self.create_tasks(2)
+
+        self.assertEqual(Team.objects.visible_to(self.owner).count(), 1)
+        self.assertEqual(Project.objects.visible_to(self.owner).count(), 1)
+        self.assertEqual(Task.objects.visible_to(self.owner).count(), 2)
+        self.assertEqual(Task.objects.visible_to(self.member).count(), 2)
+
+    def test_outsider_sees_nothing(self):
+        task = self.create_tasks(1)[0]
+        self.client.force_authenticate(self.outsider)
+
+        self.assertFalse(Task.objects.visible_to(self.outsider).exists())
+        self.assertEqual(self.client.get('/api/tasks/').json()['data']['results'], [])
+        self.assertEqual(self.client.get(f'/api/tasks/{task.id}/').status_code, 404)
+
+    def test_visibility_query_has_no_distinct(self):
+        sql = str(Task.objects.visible_to(self.member).query)
+
+        self.assertNotIn('DISTINCT', sql)
+        self.assertNotIn('JOIN', sql)
+
+
+class TaskBulkTests(BoardsAPITestCase):
+
+    url = '/api/tasks/bulk/'
+
+    def test_create_and_update_in_one_request(self):
+        task = self.create_tasks(1)[0]
+
+        response = self.client.post(self.url, {'operations': [
+            {'op': 'create', 'data': {'title': 'New', 'project': self.project.id,
+                                      'assignee': self.member.id}},
+            {'op': 'update', 'id': task.id, 'data': {'status': 'done',
+                                                     'assignee': self.member.id}},
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual((data['created'], data['updated'], data['failed']), (1, 1, 0))
+        self.assertEqual(data['results'][0]['data']['assignee_detail']['username'], 'member')
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.assignee_id), ('done', self.member.id))
+
+    def test_query_count_does_not_grow_with_batch(self):
+        tasks = self.create_tasks(20)
+        operations = [
+            {'op': 'update', 'id': task.id, 'data': {'status': 'in_progress'}}
+            for task in tasks
+        ]
+
+        membership.get_memberships(self.owner)
+
+        # görevler, projeler, SAVEPOINT, bulk_update, proje sayaçları, RELEASE
+        # (assignee gönderilmediği için kullanıcı sorgusu yok)
+        with self.assertNumQueries(6):
+            response = self.client.post(self.url, {'operations': operations}, format='json')
+
+        self.assertEqual(response.json()['data']['updated'], 20)
+        self.assertEqual(Task.objects.filter(status='in_progress').count(), 20)
+
+    def test_assignee_may_only_change_status(self):
+        own, other = self.create_tasks(2)
+        Task.objects.filter(id=own.id).update(assignee=self.member)
+        self.client.force_authenticate(self.member)
+
+        response = self.client.post(self.url, {'operations': [
+            {'op': 'update', 'id': own.id, 'data': {'status': 'done'}},
+            {'op': 'update', 'id': own.id, 'data': {'title': 'Renamed'}},
+            {'op': 'update', 'id': other.id, 'data': {'status': 'done'}},
+            {'op': 'create', 'data': {'title': 'New', 'project': self.project.id}},
+        ]}, format='json')
+
+        results = response.json()['data']['results']
+        self.assertEqual([r['success'] for r in results], [True, False, False, False])
+        self.assertEqual(Task.objects.get(id=own.id).title, 'Task 0')
+        self.assertEqual(Task.objects.get(id=other.id).status, 'todo')
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_invisible_tasks_are_not_found(self):
+        task = self.create_tasks(1)[0]
+        self.client.force_authenticate(self.outsider)
+
+        response = self.client.post(self.url, {'operations': [
+            {'op': 'update', 'id': task.id, 'data': {'status': 'done'}},
+        ]}, format='json')
+
+        self.assertFalse(response.json()['data']['results'][0]['success'])
+        self.assertEqual(Task.objects.get(id=task.id).status, 'todo')
+
+    def test_operation_limit(self):
+        with self.settings(TASK_BULK_MAX_OPERATIONS=1):
+            response = self.client.post(self.url, {'operations': [
+                {'op': 'create', 'data': {}}, {'op': 'create', 'data': {}},
+            ]}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
+
+class MembershipCacheTests(BoardsAPITestCase):
+
+    def roles(self, user):
+        return membership.get_memberships(user)
+
+    def test_roles(self):
+        self.assertEqual(self.roles(self.owner), {self.team.id: membership.ROLE_OWNER})
+        self.assertEqual(self.roles(self.member), {self.team.id: membership.ROLE_MEMBER})
+        self.assertEqual(self.roles(self.outsider), {})
+
+    def test_second_lookup_is_served_from_cache(self):
+        self.roles(self.member)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(self.team.has_member(self.member))
+
+        self.assertEqual(membership.counter.snapshot()['hits'], 1)
+        self.assertEqual(membership.counter.snapshot()['misses'], 1)
+
+    def test_member_add_and_remove_invalidate(self):
+        self.assertEqual(self.roles(self.outsider), {})
+
+        self.team.members.add(self.outsider)
+        self.assertIn(self.team.id, self.roles(self.outsider))
+
+        self.team.members.remove(self.outsider)
+        self.assertEqual(self.roles(self.outsider), {})
+
+    def test_serializer_member_set_invalidates(self):
+        self.roles(self.member)
+        self.roles(self.outsider)
+
+        response = self.client.patch(
+            f'/api/teams/{self.team.id}/', {'member_ids': [self.outsider.id]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.roles(self.member), {})
+        self.assertIn(self.team.id, self.roles(self.outsider))
+
+    def test_reverse_add_and_clear_invalidate(self):
+        self.roles(self.outsider)
+        self.outsider.teams.add(self.team)
+        self.assertIn(self.team.id, self.roles(self.outsider))
+
+        self.roles(self.member)
+        self.team.members.clear()
+        self.assertEqual(self.roles(self.member), {})
+
+        # Ters clear: takımın yanıt nesli ve updated_at'i de değişmeli
+        self.outsider.teams.add(self.team)
+        generation = response_cache.get_generations([self.team.id])
+        updated_at = Team.objects.get(pk=self.team.pk).updated_at
+        self.outsider.teams.clear()
+        self.assertEqual(self.roles(self.outsider), {})
+        self.assertNotEqual(response_cache.get_generations([self.team.id]), generation)
+        self.assertGreater(Team.objects.get(pk=self.team.pk).updated_at, updated_at)
+
+    def test_team_delete_and_owner_change_invalidate(self):
+        self.roles(self.owner)
+        self.roles(self.member)
+
+        self.team.owner = self.member
+        self.team.save()
+        self.assertEqual(self.roles(self.member), {self.team.id: membership.ROLE_OWNER})
+        self.assertEqual(self.roles(self.owner), {self.team.id: membership.ROLE_MEMBER})
+
+        self.team.delete()
+        self.assertEqual(self.roles(self.owner), {})
+        self.assertEqual(self.roles(self.member), {})
+
+    def test_metrics_endpoint_exposes_counters(self):
+        self.owner.is_staff = True
+        self.owner.save()
+
+        body = self.client.get('/api/metrics/').json()
+
+        self.assertIn('membership_cache', body['data'])
+        self.client.force_authenticate(self.member)
+        self.assertEqual(self.client.get('/api/metrics/').status_code, 403)
+
+
+class SummaryTests(BoardsAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        yesterday = timezone.localdate() - timedelta(days=1)
+        self.other_project = Project.objects.create(title='Other', team=self.team)
+        self.create_tasks(2, assignee=self.member, due_date=yesterday)
+        self.create_tasks(1, assignee=self.member, status=Task.STATUS_DONE, due_date=yesterday)
+        self.create_tasks(1, status=Task.STATUS_IN_PROGRESS)
+        Task.objects.create(title='Elsewhere', project=self.other_project)
+
+    def test_project_summary(self):
+        membership.get_memberships(self.owner)
+
+        # proje (yetki kontrolü) + tek gruplu COUNT sorgusu
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/projects/{self.project.id}/summary/')
+
+        data = response.json()['data']
+        self.assertEqual(data['total'], 4)
+        self.assertEqual(data['by_status'], {'todo': 2, 'in_progress': 1, 'done': 1})
+        self.assertEqual(data['overdue'], 2)
+        member_row = next(row for row in data['by_assignee'] if row['assignee'] == self.member.id)
+        self.assertEqual((member_row['total'], member_row['overdue']), (3, 2))
+
+    def test_team_summary_groups_projects(self):
+        data = self.client.get(f'/api/teams/{self.team.id}/summary/').json()['data']
+
+        self.assertEqual(data['total'], 5)
+        self.assertEqual(
+            {row['project']: row['total'] for row in data['by_project']},
+            {self.project.id: 4, self.other_project.id: 1},
+        )
+
+    def test_summary_requires_membership(self):
+        self.client.force_authenticate(self.outsider)
+
+        self.assertEqual(self.client.get(f'/api/teams/{self.team.id}/summary/').status_code, 404)
+        self.assertEqual(
+            self.client.get(f'/api/projects/{self.project.id}/summary/').status_code, 404
+        )
+
+
+class CounterTests(BoardsAPITestCase):
+
+    def task_counts(self, project=None):
+        project = project or self.project
+        return Project.objects.values(
+            'todo_count', 'in_progress_count', 'done_count', 'overdue_count'
+        ).get(pk=project.pk)
+
+    def assertCounts(self, project=None, todo=0, in_progress=0, done=0, overdue=0):
+        self.assertEqual(self.task_counts(project), {
+            'todo_count': todo,
+            'in_progress_count': in_progress,
+            'done_count': done,
+            'overdue_count': overdue,
+        })
+
+    def test_task_create_update_delete_through_api(self):
+        yesterday = timezone.localdate() - timedelta(days=1)
+        response = self.client.post('/api/tasks/', {
+            'title': 'Late', 'project': self.project.id, 'due_date': yesterday.isoformat(),
+        }, format='json')
+        task_id = response.json()['data']['id']
+        self.assertCounts(todo=1, overdue=1)
+
+        self.client.patch(f'/api/tasks/{task_id}/', {'status': 'done'}, format='json')
+        self.assertCounts(done=1)
+
+        self.client.delete(f'/api/tasks/{task_id}/')
+        self.assertCounts()
+
+    def test_moving_task_updates_both_projects(self):
+        other = Project.objects.create(title='Other', team=self.team)
+        task = Task.objects.create(title='Move', project=self.project, status='in_progress')
+
+        self.client.patch(f'/api/tasks/{task.id}/', {'project': other.id}, format='json')
+
+        self.assertCounts(self.project)
+        self.assertCounts(other, in_progress=1)
+
+    def test_bulk_operations_update_counters(self):
+        task = Task.objects.create(title='Existing', project=self.project)
+
+        self.client.post('/api/tasks/bulk/', {'operations': [
+            {'op': 'create', 'data': {'title': 'A', 'project': self.project.id}},
+            {'op': 'create', 'data': {'title': 'B', 'project': self.project.id, 'status': 'done'}},
+            {'op': 'update', 'id': task.id, 'data': {'status': 'in_progress'}},
+        ]}, format='json')
+
+        self.assertCounts(todo=1, in_progress=1, done=1)
+
+    def test_deferred_status_falls_back_to_recount(self):
+        Task.objects.create(title='A', project=self.project)
+        task = Task.objects.only('id', 'title', 'project_id').get()
+
+        task.status = Task.STATUS_DONE
+        task.save()
+
+        self.assertCounts(done=1)
+
+    def test_queryset_delete_and_project_cascade(self):
+        Task.objects.create(title='A', project=self.project)
+        Task.objects.create(title='B', project=self.project, status='done')
+
+        Task.objects.filter(status='done').delete()
+        self.assertCounts(todo=1)
+
+        self.client.delete(f'/api/projects/{self.project.id}/')
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.project_count, 0)
+
+    def test_saving_stale_instance_keeps_counters(self):
+        project = Project.objects.get(pk=self.project.pk)
+        Task.objects.create(title='A', project=self.project)
+
+        project.title = 'Renamed'
+        project.save()
+
+        self.assertCounts(todo=1)
+
+    def test_project_limit_uses_counter(self):
+        for i in range(9):
+            Project.objects.create(title=f'P{i}', team=self.team)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.project_count, 10)
+
+        with self.assertNumQueries(8):
+            response = self.client.post(
+                '/api/projects/', {'title': 'Eleventh', 'team': self.team.id}, format='json'
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Project.objects.filter(team=self.team).count(), 10)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.project_count, 10)
+
+    def test_serialized_counts(self):
+        Task.objects.create(title='A', project=self.project, status='in_progress')
+
+        project = self.client.get(f'/api/projects/{self.project.id}/').json()['data']
+        team = self.client.get(f'/api/teams/{self.team.id}/').json()['data']
+
+        self.assertEqual(project['task_counts'], {'todo': 0, 'in_progress': 1, 'done': 0, 'overdue': 0})
+        self.assertEqual(team['project_count'], 1)
+
+    def test_overdue_refresh_on_new_day(self):
+        today = timezone.localdate()
+        Task.objects.create(title='Due', project=self.project, due_date=today)
+        self.assertCounts(todo=1)
+
+        changed = counters.refresh_overdue(today=today + timedelta(days=1))
+
+        self.assertEqual(changed, {self.team.id})
+        self.assertCounts(todo=1, overdue=1)
+
+    def test_repair_command_fixes_drift(self):
+        self.create_tasks(3)
+        self.create_tasks(2, status=Task.STATUS_DONE)
+        Team.objects.filter(pk=self.team.pk).update(project_count=7)
+
+        call_command('repair_board_counters', '--batch-size', '1', stdout=io.StringIO())
+
+        self.assertCounts(todo=3, done=2)
+        self.team.refresh_from_db()
+        self.assertEqual(self.team.project_count, 1)
+
+
+class SparseFieldsetTests(BoardsAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create_tasks(3, assignee=self.member, description='Uzun açıklama')
+
+    def test_default_output_is_unchanged(self):
+        task = self.client.get('/api/tasks/').json()['data']['results'][0]
+        team = self.client.get(f'/api/teams/{self.team.id}/').json()['data']
+
+        self.assertIn('description', task)
+        self.assertEqual(task['assignee_detail']['username'], 'member')
+        self.assertEqual(team['owner']['username'], 'owner')
+        self.assertEqual(len(team['members']), 2)
+
+    def test_fields_prune_output_and_columns(self):
+        membership.get_memberships(self.owner)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/tasks/?fields=id,title,status,assignee')
+
+        results = response.json()['data']['results']
+        self.assertEqual(set(results[0]), {'id', 'title', 'status', 'assignee'})
+        self.assertEqual(results[0]['assignee'], self.member.id)
+        page_query = queries.captured_queries[-1]['sql']
+        self.assertNotIn('description', page_query)
+        self.assertNotIn('auth_user', page_query)
+
+    def test_expand_adds_relation_join(self):
+        results = self.client.get(
+            '/api/tasks/?fields=id,title&expand=assignee_detail'
+        ).json()['data']['results']
+
+        self.assertEqual(set(results[0]), {'id', 'title', 'assignee_detail'})
+        self.assertEqual(results[0]['assignee_detail']['username'], 'member')
+
+    def test_team_without_expand_skips_members_prefetch(self):
+        membership.get_memberships(self.owner)
+
+        # ETag (Max + Count) + takım sayfası; owner JOIN'i ve members prefetch'i yok
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/teams/?fields=id,name,project_count')
+
+        self.assertEqual(response.json()['data']['results'][0], {
+            'id': self.team.id, 'name': 'Core', 'project_count': 1,
+        })
+
+        team = self.client.get(f'/api/teams/{self.team.id}/?expand=owner').json()['data']
+        self.assertIn('owner', team)
+        self.assertNotIn('members', team)
+
+    def test_retrieve_and_accounts_endpoints(self):
+        task_id = Task.objects.values_list('id', flat=True).first()
+
+        task = self.client.get(f'/api/tasks/{task_id}/?fields=id,status').json()['data']
+        me = self.client.get('/api/auth/me/?fields=id,username').json()['data']
+        users = self.client.get('/api/users/?fields=id,display_name').json()['data']['results']
+
+        self.assertEqual(set(task), {'id', 'status'})
+        self.assertEqual(me, {'id': self.owner.id, 'username': 'owner'})
+        self.assertEqual(set(users[0]), {'id', 'display_name'})
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get('/api/tasks/?fields=id,secret&expand=title')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()['errors']), {'fields', 'expand'})
+
+    def test_writes_return_full_representation(self):
+        response = self.client.post(
+            '/api/tasks/?fields=id', {'title': 'New', 'project': self.project.id}, format='json'
+        )
+
+        self.assertIn('description', response.json()['data'])
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class ValuesListTests(BoardsAPITestCase):
+
+    """.values() liste yolu (api/values.py) serializer çıktısıyla alan alan aynı olmalı."""
+
+    def setUp(self):
+        super().setUp()
+        self.member.first_name, self.member.email = 'Ayşe', 'ayse@example.com'
+        self.member.save()
+        today = timezone.localdate()
+        Task.objects.create(
+            title='Atanmış', description='Açıklama', project=self.project,
+            assignee=self.member, status=Task.STATUS_IN_PROGRESS, due_date=today,
+        )
+        Task.objects.create(title='Atanmamış', project=self.project, status=Task.STATUS_DONE)
+        Task.objects.create(
+            title='Gecikmiş', project=self.project, due_date=today - timedelta(days=3),
+        )
+        Project.objects.create(title='Pasif', team=self.team, is_active=False)
+
+    def fetch_pages(self, url, enabled):
+        pages = []
+        with self.settings(VALUES_LIST_ENABLED=enabled):
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                pages.append(response.json()['data'])
+                url = pages[-1]['next']
+        return pages
+
+    def assertSameAsSerializer(self, url):
+        expected = self.fetch_pages(url, enabled=False)
+        actual = self.fetch_pages(url, enabled=True)
+
+        self.assertEqual(len(actual), len(expected))
+        self.assertTrue(expected[0]['results'])
+        for actual_page, expected_page in zip(actual, expected):
+            self.assertEqual(actual_page['next'], expected_page['next'])
+            for actual_row, expected_row in zip(actual_page['results'], expected_page['results']):
+                self.assertEqual(list(actual_row), list(expected_row))
+                for name, value in expected_row.items():
+                    self.assertEqual(actual_row[name], value, f'{url}: {name}')
+
+    def test_task_list_matches_serializer(self):
+        self.assertSameAsSerializer('/api/tasks/?page_size=2')
+        self.assertSameAsSerializer('/api/tasks/?ordering=title&page_size=2')
+        self.assertSameAsSerializer('/api/tasks/?fields=id,status,due_date&expand=assignee_detail')
+
+    def test_project_and_team_lists_match_serializer(self):
+        self.assertSameAsSerializer('/api/projects/?page_size=1')
+        self.assertSameAsSerializer('/api/projects/?is_active=true&fields=id,task_counts')
+        self.assertSameAsSerializer('/api/teams/')
+        self.assertSameAsSerializer('/api/teams/?fields=id,name&expand=owner')
+
+    def test_list_uses_values_rows(self):
+        membership.get_memberships(self.owner)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/tasks/')
+
+        page_query = queries.captured_queries[-1]['sql']
+        self.assertIn('LEFT OUTER JOIN "auth_user"', page_query)
+        self.assertNotIn('search_vector', page_query)
+
+    def test_team_members_fall_back_to_serializer(self):
+        view = TeamViewSet()
+        view.request = Request(RequestFactory().get('/api/teams/'))
+        view.format_kwarg = None
+        view.action = 'list'
+
+        self.assertIsNone(view.get_values_serializer())
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class ConditionalGetTests(BoardsAPITestCase):
+
+    def test_list_returns_304_for_matching_etag(self):
+        self.create_tasks(3)
+        url = f'/api/tasks/?project={self.project.id}'
+        membership.get_memberships(self.owner)
+
+        etag = self.client.get(url)['ETag']
+
+        # sadece Max(updated_at) + Count sorgusu; serializer/renderer çalışmaz
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_list_etag_changes_on_update_and_delete(self):
+        first, second = self.create_tasks(2)
+        etag = self.client.get('/api/tasks/')['ETag']
+
+        self.client.patch(f'/api/tasks/{first.id}/', {'status': 'done'}, format='json')
+        updated = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(updated.status_code, 200)
+
+        second.delete()
+        deleted = self.client.get('/api/tasks/', HTTP_IF_NONE_MATCH=updated['ETag'])
+        self.assertEqual(deleted.status_code, 200)
+
+    def test_detail_supports_etag_and_last_modified(self):
+        task = self.create_tasks(1)[0]
+        response = self.client.get(f'/api/tasks/{task.id}/')
+
+        self.assertEqual(
+            self.client.get(f'/api/tasks/{task.id}/',
+                            HTTP_IF_NONE_MATCH=response['ETag']).status_code,
+            304,
+        )
+        self.assertEqual(
+            self.client.get(f'/api/tasks/{task.id}/',
+                            HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code,
+            304,
+        )
+
+    def test_member_change_updates_team_etag(self):
+        etag = self.client.get(f'/api/teams/{self.team.id}/')['ETag']
+
+        self.team.members.add(self.outsider)
+
+        response = self.client.get(f'/api/teams/{self.team.id}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+    @override_settings(RESPONSE_CACHE_ENABLED=False)
+    def test_nested_user_change_updates_etags(self):
+        task = self.create_tasks(1, assignee=self.member)[0]
+        team_url = f'/api/teams/{self.team.id}/'
+        urls = [team_url, '/api/teams/', f'/api/tasks/{task.id}/', '/api/tasks/']
+        etags = {url: self.client.get(url)['ETag'] for url in urls}
+
+        # Sadece last_login: yanıtlarda görünmez, ETag değişmez
+        self.member.last_login = timezone.now()
+        self.member.save(update_fields=['last_login'])
+        response = self.client.get(team_url, HTTP_IF_NONE_MATCH=etags[team_url])
+        self.assertEqual(response.status_code, 304)
+
+        self.member.first_name = 'Ayşe'
+        self.member.save()
+        for url, etag in etags.items():
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200, url)
+
+
+class ResponseCacheTests(BoardsAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        response_cache.counter.reset()
+        membership.get_memberships(self.owner)
+
+    def test_hit_runs_no_queries_and_returns_same_body(self):
+        self.create_tasks(3)
+        first = self.client.get('/api/tasks/')
+
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/tasks/')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(response_cache.counter.snapshot()['hits'], 1)
+
+    def test_hit_honours_conditional_headers(self):
+        task = self.create_tasks(1)[0]
+        url = f'/api/tasks/{task.id}/'
+        response = self.client.get(url)
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code,
+            304,
+        )
+
+    def test_task_write_invalidates_team_lists(self):
+        task = self.create_tasks(1)[0]
+        self.client.get('/api/tasks/')
+        self.client.get(f'/api/projects/{self.project.id}/')
+
+        self.client.patch(f'/api/tasks/{task.id}/', {'status': 'done'}, format='json')
+
+        body = self.client.get('/api/tasks/').json()
+        self.assertEqual(body['data']['results'][0]['status'], 'done')
+        self.assertEqual(response_cache.counter.snapshot()['hits'], 0)
+
+        Task.objects.get(pk=task.pk).delete()
+        self.assertEqual(self.client.get('/api/tasks/').json()['data']['results'], [])
+
+    def test_member_change_invalidates_team(self):
+        self.client.get(f'/api/teams/{self.team.id}/')
+
+        self.team.members.add(self.outsider)
+
+        members = self.client.get(f'/api/teams/{self.team.id}/').json()['data']['members']
+        self.assertIn(self.outsider.id, [member['id'] for member in members])
+
+    def test_user_change_invalidates_nested_user_data(self):
+        task = self.create_tasks(1, assignee=self.member)[0]
+        self.client.get(f'/api/teams/{self.team.id}/')
+        self.client.get(f'/api/tasks/{task.id}/')
+
+        self.member.email = 'member@example.com'
+        self.member.save()
+
+        members = self.client.get(f'/api/teams/{self.team.id}/').json()['data']['members']
+        self.assertIn('member@example.com', [member['email'] for member in members])
+        assignee = self.client.get(f'/api/tasks/{task.id}/').json()['data']['assignee_detail']
+        self.assertEqual(assignee['email'], 'member@example.com')
+        self.assertEqual(response_cache.counter.snapshot()['hits'], 0)
+
+    def test_key_includes_query_and_visible_teams(self):
+        self.create_tasks(2)
+        self.client.get('/api/tasks/?status=todo')
+        self.client.get('/api/tasks/?status=done')
+        self.assertEqual(response_cache.counter.snapshot()['hits'], 0)
+
+        # Sahibin sonuçları, hiçbir takımı görmeyen kullanıcıya dönmez
+        self.client.force_authenticate(self.outsider)
+        self.assertEqual(self.client.get('/api/tasks/?status=todo').json()['data']['results'], [])
+
+    @override_settings(RESPONSE_CACHE_MAX_ENTRY_BYTES=100)
+    def test_large_responses_are_not_stored(self):
+        self.create_tasks(5)
+        self.client.get('/api/tasks/')
+
+        with self.assertNumQueries(2):
+            self.client.get('/api/tasks/')
+
+
+@override_settings(RESPONSE_CACHE_ENABLED=False)
+class AsyncReadViewTests(BoardsAPITestCase):
+
+    # Async view'lar URL'lere ASYNC_READ_VIEWS ile bağlanır; burada doğrudan
+    # çağrılıp aynı istek senkron viewset'e (test client) verilerek karşılaştırılır
+    factory = AsyncRequestFactory()
+
+    def setUp(self):
+        super().setUp()
+        self.create_tasks(3, assignee=self.member)
+        self.create_tasks(2, status=Task.STATUS_DONE)
+
+    async def call(self, view, path, user=None, method='get', data=None, **kwargs):
+        headers = {}
+        if user is not None:
+            headers['authorization'] = f'Bearer {AccessToken.for_user(user)}'
+        request = getattr(self.factory, method)(
+            path, data, content_type='application/json', headers=headers
+        ) if data is not None else getattr(self.factory, method)(path, headers=headers)
+        response = await view(request, **kwargs)
+        # Cache hit'i render edilmiş HttpResponse döner
+        return response.render() if hasattr(response, 'render') else response
+
+    async def sync_get(self, path, user=None):
+        def get():
+            self.client.force_authenticate(user)
+            return self.client.get(path)
+        return await sync_to_async(get)()
+
+    def test_views_are_async(self):
+        self.assertTrue(iscoroutinefunction(AsyncTaskViewSet.as_view({'get': 'list'})))
+        self.assertFalse(iscoroutinefunction(TaskViewSet.as_view({'get': 'list'})))
+
+    async def test_list_matches_sync_view(self):
+        view = AsyncTaskViewSet.as_view({'get': 'list'})
+        path = f'/api/tasks/?project={self.project.id}&status=todo&page_size=2'
+
+        response = await self.call(view, path, self.owner)
+        expected = await self.sync_get(path, self.owner)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(response['ETag'], expected['ETag'])
+
+        # Cursor ile ikinci sayfa
+        path = json.loads(response.content)['data']['next']
+        response = await self.call(view, path, self.owner)
+        expected = await self.sync_get(path, self.owner)
+        self.assertEqual(response.content, expected.content)
+        self.assertEqual(len(json.loads(response.content)['data']['results']), 1)
+
+    async def test_team_and_project_views_match_sync_views(self):
+        for view, path, kwargs in (
+            (AsyncTeamViewSet.as_view({'get': 'list'}), '/api/teams/', {}),
+            (AsyncTeamViewSet.as_view({'get': 'retrieve'}),
+             f'/api/teams/{self.team.id}/', {'pk': self.team.id}),
+            (AsyncProjectViewSet.as_view({'get': 'list'}),
+             f'/api/projects/?team={self.team.id}', {}),
+            (AsyncProjectViewSet.as_view({'get': 'retrieve'}),
+             f'/api/projects/{self.project.id}/', {'pk': self.project.id}),
+        ):
+            with self.subTest(path=path):
+                response = await self.call(view, path, self.member, **kwargs)
+                expected = await self.sync_get(path, self.member)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, expected.content)
+
+    async def test_permissions_and_errors_match_sync_view(self):
+        task = await Task.objects.afirst()
+        view = AsyncTaskViewSet.as_view({'get': 'retrieve'})
+        path = f'/api/tasks/{task.id}/'
+
+        for user in (self.outsider, None):
+            with self.subTest(user=user):
+                response = await self.call(view, path, user, pk=task.id)
+                expected = await self.sync_get(path, user)
+                self.assertEqual(response.status_code, expected.status_code)
+                self.assertEqual(response.content, expected.content)
+                self.assertFalse(json.loads(response.content)['success'])
+
+    async def test_conditional_get(self):
+        task = await Task.objects.afirst()
+        view = AsyncTaskViewSet.as_view({'get': 'retrieve'})
+        etag = (await self.call(view, f'/api/tasks/{task.id}/', self.owner, pk=task.id))['ETag']
+
+        request = self.factory.get(f'/api/tasks/{task.id}/', headers={
+            'authorization': f'Bearer {AccessToken.for_user(self.owner)}',
+            'if-none-match': etag,
+        })
+        response = await view(request, pk=task.id)
+        self.assertEqual(response.status_code, 304)
+
+    async def test_writes_use_sync_path(self):
+        task = await Task.objects.afirst()
+        view = AsyncTaskViewSet.as_view({'patch': 'partial_update'})
+
+        response = await self.call(
+            view, f'/api/tasks/{task.id}/', self.owner,
+            method='patch', data={'status': 'in_progress'}, pk=task.id,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        await task.arefresh_from_db()
+        self.assertEqual(task.status, 'in_progress')
+
+    @override_settings(RESPONSE_CACHE_ENABLED=True)
+    async def test_shares_response_cache(self):
+        response_cache.counter.reset()
+        view = AsyncTaskViewSet.as_view({'get': 'list'})
+        first = await self.call(view, '/api/tasks/', self.owner)
+        second = await self.call(view, '/api/tasks/', self.owner)
+
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(response_cache.counter.snapshot()['hits'], 1)
+
+    async def test_me_and_user_list(self):
+        for view, path in (
+            (AsyncMeView.as_view(), '/api/auth/me/'),
+            (AsyncActiveUserViewSet.as_view({'get': 'list'}), '/api/users/'),
+        ):
+            with self.subTest(path=path):
+                response = await self.call(view, path, self.member)
+                expected = await self.sync_get(path, self.member)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, expected.content)
+
+
+class SyncTests(BoardsAPITestCase):
+
+    def sync(self, since=None, **params):
+        if since:
+            params['since'] = since
+        response = self.client.get('/api/sync/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def sync_all(self, since=None, **params):
+        pages = [self.sync(since, **params)]
+        while pages[-1]['has_more']:
+            pages.append(self.sync(pages[-1]['next'], **params))
+        return pages
+
+    def ids(self, pages, key):
+        return sorted(item['id'] for page in pages for item in page[key])
+
+    def test_queryset_delete_reaches_incremental_sync(self):
+        first, second, third = self.create_tasks(3)
+        other = Project.objects.create(title='Arşiv', team=self.team)
+        token = self.sync_all()[-1]['next']
+
+        Task.objects.filter(pk__in=[first.id, third.id]).delete()
+        Project.objects.filter(pk=other.id).delete()
+
+        deleted = [
+            (item['type'], item['id'])
+            for page in self.sync_all(token) for item in page['deleted']
+        ]
+        self.assertEqual(
+            sorted(deleted), [('project', other.id), ('task', first.id), ('task', third.id)]
+        )
+
+    def test_initial_sync_is_full_snapshot_in_pages(self):
+        tasks = self.create_tasks(5)
+
+        pages = self.sync_all(limit=2)
+
+        self.assertTrue(pages[0]['reset'])
+        self.assertFalse(pages[1]['reset'])
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(self.ids(pages, 'tasks'), sorted(task.id for task in tasks))
+        self.assertEqual(self.ids(pages, 'projects'), [self.project.id])
+        self.assertEqual(pages[0]['teams'], [self.team.id])
+
+    def test_incremental_sync_returns_changes_and_tombstones(self):
+        first, second, third = self.create_tasks(3)
+        token = self.sync_all()[-1]['next']
+
+        # Örtüşme penceresi dışına itilmiş eski satırlar tekrar gelmemeli
+        old = timezone.now() - timedelta(minutes=5)
+        Task.objects.update(updated_at=old)
+        Project.objects.update(updated_at=old)
+        token = self.sync_all()[-1]['next']
+
+        self.client.patch(f'/api/tasks/{first.id}/', {'status': 'done'}, format='json')
+        self.client.delete(f'/api/tasks/{second.id}/')
+
+        pages = self.sync_all(token)
+
+        self.assertFalse(pages[0]['reset'])
+        self.assertEqual(self.ids(pages, 'tasks'), [first.id])
+        self.assertEqual(
+            [(item['type'], item['id']) for page in pages for item in page['deleted']],
+            [('task', second.id)],
+        )
+
+    def test_newly_visible_team_is_sent_in_full(self):
+        other_team = Team.objects.create(name='Other', owner=self.outsider)
+        other_project = Project.objects.create(title='Hidden', team=other_team)
+        Task.objects.create(title='Hidden task', project=other_project)
+        Project.objects.update(updated_at=timezone.now() - timedelta(minutes=5))
+        token = self.sync_all()[-1]['next']
+
+        other_team.members.add(self.owner)
+        pages = self.sync_all(token)
+
+        self.assertEqual(pages[0]['teams'], sorted([self.team.id, other_team.id]))
+        self.assertEqual(self.ids(pages, 'projects'), [other_project.id])
+
+    def test_project_delete_leaves_single_tombstone(self):
+        self.create_tasks(3)
+        project_id = self.project.id
+        token = self.sync_all()[-1]['next']
+
+        self.client.delete(f'/api/projects/{project_id}/')
+        pages = self.sync_all(token)
+
+        self.assertEqual(
+            [(item['type'], item['id']) for page in pages for item in page['deleted']],
+            [('project', project_id)],
+        )
+
+    def test_invalid_token(self):
+        response = self.client.get('/api/sync/', {'since': 'not-a-token'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
+
+class RealtimeTests(BoardsAPITestCase):
+
+    async def connect(self, user):
+        communicator = WebsocketCommunicator(
+            application, f'/ws/boards/?token={AccessToken.for_user(user)}'
+        )
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        return communicator
+
+    def patch_task(self, task, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.patch(f'/api/tasks/{task.id}/', data, format='json')
+
+    async def test_rejects_missing_or_invalid_token(self):
+        for path in ('/ws/boards/', '/ws/boards/?token=bad'):
+            communicator = WebsocketCommunicator(application, path)
+            connected, code = await communicator.connect()
+            self.assertFalse(connected)
+            self.assertEqual(code, 4401)
+
+    async def test_outsider_cannot_subscribe(self):
+        communicator = await self.connect(self.outsider)
+
+        await communicator.send_json_to({'action': 'subscribe', 'team': self.team.id})
+        self.assertEqual((await communicator.receive_json_from())['type'], 'error')
+
+        await communicator.send_json_to({'action': 'subscribe', 'project': self.project.id})
+        self.assertEqual((await communicator.receive_json_from())['type'], 'error')
+        await communicator.disconnect()
+
+    async def test_project_subscriber_receives_task_updates(self):
+        task = (await database_sync_to_async(self.create_tasks)(1))[0]
+        communicator = await self.connect(self.member)
+
+        await communicator.send_json_to({'action': 'subscribe', 'project': self.project.id})
+        self.assertEqual(
+            await communicator.receive_json_from(),
+            {'type': 'subscribed', 'project': self.project.id},
+        )
+
+        response = await database_sync_to_async(self.patch_task)(task, {'status': 'done'})
+        self.assertEqual(response.status_code, 200)
+
+        event = await communicator.receive_json_from()
+        self.assertEqual(event['type'], 'task.updated')
+        self.assertEqual(event['project'], self.project.id)
+        self.assertEqual(event['team'], self.team.id)
+        self.assertEqual(event['data']['id'], task.id)
+        self.assertEqual(event['data']['status'], 'done')
+        await communicator.disconnect()
+
+    async def test_team_subscriber_receives_delete_and_unsubscribe_stops_events(self):
+        tasks = await database_sync_to_async(self.create_tasks)(2)
+        communicator = await self.connect(self.member)
+
+        await communicator.send_json_to({'action': 'subscribe', 'team': self.team.id})
+        await communicator.receive_json_from()
+
+        def delete_task():
+            with self.captureOnCommitCallbacks(execute=True):
+                return self.client.delete(f'/api/tasks/{tasks[0].id}/')
+
+        response = await database_sync_to_async(delete_task)()
+        self.assertEqual(response.status_code, 204)
+        event = await communicator.receive_json_from()
+        self.assertEqual(event['type'], 'task.deleted')
+        self.assertEqual(event['data'], {'id': tasks[0].id})
+
+        await communicator.send_json_to({'action': 'unsubscribe', 'team': self.team.id})
+        await communicator.receive_json_from()
+        await database_sync_to_async(self.patch_task)(tasks[1], {'status': 'done'})
+        self.assertTrue(await communicator.receive_nothing())
+        await communicator.disconnect()
+
+    async def test_moved_task_is_deleted_from_previous_groups(self):
+        task = (await database_sync_to_async(self.create_tasks)(1))[0]
+        other_team = await Team.objects.acreate(name='Ops', owner=self.owner)
+        target = await Project.objects.acreate(title='Ops board', team=other_team)
+        communicator = await self.connect(self.member)
+        for subscription in ({'team': self.team.id}, {'project': self.project.id}):
+            await communicator.send_json_to({'action': 'subscribe', **subscription})
+            await communicator.receive_json_from()
+
+        response = await database_sync_to_async(self.patch_task)(task, {'project': target.id})
+        self.assertEqual(response.status_code, 200)
+
+        # Aynı olay takım ve proje grubundan birer kez gelir
+        events = [await communicator.receive_json_from() for _ in range(2)]
+        self.assertEqual({event['type'] for event in events}, {'task.deleted'})
+        self.assertEqual({event['id'] for event in events}, {events[0]['id']})
+        self.assertEqual(events[0]['data'], {'id': task.id})
+        self.assertEqual((events[0]['team'], events[0]['project']), (self.team.id, self.project.id))
+        self.assertTrue(await communicator.receive_nothing())
+        await communicator.disconnect()
+
+    async def test_removed_member_stops_receiving_events(self):
+        task = (await database_sync_to_async(self.create_tasks)(1))[0]
+        communicator = await self.connect(self.member)
+        await communicator.send_json_to({'action': 'subscribe', 'team': self.team.id})
+        await communicator.receive_json_from()
+
+        await database_sync_to_async(self.team.members.remove)(self.member)
+        await database_sync_to_async(self.patch_task)(task, {'status': 'done'})
+
+        self.assertEqual(
+            await communicator.receive_json_from(),
+            {'type': 'unsubscribed', 'team': self.team.id},
+        )
+        await database_sync_to_async(self.patch_task)(task, {'status': 'todo'})
+        self.assertTrue(await communicator.receive_nothing())
+        await communicator.disconnect()
+
+    async def test_team_subscriber_receives_project_created(self):
+        communicator = await self.connect(self.owner)
+        await communicator.send_json_to({'action': 'subscribe', 'team': self.team.id})
+        await communicator.receive_json_from()
+
+        def create_project():
+            with self.captureOnCommitCallbacks(execute=True):
+                return self.client.post(
+                    '/api/projects/', {'title': 'Roadmap', 'team': self.team.id}, format='json'
+                )
+
+        response = await database_sync_to_async(create_project)()
+        self.assertEqual(response.status_code, 201)
+        event = await communicator.receive_json_from()
+        self.assertEqual(event['type'], 'project.created')
+        self.assertEqual(event['data']['title'], 'Roadmap')
+        await communicator.disconnect()
+
+
+class TaskHistoryTests(BoardsAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.task = Task.objects.create(title='Rapor', project=self.project)
+
+    def history(self, task, **params):
+        response = self.client.get(f'/api/tasks/{task.id}/history/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def test_update_records_changed_fields_from_loaded_instance(self):
+        self.client.force_authenticate(self.owner)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(f'/api/tasks/{self.task.id}/', {
+                'title': 'Rapor', 'status': 'in_progress', 'assignee': self.member.id,
+                'due_date': '2026-01-31',
+            }, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        events = {event['field']: event for event in self.history(self.task)['results']}
+        self.assertEqual(set(events), {'status', 'assignee', 'due_date'})
+        self.assertEqual(
+            (events['status']['old_value'], events['status']['new_value']), ('todo', 'in_progress')
+        )
+        self.assertEqual(
+            (events['assignee']['old_value'], events['assignee']['new_value']), (None, self.member.id)
+        )
+        self.assertEqual(events['due_date']['new_value'], '2026-01-31')
+        self.assertEqual(events['status']['user'], self.owner.id)
+        self.assertEqual(events['status']['username'], 'owner')
+
+    def test_create_and_bulk_are_recorded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            created = self.client.post(
+                '/api/tasks/', {'title': 'Yeni', 'project': self.project.id}, format='json'
+            ).json()['data']
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/tasks/bulk/', {'operations': [
+                {'op': 'update', 'id': self.task.id, 'data': {'status': 'done'}},
+                {'op': 'update', 'id': self.task.id, 'data': {'title': 'Rapor v2'}},
+            ]}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            [event['field'] for event in self.history(Task(id=created['id']))['results']],
+            [TaskEvent.FIELD_CREATED],
+        )
+        events = self.history(self.task)['results']
+        self.assertEqual(
+            sorted((event['field'], event['old_value'], event['new_value']) for event in events),
+            [('status', 'todo', 'done'), ('title', 'Rapor', 'Rapor v2')],
+        )
+
+    def test_history_is_paginated_newest_first_and_needs_membership(self):
+        now = timezone.now()
+        TaskEvent.objects.bulk_create(
+            TaskEvent(task_id=self.task.id, field='status', new_value=str(i),
+                      created_at=now + timedelta(seconds=i))
+            for i in range(5)
+        )
+        TaskEvent.objects.create(task_id=self.task.id + 1, field='status')
+
+        first = self.history(self.task, page_size=3)
+        self.assertEqual([event['new_value'] for event in first['results']], ['4', '3', '2'])
+        second = self.client.get(first['next']).json()['data']
+        self.assertEqual([event['new_value'] for event in second['results']], ['1', '0'])
+        self.assertIsNone(second['next'])
+
+        self.client.force_authenticate(self.outsider)
+        self.assertEqual(self.client.get(f'/api/tasks/{self.task.id}/history/').status_code, 404)
+
+    def test_writer_flushes_in_batches_and_on_stop(self):
+        batches = []
+
+        class MemoryWriter(history.EventWriter):
+            def write(self, events):
+                batches.append(len(events))
+
+        writer = MemoryWriter()
+        with self.settings(TASK_HISTORY_BATCH_SIZE=3, TASK_HISTORY_FLUSH_INTERVAL=60):
+            writer.add(history.created(self.task, self.owner) * 7)
+            # Kalan olaylar süre dolmadan stop ile yazılır
+            writer.stop()
+
+        self.assertEqual(sum(batches), 7)
+        self.assertTrue(all(size <= 3 for size in batches))
+
+
+class SearchTests(BoardsAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.report = Task.objects.create(title='Quarterly report', project=self.project)
+        self.mention = Task.objects.create(
+            title='Slides', description='Numbers for the quarterly report', project=self.project
+        )
+        Task.objects.create(title='Fix login', project=self.project)
+
+        other_team = Team.objects.create(name='Other', owner=self.outsider)
+        other_project = Project.objects.create(title='Report archive', team=other_team)
+        Task.objects.create(title='Secret report', project=other_project)
+
+    def result_ids(self, response, key='results'):
+        self.assertEqual(response.status_code, 200)
+        return [item['id'] for item in response.json()['data'][key]]
+
+    def test_task_list_search_matches_title_and_description(self):
+        ids = self.result_ids(self.client.get('/api/tasks/?search=report'))
+        self.assertCountEqual(ids, [self.report.id, self.mention.id])
+
+    def test_search_terms_are_prefixes_and_all_must_match(self):
+        ids = self.result_ids(self.client.get('/api/tasks/?search=quart numb'))
+        self.assertEqual(ids, [self.mention.id])
+
+    def test_search_vector_follows_queryset_updates(self):
+        Task.objects.filter(id=self.report.id).update(title='Budget')
+
+        ids = self.result_ids(self.client.get('/api/tasks/?search=budget'))
+        self.assertEqual(ids, [self.report.id])
+
+    def test_project_list_search(self):
+        Project.objects.create(title='Website', team=self.team)
+
+        ids = self.result_ids(self.client.get('/api/projects/?search=boa'))
+        self.assertEqual(ids, [self.project.id])
+
+    def test_search_endpoint_ranks_and_scopes_to_user_teams(self):
+        response = self.client.get('/api/search/?q=report')
+
+        self.assertEqual(self.result_ids(response, 'tasks'), [self.report.id, self.mention.id])
+        self.assertEqual(self.result_ids(response, 'projects'), [])
+
+    def test_search_endpoint_type_and_validation(self):
+        body = self.client.get('/api/search/?q=board&type=project').json()['data']
+        self.assertEqual(set(body), {'projects'})
+        self.assertEqual([item['id'] for item in body['projects']], [self.project.id])
+
+        self.assertEqual(self.client.get('/api/search/').status_code, 400)
+
+    def test_search_vector_is_not_loaded_by_default(self):
+        task = Task.objects.get(id=self.report.id)
+        self.assertIn('search_vector', task.get_deferred_fields())
+
+
+class TaskExportTests(BoardsAPITestCase):
+
+    def export(self, query):
+        response = self.client.get(f'/api/tasks/export/?{query}')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_ndjson_rows_match_filters(self):
+        done = self.create_tasks(3, status='done', assignee=self.member)
+        self.create_tasks(2)
+        other_team = Team.objects.create(name='Other', owner=self.outsider)
+        Task.objects.create(
+            title='Hidden', status='done',
+            project=Project.objects.create(title='X', team=other_team),
+        )
+
+        response, body = self.export('format=ndjson&status=done')
+
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertCountEqual([row['id'] for row in rows], [task.id for task in done])
+        self.assertEqual(rows[0]['assignee_username'], 'member')
+        self.assertEqual(rows[0]['project'], self.project.id)
+
+    @override_settings(TASK_EXPORT_CHUNK_SIZE=2)
+    def test_csv_streams_in_chunks(self):
+        self.create_tasks(5, due_date=date(2025, 1, 31))
+
+        response, body = self.export('format=csv')
+
+        self.assertIn('attachment; filename="tasks.csv"', response['Content-Disposition'])
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['due_date'], '2025-01-31')
+        self.assertEqual(rows[0]['assignee'], '')
+
+    def test_unknown_format_and_anonymous_get_json_errors(self):
+        response = self.client.get('/api/tasks/export/?format=xml')
+        self.assertEqual(response.status_code, 404)
+
+        self.client.force_authenticate(None)
+        response = self.client.get('/api/tasks/export/?format=csv')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertFalse(response.json()['success'])
+
+
+class SeedAndLoadBenchmarkTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        caches['responses'].clear()
+
+    def test_seed_distributions(self):
+        counts = seed_boards(users=60, teams=20, members_per_team=8, tasks=2000, batch_size=500)
+
+        self.assertEqual(Task.objects.filter(title__startswith='seed task').count(), 2000)
+        self.assertEqual(counts['projects'], 100)
+        statuses = set(Task.objects.values_list('status', flat=True))
+        self.assertEqual(statuses, {'todo', 'in_progress', 'done'})
+        self.assertTrue(Task.objects.filter(due_date__isnull=True).exists())
+        self.assertTrue(Task.objects.filter(assignee__isnull=True).exists())
+
+        sizes = [team.members.count() for team in Team.objects.all()]
+        self.assertGreater(max(sizes), min(sizes))
+        for team in Team.objects.all():
+            self.assertTrue(team.members.filter(id=team.owner_id).exists())
+
+    def test_benchmark_runs_routes_and_saves_baseline(self):
+        seed_boards(users=30, teams=6, members_per_team=5, tasks=300, batch_size=100)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        out = io.StringIO()
+
+        call_command(
+            'benchmark_api', threads=1, requests=40, warmup=2, actors=3,
+            baseline_dir=Path(tmp.name), save='base', stdout=out,
+        )
+        call_command(
+            'benchmark_api', threads=1, requests=40, warmup=2, actors=3,
+            baseline_dir=Path(tmp.name), compare='base', stdout=out,
+        )
+
+        result = json.loads((Path(tmp.name) / 'base.json').read_text())
+        self.assertEqual(set(result['results']), {'list', 'detail', 'status', 'members', 'total'})
+        self.assertEqual(result['results']['total']['requests'], 40)
+        self.assertEqual(result['results']['total']['errors'], 0)
+        self.assertGreater(result['results']['list']['queries_avg'], 0)
+        self.assertIn('Compared with baseline "base"', out.getvalue())
@@ -1,13 +1,24 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import ProjectViewSet, TaskViewSet, TeamViewSet
+from .views import (AsyncProjectViewSet, AsyncTaskViewSet, AsyncTeamViewSet,
+                    ProjectViewSet, SearchView, SyncView, TaskViewSet,
+                    TeamViewSet)
 
 router = DefaultRouter()
-router.register('teams', TeamViewSet, basename='team')
-router.register('projects', ProjectViewSet, basename='project')
-router.register('tasks', TaskViewSet, basename='task')
+# ASYNC_READ_VIEWS: list / retrieve async (ASGI sunucusunda, bkz. api/async_views.py)
+if settings.ASYNC_READ_VIEWS:
+    router.register('teams', AsyncTeamViewSet, basename='team')
+    router.register('projects', AsyncProjectViewSet, basename='project')
+    router.register('tasks', AsyncTaskViewSet, basename='task')
+else:
+    router.register('teams', TeamViewSet, basename='team')
+    router.register('projects', ProjectViewSet, basename='project')
+    router.register('tasks', TaskViewSet, basename='task')
 
 urlpatterns = [
     path('', include(router.urls)),
-]
\ No newline at end of file
+    path('sync/', SyncView.as_view(), name='sync'),
+    path('search/', SearchView.as_view(), name='search'),
+]
@@ -1,43 +1,145 @@
 import logging
 
-from django.db.models import Q
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Prefetch
 from django.shortcuts import render
+from django.utils import timezone
 from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from api.exceptions import BusinessLogicException
+from api.pagination import CursorPagination
+from api.renderers import CustomJSONRenderer
+from api.sparse import SparseQuerysetMixin, columns_for
+from api.timing import TimedViewMixin
+from api.values import ValuesListMixin
+from apps.accounts.serializers import UserSerializer
 
+from . import counters, history, membership, realtime, response_cache
+from .export import CSVRenderer, NDJSONRenderer, stream_response
 from .filters import ProjectFilter, TaskFilter
-from .models import Project, Task, Team
+from .mixins import AsyncReadMixin, CachedResponseMixin, ConditionalGetMixin
+from .models import Project, Task, TaskEvent, Team, task_team_ids
 from .permissions import IsTeamMember, IsTeamOwner, TaskEditPermission
-from .serializers import ProjectSerializer, TaskSerializer, TeamSerializer
+from .search import ranked
+from .serializers import (ProjectSerializer, SearchQuerySerializer,
+                          SyncQuerySerializer, TaskBulkOperationSerializer,
+                          TaskBulkSerializer, TaskEventSerializer,
+                          TaskSerializer, TeamSerializer)
+from .summaries import build_summary
+from .sync import decode_token, get_changes, initial_state
 
 logger = logging.getLogger(__name__)
-# Create your views here.
 
-class TeamViewSet(viewsets.ModelViewSet):
+# Object-level permission kontrolü yapan action'lar (get_object çağıranlar)
+DETAIL_ACTIONS = ('retrieve', 'update', 'partial_update', 'destroy')
+# ?fields= / ?expand= ile kolonları daraltılan action'lar (bkz. api/sparse.py)
+SPARSE_ACTIONS = ('list', 'retrieve')
+
+
+def user_columns(prefix=''):
+    # Nested UserSerializer'ın ihtiyaç duyduğu kolonlar
+    return [f'{prefix}{field}' for field in UserSerializer.Meta.fields]
+
+
+# Görev listelerinde TaskSerializer'ın kullandığı kolonlar
+TASK_LIST_COLUMNS = (
+    'id', 'title', 'description', 'project_id', 'status', 'due_date',
+    'created_at', 'updated_at', *user_columns('assignee__'),
+)
+
+# Serializer alanı -> okuduğu kolonlar (listede olmayan alan kendi kolonunu
+# okur). Sıralama alanları cursor konumu, updated_at ETag için hep okunur.
+TEAM_FIELD_COLUMNS = {
+    'owner': user_columns('owner__'),
+    'members': (),
+}
+PROJECT_FIELD_COLUMNS = {
+    'task_counts': ('todo_count', 'in_progress_count', 'done_count', 'overdue_count'),
+}
+TASK_FIELD_COLUMNS = {
+    'assignee_detail': user_columns('assignee__'),
+}
+
+
+def parse_pk(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TeamViewSet(TimedViewMixin, SparseQuerysetMixin, CachedResponseMixin,
+                  ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
 
     serializer_class = TeamSerializer
+    ordering = ('name', 'id')
+    ordering_fields = ('name', 'created_at', 'id')
 
     # Kullanıcı sadece üyesi veya owner olduğu takımları görebilir
     def get_queryset(self):
         user = self.request.user
-        return Team.objects.filter(Q(owner=user) | Q(members=user)).distinct()
+        queryset = Team.objects.visible_to(user)
+
+        # Özet için sadece yetki kontrolünde kullanılan alanlar yeterli
+        if self.action == 'summary':
+            return queryset.only('id', 'owner_id')
+
+        # owner ve members her takım için ayrı ayrı yüklenmesin; istenmediyse
+        # (?fields= / ?expand=) JOIN ve prefetch hiç yapılmaz
+        fields = self.sparse_fields()
+        queryset = queryset.only(*columns_for(
+            fields, TEAM_FIELD_COLUMNS, always=(*self.ordering_fields, 'updated_at')
+        ))
+        if 'owner' in fields:
+            queryset = queryset.select_related('owner')
+        if 'members' in fields:
+            queryset = queryset.prefetch_related(
+                Prefetch('members', queryset=User.objects.only(*user_columns()))
+            )
+        return queryset
     
     def get_permissions(self):
         if self.action in ['update', 'partial_update', 'destroy']:
             return [permissions.IsAuthenticated(), IsTeamOwner()]
         return [permissions.IsAuthenticated(), IsTeamMember()]
+
+    @action(detail=True, methods=['get'])
+    def summary(self, request, pk=None):
+        team = self.get_object()
+        tasks = Task.objects.filter(
+            project_id__in=Project.objects.filter(team_id=team.id).values('id')
+        )
+        return Response(build_summary(tasks))
     
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(TimedViewMixin, SparseQuerysetMixin, CachedResponseMixin,
+                     ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     serializer_class = ProjectSerializer
     filterset_class = ProjectFilter
+    ordering = ('-created_at', '-id')
+    ordering_fields = ('created_at', 'title', 'id')
+    # ?search= başlık/açıklamada tam metin (bkz. search.py)
+    search_vector = True
 
     # Kullanıcı sadece üyesi olduğu takımların projelerini görebilir
     def get_queryset(self):
-     user = self.request.user
-     return Project.objects.filter(
-        Q(team__owner=user) | Q(team__members=user)
-    ).distinct()
+        user = self.request.user
+        queryset = Project.objects.visible_to(user)
+
+        if self.action == 'summary':
+            return queryset.only('id', 'team_id')
+        if self.action in SPARSE_ACTIONS:
+            # team_id yetki kontrolü için
+            return queryset.only(*columns_for(
+                self.sparse_fields(),
+                PROJECT_FIELD_COLUMNS,
+                always=(*self.ordering_fields, 'team_id', 'updated_at'),
+            ))
+        return queryset
     
     # Sadece team owner proje oluşturup düzenleyebilsin
     def get_permissions(self):
@@ -50,48 +152,380 @@ class ProjectViewSet(viewsets.ModelViewSet):
         team = serializer.validated_data["team"]
         user = self.request.user
 
-        if team.projects.count() >= 10:
-            # 400 dönen business rule
-            raise BusinessLogicException(
-                detail="Bu takım için maksimum proje sayısına ulaşıldı."
+        # Sayaç kayıtla aynı transaction'da artar (signals.bump_project_team);
+        # eşzamanlı oluşturmalar takım satırının kilidinde sıralanır, limit
+        # aşıldıysa proje geri alınır. COUNT yerine tek kolon okunur.
+        with transaction.atomic():
+            project = serializer.save()
+            project_count = (
+                Team.objects.filter(pk=team.pk).values_list('project_count', flat=True).get()
             )
+            if project_count > 10:
+                # 400 dönen business rule
+                raise BusinessLogicException(
+                    detail="Bu takım için maksimum proje sayısına ulaşıldı."
+                )
 
-        project = serializer.save()
         logger.info(
             "User %s created project %s (id=%s) in team %s",
             user.username,
             project.title,
             project.id,
             team.name,)
+        realtime.publish_project(realtime.PROJECT_CREATED, project, serializer.data)
+
+    def perform_update(self, serializer):
+        # Takım değişirse iki takımın project_count'u kayıtla birlikte
+        with transaction.atomic():
+            project = serializer.save()
+        realtime.publish_project(realtime.PROJECT_UPDATED, project, serializer.data)
+
+    def perform_destroy(self, instance):
+        project_id, team_id = instance.id, instance.team_id
+        instance.delete()
+        realtime.publish_project_deleted(project_id, team_id)
 
-class TaskViewSet(viewsets.ModelViewSet):
+    @action(detail=True, methods=['get'])
+    def summary(self, request, pk=None):
+        project = self.get_object()
+        return Response(build_summary(Task.objects.filter(project_id=project.id)))
+
+class TaskViewSet(TimedViewMixin, SparseQuerysetMixin, CachedResponseMixin,
+                  ConditionalGetMixin, ValuesListMixin, viewsets.ModelViewSet):
     serializer_class = TaskSerializer
     filterset_class = TaskFilter
+    ordering = ('-created_at', '-id')
+    ordering_fields = ('created_at', 'title', 'status', 'id')
+    search_vector = True
 
     # Kullanıcı owner’ı veya üyesi olduğu takımların görevlerini görebilir
     def get_queryset(self):
         user = self.request.user
-        return Task.objects.filter(
-            Q(project__team__owner=user) | Q(project__team__members=user)
-        ).distinct()
+        queryset = Task.objects.visible_to(user)
+
+        if self.action in SPARSE_ACTIONS:
+            fields = self.sparse_fields()
+            columns = columns_for(
+                fields, TASK_FIELD_COLUMNS, always=(*self.ordering_fields, 'updated_at')
+            )
+            if 'assignee_detail' in fields:
+                queryset = queryset.select_related('assignee')
+            if self.action == 'retrieve':
+                # Permission sınıfları obj.project.team_id üzerinden kontrol yapıyor
+                queryset = queryset.select_related('project')
+                columns += ['project__id', 'project__team_id']
+            return queryset.only(*columns)
+
+        if self.action == 'task_history':
+            # Sadece permission kontrolü için (obj.project.team_id)
+            return queryset.select_related('project').only('id', 'project__id', 'project__team_id')
+
+        queryset = queryset.select_related('assignee')
+        if self.action in DETAIL_ACTIONS:
+            return queryset.select_related('project')
+
+        return queryset.only(*TASK_LIST_COLUMNS)
     
     def get_permissions(self):
         if self.action in ['create', 'update', 'partial_update', 'destroy']:
             return [permissions.IsAuthenticated(), TaskEditPermission(), IsTeamMember()]
         return [permissions.IsAuthenticated(), IsTeamMember()]
     
+    def handle_exception(self, exc):
+        response = super().handle_exception(exc)
+        if self.action == 'export':
+            # Export hataları CSV/NDJSON yerine standart JSON zarfında döner
+            self.request.accepted_renderer = CustomJSONRenderer()
+            self.request.accepted_media_type = CustomJSONRenderer.media_type
+        return response
+
+    def perform_create(self, serializer):
+        # Proje sayaçları (signals.bump_task_team) kayıtla aynı transaction'da
+        with transaction.atomic():
+            task = serializer.save()
+            history.record(history.created(task, self.request.user))
+        realtime.publish_task(realtime.TASK_CREATED, task, serializer.data)
     
     def perform_update(self, serializer):
 
-        before = self.get_object()
-        task = serializer.save()
+        # get_object() tekrar çağrılmasın; eski değerler yüklü instance'tan
+        old_status = serializer.instance.status
+        before = history.snapshot(serializer.instance)
         user = self.request.user
+        with transaction.atomic():
+            task = serializer.save()
+            # Commit sonrasında kuyruğa girer; yazım arka planda (history.py)
+            history.record(history.changes(task, before, user))
       
         logger.info(
             "User %s updated task %s (id=%s) - old_status=%s, new_status=%s",
             user.username,
             task.title,
             task.id,
-            before.status,
+            old_status,
             task.status,
-        )
\ No newline at end of file
+        )
+        realtime.publish_task(
+            realtime.TASK_UPDATED, task, serializer.data, before.get('project_id')
+        )
+
+    def perform_destroy(self, instance):
+        task_id, project_id = instance.id, instance.project_id
+        team_id = instance.project.team_id
+        instance.delete()
+        realtime.publish_task_deleted(task_id, project_id, team_id)
+
+    @action(detail=True, methods=['get'], url_path='history')
+    def task_history(self, request, pk=None):
+        """Görevin değişiklik geçmişi (history.py); en yeni önce, cursor sayfalı."""
+        task = self.get_object()
+        # View verilmez: ?ordering= (görev alanları) geçmişe uygulanmaz
+        paginator = CursorPagination()
+        page = paginator.paginate_queryset(TaskEvent.objects.filter(task_id=task.id), request)
+        return paginator.get_paginated_response(TaskEventSerializer(page, many=True).data)
+
+    @action(
+        detail=False,
+        methods=['get'],
+        renderer_classes=[NDJSONRenderer, CSVRenderer],
+    )
+    def export(self, request):
+        """
+        ?format=ndjson|csv ile görünen görevlerin tamamı (TaskFilter,
+        ?search= ve ?ordering= geçerli). Sayfalama yok; satırlar akış
+        halinde yazılır (bkz. export.py).
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        return stream_response(queryset, request.accepted_renderer.format)
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        Tek istekte birden fazla görev oluşturma / güncelleme.
+
+        {"operations": [
+            {"op": "create", "data": {"title": ..., "project": 1}},
+            {"op": "update", "id": 5, "data": {"status": "done"}}
+        ]}
+
+        Yetki kontrolü her proje için bir kez yapılır; geçerli işlemler tek
+        transaction içinde bulk_create / bulk_update ile yazılır. Geçersiz
+        işlemler yazılmaz, sonuç listesinde hatalarıyla döner.
+        """
+        payload = TaskBulkSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        operations = payload.validated_data['operations']
+        user = request.user
+
+        # Güncellenecek görevler, projeler ve assignee'ler tek seferde yüklenir
+        tasks = Task.objects.visible_to(user).select_related('project').order_by().in_bulk([
+            op['id'] for op in operations
+            if op['op'] == TaskBulkOperationSerializer.OP_UPDATE
+        ])
+        project_ids = {task.project_id for task in tasks.values()}
+        assignee_ids = {task.assignee_id for task in tasks.values()}
+        for op in operations:
+            project_ids.add(parse_pk(op['data'].get('project')))
+            assignee_ids.add(parse_pk(op['data'].get('assignee')))
+        project_ids.discard(None)
+        assignee_ids.discard(None)
+
+        projects = (
+            Project.objects.visible_to(user).order_by().in_bulk(project_ids)
+        )
+        context = self.get_serializer_context()
+        context['related_cache'] = {
+            'project': projects,
+            'assignee': User.objects.in_bulk(assignee_ids),
+        }
+
+        # Sahiplik kontrolü her proje için bir kez (rol membership cache'inden)
+        owner_of = {}
+
+        def is_owner(project):
+            if project.id not in owner_of:
+                role = membership.get_role(user, project.team_id)
+                owner_of[project.id] = role == membership.ROLE_OWNER
+            return owner_of[project.id]
+
+        results = []
+        to_create = []
+        to_update = {}
+        update_fields = set()
+        # Güncellenen görevlerin ilk değerleri (geçmiş için)
+        before = {}
+
+        for index, op in enumerate(operations):
+            result = {'index': index, 'op': op['op']}
+            results.append(result)
+            data = op['data']
+
+            if op['op'] == TaskBulkOperationSerializer.OP_CREATE:
+                serializer = TaskSerializer(data=data, context=context)
+                if not serializer.is_valid():
+                    result.update(success=False, errors=serializer.errors)
+                    continue
+                if not is_owner(serializer.validated_data['project']):
+                    result.update(success=False, errors={
+                        'detail': 'Bu projeye görev eklemek için yetkiniz yok.'
+                    })
+                    continue
+                task = Task(**serializer.validated_data)
+                to_create.append(task)
+
+            else:
+                task = tasks.get(op['id'])
+                if task is None:
+                    result.update(success=False, errors={
+                        'detail': 'İstediğiniz kaynak bulunamadı.'
+                    })
+                    continue
+
+                # TaskEditPermission ile aynı kural: assignee sadece status değiştirebilir
+                if not is_owner(task.project):
+                    if task.assignee_id != user.id:
+                        result.update(success=False, errors={
+                            'detail': 'Bu projeye görev eklemek veya düzenlemek için yetkiniz yok.'
+                        })
+                        continue
+                    if set(data) != {'status'}:
+                        result.update(success=False, errors={
+                            'detail': 'Göreve atanmış olsan bile sadece durum (status) alanını güncelleyebilirsin.'
+                        })
+                        continue
+
+                serializer = TaskSerializer(task, data=data, partial=True, context=context)
+                if not serializer.is_valid():
+                    result.update(success=False, errors=serializer.errors)
+                    continue
+                target = serializer.validated_data.get('project')
+                if target is not None and target.id != task.project_id and not is_owner(target):
+                    result.update(success=False, errors={
+                        'detail': 'Bu projeye görev eklemek için yetkiniz yok.'
+                    })
+                    continue
+
+                before.setdefault(task.id, history.snapshot(task))
+                for field, value in serializer.validated_data.items():
+                    setattr(task, field, value)
+                update_fields.update(serializer.validated_data)
+                to_update[task.id] = task
+
+            result.update(success=True, task=task)
+
+        # bulk_update auto_now alanlarını kendisi güncellemez
+        now = timezone.now()
+        for task in to_update.values():
+            task.updated_at = now
+
+        with transaction.atomic():
+            if to_create:
+                Task.objects.bulk_create(to_create)
+            if to_update and update_fields:
+                Task.objects.bulk_update(
+                    to_update.values(), fields=sorted(update_fields | {'updated_at'})
+                )
+            # bulk_create / bulk_update signal göndermez
+            response_cache.bump_teams(task_team_ids([*to_create, *to_update.values()]))
+            counters.tasks_saved(to_create, created=True)
+            counters.tasks_saved(to_update.values())
+            history.record([
+                *(event for task in to_create for event in history.created(task, user, now)),
+                *(
+                    event for task in to_update.values()
+                    for event in history.changes(task, before[task.id], user, now)
+                ),
+            ])
+
+        for result in results:
+            task = result.pop('task', None)
+            if task is not None:
+                result['data'] = TaskSerializer(task, context=context).data
+                created = result['op'] == TaskBulkOperationSerializer.OP_CREATE
+                realtime.publish_task(
+                    realtime.TASK_CREATED if created else realtime.TASK_UPDATED,
+                    task,
+                    result['data'],
+                    None if created else before[task.id].get('project_id'),
+                )
+
+        logger.info(
+            "User %s applied bulk task operations - created=%s, updated=%s, failed=%s",
+            user.username,
+            len(to_create),
+            len(to_update),
+            sum(not result['success'] for result in results),
+        )
+
+        return Response({
+            'message': 'Toplu işlem tamamlandı.',
+            'created': len(to_create),
+            'updated': len(to_update),
+            'failed': sum(not result['success'] for result in results),
+            'results': results,
+        })
+
+
+# ASGI'da (ASYNC_READ_VIEWS) kullanılan sürümler: list / retrieve async ORM
+# ile event loop'ta çalışır; diğer action'lar yukarıdaki gibi (bkz. urls.py)
+
+class AsyncTeamViewSet(AsyncReadMixin, TeamViewSet):
+    pass
+
+
+class AsyncProjectViewSet(AsyncReadMixin, ProjectViewSet):
+    pass
+
+
+class AsyncTaskViewSet(AsyncReadMixin, TaskViewSet):
+    pass
+
+
+class SyncView(TimedViewMixin, APIView):
+
+    # Kullanıcının takımlarındaki proje/görev değişiklikleri (bkz. sync.py)
+    def get(self, request):
+        params = SyncQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        since = params.validated_data.get('since')
+        state = decode_token(since) if since else initial_state()
+        limit = params.validated_data.get('limit', settings.SYNC_PAGE_SIZE)
+
+        return Response(get_changes(
+            request.user, state, limit, context={'request': request, 'view': self}
+        ))
+
+
+class SearchView(TimedViewMixin, APIView):
+
+    """
+    Kullanıcının takımlarındaki proje ve görevlerde alaka sıralı arama.
+
+    ?q=<metin>&type=project|task&limit=<n>
+    Her tür için en alakalı ilk `limit` sonuç döner (sayfalama yok).
+    """
+
+    def get(self, request):
+        params = SearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        text = params.validated_data['q']
+        kind = params.validated_data.get('type')
+        limit = params.validated_data.get('limit', settings.SEARCH_RESULTS)
+        context = {'request': request, 'view': self}
+        user = request.user
+
+        data = {}
+        if kind in (None, SearchQuerySerializer.TYPE_PROJECT):
+            projects = ranked(Project.objects.visible_to(user), text)[:limit]
+            data['projects'] = ProjectSerializer(projects, many=True, context=context).data
+        if kind in (None, SearchQuerySerializer.TYPE_TASK):
+            tasks = ranked(
+                Task.objects.visible_to(user)
+                .select_related('assignee')
+                .only(*TASK_LIST_COLUMNS),
+                text,
+            )[:limit]
+            data['tasks'] = TaskSerializer(tasks, many=True, context=context).data
+        return Response(data)
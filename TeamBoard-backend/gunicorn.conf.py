@@ -0,0 +1,7 @@
+# gunicorn -c gunicorn.conf.py
+#
+# Ayarlar api/serving.py içinde ortam değişkenlerinden hesaplanır
+# (SERVER_MODE, WEB_CONCURRENCY, GUNICORN_THREADS, GUNICORN_BIND, ...).
+from api.serving import gunicorn_options
+
+globals().update(gunicorn_options())
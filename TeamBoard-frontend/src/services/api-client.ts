@@ -1,4 +1,4 @@
-import type { TokenPair } from "@/types/api";
+import type { Paginated, TokenPair } from "@/types/api";
 
 const API_BASE = import.meta.env.VITE_API_BASE ?? "http://localhost:8000";
 const ACCESS_KEY = "teamboard_access";
@@ -93,6 +93,23 @@ export const apiRequest = async <T>(
   return resp as T;
 };
 
+// Cursor sayfalı liste endpoint'lerinde "next" linkini takip ederek tüm sayfaları toplar.
+export const apiRequestAll = async <T>(path: string): Promise<T[]> => {
+  const items: T[] = [];
+  let next: string | null = path;
+  while (next) {
+    const page: Paginated<T> = await apiRequest<Paginated<T>>(next);
+    items.push(...page.results);
+    next = page.next ? toRelativePath(page.next) : null;
+  }
+  return items;
+};
+
+const toRelativePath = (url: string) => {
+  const parsed = new URL(url, API_BASE);
+  return `${parsed.pathname}${parsed.search}`;
+};
+
 const extractErrorMessage = (raw: string) => {
   if (!raw) return "";
   try {
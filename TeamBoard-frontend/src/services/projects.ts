@@ -1,4 +1,4 @@
-import { apiRequest } from './api-client'
+import { apiRequest, apiRequestAll } from './api-client'
 import type { Project, ProjectRequest } from '@/types/api'
 
 export const fetchProjects = async (params?: { search?: string; ordering?: string }) => {
@@ -6,7 +6,7 @@ export const fetchProjects = async (params?: { search?: string; ordering?: strin
   if (params?.search) query.set('search', params.search)
   if (params?.ordering) query.set('ordering', params.ordering)
   const suffix = query.toString() ? `?${query.toString()}` : ''
-  return apiRequest<Project[]>(`/api/projects/${suffix}`)
+  return apiRequestAll<Project>(`/api/projects/${suffix}`)
 }
 
 export const fetchProject = async (id: number) => apiRequest<Project>(`/api/projects/${id}/`)
@@ -1,4 +1,4 @@
-import { apiRequest } from './api-client'
+import { apiRequest, apiRequestAll } from './api-client'
 import type { Task, TaskRequest } from '@/types/api'
 
 export const fetchTasks = async (params?: { search?: string; ordering?: string }) => {
@@ -6,7 +6,7 @@ export const fetchTasks = async (params?: { search?: string; ordering?: string }
   if (params?.search) query.set('search', params.search)
   if (params?.ordering) query.set('ordering', params.ordering)
   const suffix = query.toString() ? `?${query.toString()}` : ''
-  return apiRequest<Task[]>(`/api/tasks/${suffix}`)
+  return apiRequestAll<Task>(`/api/tasks/${suffix}`)
 }
 
 export const fetchTask = async (id: number) => apiRequest<Task>(`/api/tasks/${id}/`)
@@ -1,4 +1,4 @@
-import { apiRequest } from './api-client'
+import { apiRequest, apiRequestAll } from './api-client'
 import type { Team, TeamRequest } from '@/types/api'
 
 export const fetchTeams = async (params?: { search?: string; ordering?: string }) => {
@@ -6,7 +6,7 @@ export const fetchTeams = async (params?: { search?: string; ordering?: string }
   if (params?.search) query.set('search', params.search)
   if (params?.ordering) query.set('ordering', params.ordering)
   const suffix = query.toString() ? `?${query.toString()}` : ''
-  return apiRequest<Team[]>(`/api/teams/${suffix}`)
+  return apiRequestAll<Team>(`/api/teams/${suffix}`)
 }
 
 export const fetchTeam = async (id: number) => apiRequest<Team>(`/api/teams/${id}/`)
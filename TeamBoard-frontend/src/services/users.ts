@@ -1,4 +1,4 @@
-import { apiRequest } from "./api-client";
+import { apiRequest, apiRequestAll } from "./api-client";
 import type { UserList } from "@/types/api";
 
 export const fetchUsers = async (params?: { search?: string; ordering?: string }) => {
@@ -6,7 +6,7 @@ export const fetchUsers = async (params?: { search?: string; ordering?: string }
   if (params?.search) query.set("search", params.search);
   if (params?.ordering) query.set("ordering", params.ordering);
   const suffix = query.toString() ? `?${query.toString()}` : "";
-  return apiRequest<UserList[]>(`/api/users/${suffix}`);
+  return apiRequestAll<UserList>(`/api/users/${suffix}`);
 };
 
 export const fetchUser = async (id: number) =>
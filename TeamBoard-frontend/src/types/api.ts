@@ -1,3 +1,9 @@
+export type Paginated<T> = {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+};
+
 export type TokenPair = {
   access: string;
   refresh: string;
@@ -23,6 +29,7 @@ export type Team = {
   owner?: User;
   members?: User[];
   created_at?: string;
+  updated_at?: string;
 };
 
 export type TeamRequest = {
@@ -37,6 +44,7 @@ export type Project = {
   team: number;
   is_active?: boolean;
   created_at?: string;
+  updated_at?: string;
 };
 
 export type ProjectRequest = {
@@ -58,6 +66,7 @@ export type Task = {
   status: Status;
   due_date?: string | null;
   created_at?: string;
+  updated_at?: string;
 };
 
 export type TaskRequest = {